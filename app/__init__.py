@@ -6,6 +6,9 @@ the Flask application instance with all necessary extensions and blueprints.
 """
 
 import os
+import importlib
+import json
+from functools import lru_cache, partial
 from apiflask import APIFlask
 from flask import request
 from datetime import datetime, timezone
@@ -14,35 +17,68 @@ import logging
 from logging import getLogger, basicConfig
 from logging.config import dictConfig
 import sys
+import threading
+from contextlib import contextmanager
+import traceback
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file (once per process)
+if os.environ.get('_DOTENV_LOADED') != '1':
+    load_dotenv()
+    os.environ['_DOTENV_LOADED'] = '1'
 
 from config import get_config
 from .extensions import (
+    db,
+    migrate,
     init_extensions, 
     register_error_handlers, 
     register_cli_commands, 
     register_shell_context
 )
 from ._shared.auth import AuthMiddleware
+from ._shared.json_provider import OrjsonProvider, register_orjson_body_loader
 
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
 from flask_migrate import upgrade
+from sqlalchemy import text
+
+
+# Arbitrary key for the Postgres advisory lock that serializes startup migrations
+MIGRATION_LOCK_KEY = 727274
+
+# Shared startup migration status surfaced by the health check
+MIGRATION_STATUS = {'state': 'pending', 'error': None}
+
+
+# Root logger configuration applied once per process by _configure_logging
+_LOG_CONFIG = {
+    'version': 1,
+    'formatters': {'default': {
+        'format': '[%(asctime)s] %(levelname)s in %(module)s: %(message)s',
+    }},
+    'handlers': {'wsgi': {
+        'class': 'logging.StreamHandler',
+        'stream': 'ext://flask.logging.wsgi_errors_stream',
+        'formatter': 'default'
+    }},
+    'root': {
+        'level': 'INFO',
+        'handlers': ['wsgi']
+    }
+}
+_LOGGING_CONFIGURED = False
 
 
-def create_production_app():
-    """Create production app instance"""
-    return create_app('production')
+def _configure_logging():
+    """Apply _LOG_CONFIG the first time it is called"""
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
+    dictConfig(_LOG_CONFIG)
+    _LOGGING_CONFIGURED = True
 
 
-# Export commonly used functions and classes
-__all__ = [
-    'create_app',
-    'create_development_app', 
-    'create_testing_app',
-    'create_production_app'
-]
-
 def create_app(config_name=None):
     """
     Application factory function
@@ -60,24 +96,8 @@ def create_app(config_name=None):
 
     config_class = get_config(config_name)
 
-    # Configure root logger BEFORE app instantiation
-    # setting the logging level
-    
-    dictConfig({
-        'version': 1,
-        'formatters': {'default': {
-            'format': '[%(asctime)s] %(levelname)s in %(module)s: %(message)s',
-        }},
-        'handlers': {'wsgi': {
-            'class': 'logging.StreamHandler',
-            'stream': 'ext://flask.logging.wsgi_errors_stream',
-            'formatter': 'default'
-        }},
-        'root': {
-            'level': 'INFO',
-            'handlers': ['wsgi']
-        }
-    })
+    # Configure root logger BEFORE app instantiation (once per process)
+    _configure_logging()
     
     # Create APIFlask app
     app = APIFlask(
@@ -87,15 +107,17 @@ def create_app(config_name=None):
         version=config_class.INFO['version']
     )
 
+    # Serialize JSON with orjson
+    app.json = OrjsonProvider(app)
+    register_orjson_body_loader()
+
     # Load and apply configuration
     app.config.from_object(config_class)
     config_class.init_app(app)
 
     # Ensure instance folder exists
-    try:
-        os.makedirs(app.instance_path)
-    except OSError:
-        pass
+    if not os.path.isdir(app.instance_path):
+        os.makedirs(app.instance_path, exist_ok=True)
 
     # Initialize extensions
     init_extensions(app)
@@ -111,40 +133,113 @@ def create_app(config_name=None):
     # register_request_hooks(app)
     configure_api_docs(app)
 
-    # Run DB migrations at startup
-    with app.app_context():
-        upgrade()
-        
+    # Run DB migrations at startup: sync blocks, async runs in the background, skip does nothing
+    migration_mode = app.config.get('MIGRATION_MODE', 'skip')
+    if migration_mode == 'sync':
+        _run_migrations(app, blocking=True)
+    elif migration_mode == 'async':
+        threading.Thread(target=_run_migrations, args=(app,), daemon=True).start()
+    else:
+        MIGRATION_STATUS['state'] = 'skipped'
 
     return app
 
 
-def register_blueprints(app: APIFlask):
-    """Register application blueprints"""
-    
+def _run_migrations(app: APIFlask, blocking: bool = False):
+    """Run startup migrations and record the outcome in MIGRATION_STATUS"""
+    # Sync startup waits for the lock and fails on error; async skips and only reports
+    with app.app_context():
+        MIGRATION_STATUS['state'] = 'running'
+        MIGRATION_STATUS['error'] = None
+        try:
+            with _migration_lock(blocking) as acquired:
+                if not acquired:
+                    app.logger.info("Migrations are being run by another worker, skipping")
+                    MIGRATION_STATUS['state'] = 'skipped'
+                    return
+                _maybe_upgrade(app)
+            MIGRATION_STATUS['state'] = 'succeeded'
+        except Exception as e:
+            app.logger.exception("Startup migration failed: %s", e)
+            MIGRATION_STATUS['state'] = 'failed'
+            MIGRATION_STATUS['error'] = traceback.format_exc()
+            if blocking:
+                raise
+
+
+@contextmanager
+def _migration_lock(blocking: bool = False):
+    """Postgres advisory lock so only one worker migrates; a no-op on other databases"""
+    if db.engine.dialect.name != 'postgresql':
+        yield True
+        return
+
+    with db.engine.connect() as connection:
+        if blocking:
+            # Wait for any worker already migrating; _maybe_upgrade then finds the head
+            connection.execute(text('SELECT pg_advisory_lock(:key)'), {'key': MIGRATION_LOCK_KEY})
+            acquired = True
+        else:
+            acquired = connection.execute(
+                text('SELECT pg_try_advisory_lock(:key)'), {'key': MIGRATION_LOCK_KEY}
+            ).scalar()
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                connection.execute(text('SELECT pg_advisory_unlock(:key)'), {'key': MIGRATION_LOCK_KEY})
+
+
+def _maybe_upgrade(app: APIFlask):
+    """Run Alembic upgrade only if the database is behind the migration head"""
+    alembic_config = migrate.get_config()
+    head_revision = ScriptDirectory.from_config(alembic_config).get_current_head()
+
+    with db.engine.connect() as connection:
+        current_revision = MigrationContext.configure(connection).get_current_revision()
+
+    if current_revision == head_revision:
+        app.logger.info("Database already at migration head %s", head_revision)
+        return
+
+    app.logger.info("Upgrading database from %s to %s", current_revision, head_revision)
+    upgrade()
+
+
+# Blueprint registry: name -> (module path, blueprint attribute)
+BLUEPRINTS = {
     # User authentication routes
-    from .user.routes import user_bp
-    app.register_blueprint(user_bp)
-    
+    'user': ('.user.routes', 'user_bp'),
     # Camp management routes
-    from .camp.routes import camp_bp
-    app.register_blueprint(camp_bp)
-    
+    'camp': ('.camp.routes', 'camp_bp'),
     # Public registration routes
-    from .camp.public_routes import public_bp
-    app.register_blueprint(public_bp)
+    'public': ('.camp.public_routes', 'public_bp'),
+}
+
+
+def register_blueprints(app: APIFlask):
+    """Register application blueprints"""
+    
+    # Only import the route modules this worker serves (defaults to all of them)
+    enabled_blueprints = app.config.get('ENABLED_BLUEPRINTS') or BLUEPRINTS.keys()
+    for name in enabled_blueprints:
+        module_path, attribute = BLUEPRINTS[name]
+        module = importlib.import_module(module_path, __name__)
+        app.register_blueprint(getattr(module, attribute))
     
     # Health check route
     @app.route('/health')
     def health_check():
         """Basic health check endpoint"""
+        migration_state = MIGRATION_STATUS['state']
         return {
             'data': {
-                'status': 'healthy',
+                'status': 'unhealthy' if migration_state == 'failed' else 'healthy',
+                'migration': migration_state,
                 'timestamp': datetime.now(timezone.utc).isoformat(),
                 'version': app.config.get('VERSION', '1.0.0')
             }
-        }, 200
+        }, 503 if migration_state == 'failed' else 200
     
     # API info route
     @app.route('/')
@@ -170,16 +265,13 @@ def register_blueprints(app: APIFlask):
     @app.teardown_appcontext
     def close_db(exception):
         if exception:
-            app.logger.error(f"Request teardown with exception: {str(exception)}")
+            app.logger.error("Request teardown with exception: %s", exception)
 
-def configure_api_docs(app: APIFlask):
-    """Configure APIFlask documentation"""
-    
-    # Set API documentation info
-    app.config['INFO'] = {
-        'title': 'CampManager API',
-        'version': '1.0.0',
-        'description': '''
+# Static API documentation settings, built once at import and shared by every app instance
+_API_INFO = {
+    'title': 'CampManager API',
+    'version': '1.0.0',
+    'description': '''
 # CampManager API
 
 A comprehensive camp management system designed for church camps. 
@@ -238,102 +330,122 @@ API requests are rate limited to prevent abuse. Default limits:
 
 Rate limit headers are included in responses.
         ''',
-        'contact': {
-            'name': 'CampManager Support',
-            'email': 'support@campmanager.com'
-        },
-        'license': {
-            'name': 'MIT',
-            'url': 'https://opensource.org/licenses/MIT'
-        }
+    'contact': {
+        'name': 'CampManager Support',
+        'email': 'support@campmanager.com'
+    },
+    'license': {
+        'name': 'MIT',
+        'url': 'https://opensource.org/licenses/MIT'
     }
-    
-    # Set API tags for better organization
-    app.config['TAGS'] = [
-        {
-            'name': 'Authentication',
-            'description': 'User registration, login, and profile management'
-        },
-        {
-            'name': 'Camps',
-            'description': 'Camp creation, management, and statistics'
-        },
-        {
-            'name': 'Churches',
-            'description': 'Church management within camps'
-        },
-        {
-            'name': 'Categories',
-            'description': 'Registration category management with discount structures'
-        },
-        {
-            'name': 'Custom Fields',
-            'description': 'Dynamic form fields for registration customization'
-        },
-        {
-            'name': 'Registration Links',
-            'description': 'Category-specific registration links with access control'
-        },
-        {
-            'name': 'Registrations',
-            'description': 'Registration management, payment tracking, and check-in'
-        },
-        {
-            'name': 'Public',
-            'description': 'Public registration endpoints accessible via registration links'
-        }
-    ]
-    
-    # Set servers for different environments
-    app.config['SERVERS'] = [
-        {
-            'url': 'http://localhost:5000',
-            'description': 'Development server'
-        },
-        {
-            'url': 'https://api.campmanager.com',
-            'description': 'Production server'
-        }
-    ]
-    
-    # Security schemes for authentication
-    app.config['SECURITY_SCHEMES'] = {
-        'BearerAuth': {
-            'type': 'http',
-            'scheme': 'bearer',
-            'bearerFormat': 'JWT',
-            'description': 'JWT token obtained from the /auth/login endpoint'
-        }
+}
+
+# API tags for better organization
+_API_TAGS = [
+    {
+        'name': 'Authentication',
+        'description': 'User registration, login, and profile management'
+    },
+    {
+        'name': 'Camps',
+        'description': 'Camp creation, management, and statistics'
+    },
+    {
+        'name': 'Churches',
+        'description': 'Church management within camps'
+    },
+    {
+        'name': 'Categories',
+        'description': 'Registration category management with discount structures'
+    },
+    {
+        'name': 'Custom Fields',
+        'description': 'Dynamic form fields for registration customization'
+    },
+    {
+        'name': 'Registration Links',
+        'description': 'Category-specific registration links with access control'
+    },
+    {
+        'name': 'Registrations',
+        'description': 'Registration management, payment tracking, and check-in'
+    },
+    {
+        'name': 'Public',
+        'description': 'Public registration endpoints accessible via registration links'
     }
+]
+
+# Servers for different environments
+_API_SERVERS = [
+    {
+        'url': 'http://localhost:5000',
+        'description': 'Development server'
+    },
+    {
+        'url': 'https://api.campmanager.com',
+        'description': 'Production server'
+    }
+]
+
+# Security schemes for authentication
+_API_SECURITY_SCHEMES = {
+    'BearerAuth': {
+        'type': 'http',
+        'scheme': 'bearer',
+        'bearerFormat': 'JWT',
+        'description': 'JWT token obtained from the /auth/login endpoint'
+    }
+}
+
+_API_SPEC_PLUGINS = [
+    'apispec.ext.marshmallow'
+]
+
+
+def configure_api_docs(app: APIFlask):
+    """Configure APIFlask documentation"""
     
-    # Configure spec plugins
-    app.config['SPEC_PLUGINS'] = [
-        'apispec.ext.marshmallow'
-    ]
-    
-    # Local API documentation path
-    app.config['LOCAL_SPEC_PATH'] = 'openapi.json'
-    
-    # Swagger UI configuration
-    app.config['SWAGGER_UI_BUNDLE_JS'] = 'https://cdn.jsdelivr.net/npm/swagger-ui-dist@4.15.5/swagger-ui-bundle.js'
-    app.config['SWAGGER_UI_STANDALONE_PRESET_JS'] = 'https://cdn.jsdelivr.net/npm/swagger-ui-dist@4.15.5/swagger-ui-standalone-preset.js'
-    app.config['SWAGGER_UI_CSS'] = 'https://cdn.jsdelivr.net/npm/swagger-ui-dist@4.15.5/swagger-ui.css'
+    app.config.update(
+        INFO=_API_INFO,
+        TAGS=_API_TAGS,
+        SERVERS=_API_SERVERS,
+        SECURITY_SCHEMES=_API_SECURITY_SCHEMES,
+        SPEC_PLUGINS=_API_SPEC_PLUGINS,
+        # Local API documentation path
+        LOCAL_SPEC_PATH='openapi.json',
+        # Swagger UI configuration
+        SWAGGER_UI_BUNDLE_JS='https://cdn.jsdelivr.net/npm/swagger-ui-dist@4.15.5/swagger-ui-bundle.js',
+        SWAGGER_UI_STANDALONE_PRESET_JS='https://cdn.jsdelivr.net/npm/swagger-ui-dist@4.15.5/swagger-ui-standalone-preset.js',
+        SWAGGER_UI_CSS='https://cdn.jsdelivr.net/npm/swagger-ui-dist@4.15.5/swagger-ui.css',
+        # Redoc configuration
+        REDOC_STANDALONE_JS='https://cdn.jsdelivr.net/npm/redoc@2.0.0/bundles/redoc.standalone.js',
+    )
     
-    # Redoc configuration
-    app.config['REDOC_STANDALONE_JS'] = 'https://cdn.jsdelivr.net/npm/redoc@2.0.0/bundles/redoc.standalone.js'
+    # Serve the spec generated at build time (`flask spec --output openapi.json`)
+    # instead of walking every schema on the first docs request
+    spec_path = app.config['LOCAL_SPEC_PATH']
+    if app.config.get('USE_PREBUILT_SPEC') and os.path.isfile(spec_path):
+        app._spec = _load_prebuilt_spec(os.path.abspath(spec_path))
 
 
-# Create application instance for imports
-def create_development_app():
-    """Create development app instance"""
-    return create_app('development')
+@lru_cache(maxsize=None)
+def _load_prebuilt_spec(spec_path: str) -> dict:
+    """Load a prebuilt OpenAPI spec from disk (cached per process)"""
+    with open(spec_path) as spec_file:
+        return json.load(spec_file)
 
 
-def create_testing_app():
-    """Create testing app instance"""
-    return create_app('testing')
+# Create application instance for imports
+create_development_app = partial(create_app, 'development')
+create_testing_app = partial(create_app, 'testing')
+create_production_app = partial(create_app, 'production')
 
 
-def create_production_app():
-    """Create production app instance"""
-    return create_app('production')
+# Export commonly used functions and classes
+__all__ = [
+    'create_app',
+    'create_development_app', 
+    'create_testing_app',
+    'create_production_app'
+]
@@ -2,6 +2,15 @@ from flask import jsonify
 from werkzeug.http import HTTP_STATUS_CODES
 
 
+# Error payload prefixes for every known error status, built once at import
+_ERROR_PREFIX = {
+    status_code: {"error": reason}
+    for status_code, reason in HTTP_STATUS_CODES.items()
+    if status_code > 299
+}
+_UNKNOWN_ERROR_PREFIX = {"error": "Unknown error"}
+
+
 def success_response(status_code=200, data=None, message="success", pagination=None):
     return response_builder(
         status_code=status_code, message=message, data=data, pagination=pagination
@@ -10,7 +19,7 @@ def success_response(status_code=200, data=None, message="success", pagination=N
 
 def response_builder(status_code, message=None, data=None, pagination=None):
     if status_code > 299:
-        payload = {"error": HTTP_STATUS_CODES.get(status_code, "Unknown error")}
+        payload = dict(_ERROR_PREFIX.get(status_code, _UNKNOWN_ERROR_PREFIX))
     else:
         payload = {}
 
@@ -59,23 +68,46 @@ that provide consistent error handling and response formatting.
 from typing import Dict, Any, Optional
 
 
+def _merge_detail(details: Optional[Dict[str, Any]], key: str, value: Any) -> Optional[Dict[str, Any]]:
+    """Add key=value to details when value is set, creating the dict if needed"""
+    if value:
+        if not details:
+            details = {}
+        details[key] = value
+    return details
+
+
 class APIError(Exception):
     """Base API error class"""
     
-    def __init__(self, message: str, code: str = None, details: Dict[str, Any] = None, status_code: int = 400):
-        super().__init__(message)
+    code: Optional[str] = None
+    status_code: int = 400
+    
+    def __init__(self, message: str, code: str = None, details: Dict[str, Any] = None, status_code: int = None):
+        # Skip storing message in BaseException.args; __str__ reads self.message
+        Exception.__init__(self)
         self.message = message
-        self.code = code or self.__class__.__name__.upper()
+        self.code = code or self.code or self.__class__.__name__.upper()
         self.details = details
-        self.status_code = status_code
+        if status_code is not None:
+            self.status_code = status_code
+    
+    def __str__(self) -> str:
+        return str(self.message)
     
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.message!r})"
+
+    def __reduce__(self):
+        # args is empty, so rebuild from the instance dict rather than calling __init__
+        return (self.__class__.__new__, (self.__class__,), self.__dict__)
+
     def to_dict(self) -> Dict[str, Any]:
-        """Convert error to dictionary format"""
-        return {
-            'code': self.code,
-            'message': self.message,
-            'details': self.details
-        }
+        """Convert error to dictionary format (details omitted when empty)"""
+        error = {'code': self.code, 'message': self.message}
+        if self.details:
+            error['details'] = self.details
+        return error
     
     def to_response(self) -> tuple:
         """Convert error to API response format"""
@@ -87,156 +119,101 @@ class APIError(Exception):
 class ValidationError(APIError):
     """Raised when input validation fails"""
     
+    code = 'VALIDATION_ERROR'
+    status_code = 400
+    
     def __init__(self, message: str = "Validation failed", field: str = None, details: Dict[str, Any] = None):
-        if field and not details:
-            details = {'field': field}
-        elif field and details:
-            details['field'] = field
-        
-        super().__init__(
-            message=message,
-            code='VALIDATION_ERROR',
-            details=details,
-            status_code=400
-        )
+        APIError.__init__(self, message, details=_merge_detail(details, 'field', field))
 
 
 class AuthenticationError(APIError):
     """Raised when authentication fails"""
     
+    code = 'AUTHENTICATION_ERROR'
+    status_code = 401
+    
     def __init__(self, message: str = "Authentication failed", details: Dict[str, Any] = None):
-        super().__init__(
-            message=message,
-            code='AUTHENTICATION_ERROR',
-            details=details,
-            status_code=401
-        )
+        APIError.__init__(self, message, details=details)
 
 
 class AuthorizationError(APIError):
     """Raised when authorization fails"""
     
+    code = 'AUTHORIZATION_ERROR'
+    status_code = 403
+    
     def __init__(self, message: str = "Access denied", details: Dict[str, Any] = None):
-        super().__init__(
-            message=message,
-            code='AUTHORIZATION_ERROR',
-            details=details,
-            status_code=403
-        )
+        APIError.__init__(self, message, details=details)
 
 
 class NotFoundError(APIError):
     """Raised when a resource is not found"""
     
+    code = 'NOT_FOUND'
+    status_code = 404
+    
     def __init__(self, message: str = "Resource not found", resource: str = None, details: Dict[str, Any] = None):
-        if resource and not details:
-            details = {'resource': resource}
-        elif resource and details:
-            details['resource'] = resource
-        
-        super().__init__(
-            message=message,
-            code='NOT_FOUND',
-            details=details,
-            status_code=404
-        )
+        APIError.__init__(self, message, details=_merge_detail(details, 'resource', resource))
 
 
 class ConflictError(APIError):
     """Raised when there's a resource conflict"""
     
+    code = 'CONFLICT'
+    status_code = 409
+    
     def __init__(self, message: str = "Resource conflict", details: Dict[str, Any] = None):
-        super().__init__(
-            message=message,
-            code='CONFLICT',
-            details=details,
-            status_code=409
-        )
+        APIError.__init__(self, message, details=details)
 
 
 class BusinessRuleError(APIError):
     """Raised when business rules are violated"""
     
+    code = 'BUSINESS_RULE_ERROR'
+    status_code = 422
+    
     def __init__(self, message: str, rule: str = None, details: Dict[str, Any] = None):
-        if rule and not details:
-            details = {'rule': rule}
-        elif rule and details:
-            details['rule'] = rule
-        
-        super().__init__(
-            message=message,
-            code='BUSINESS_RULE_ERROR',
-            details=details,
-            status_code=422
-        )
+        APIError.__init__(self, message, details=_merge_detail(details, 'rule', rule))
 
 
 class RateLimitError(APIError):
     """Raised when rate limits are exceeded"""
     
+    code = 'RATE_LIMIT_EXCEEDED'
+    status_code = 429
+    
     def __init__(self, message: str = "Rate limit exceeded", retry_after: int = None, details: Dict[str, Any] = None):
-        if retry_after and not details:
-            details = {'retry_after': retry_after}
-        elif retry_after and details:
-            details['retry_after'] = retry_after
-        
-        super().__init__(
-            message=message,
-            code='RATE_LIMIT_EXCEEDED',
-            details=details,
-            status_code=429
-        )
+        APIError.__init__(self, message, details=_merge_detail(details, 'retry_after', retry_after))
 
 
 class ExternalServiceError(APIError):
     """Raised when external service calls fail"""
     
+    code = 'EXTERNAL_SERVICE_ERROR'
+    status_code = 502
+    
     def __init__(self, message: str = "External service error", service: str = None, details: Dict[str, Any] = None):
-        if service and not details:
-            details = {'service': service}
-        elif service and details:
-            details['service'] = service
-        
-        super().__init__(
-            message=message,
-            code='EXTERNAL_SERVICE_ERROR',
-            details=details,
-            status_code=502
-        )
+        APIError.__init__(self, message, details=_merge_detail(details, 'service', service))
 
 
 class DatabaseError(APIError):
     """Raised when database operations fail"""
     
+    code = 'DATABASE_ERROR'
+    status_code = 500
+    
     def __init__(self, message: str = "Database operation failed", operation: str = None, details: Dict[str, Any] = None):
-        if operation and not details:
-            details = {'operation': operation}
-        elif operation and details:
-            details['operation'] = operation
-        
-        super().__init__(
-            message=message,
-            code='DATABASE_ERROR',
-            details=details,
-            status_code=500
-        )
+        APIError.__init__(self, message, details=_merge_detail(details, 'operation', operation))
 
 
 class ConfigurationError(APIError):
     """Raised when there are configuration issues"""
     
+    code = 'CONFIGURATION_ERROR'
+    status_code = 500
+    
     def __init__(self, message: str = "Configuration error", config_key: str = None, details: Dict[str, Any] = None):
-        if config_key and not details:
-            details = {'config_key': config_key}
-        elif config_key and details:
-            details['config_key'] = config_key
-        
-        super().__init__(
-            message=message,
-            code='CONFIGURATION_ERROR',
-            details=details,
-            status_code=500
-        )
+        APIError.__init__(self, message, details=_merge_detail(details, 'config_key', config_key))
 
 
 # Camp-specific errors
@@ -249,47 +226,34 @@ class CampNotFoundError(NotFoundError):
     """Raised when a camp is not found"""
     
     def __init__(self, camp_id: str = None):
-        message = f"Camp not found"
+        message = "Camp not found"
         if camp_id:
             message += f": {camp_id}"
         
-        super().__init__(
-            message=message,
-            resource='camp',
-            details={'camp_id': camp_id} if camp_id else None
-        )
+        details = {'camp_id': camp_id} if camp_id else None
+        APIError.__init__(self, message, details=_merge_detail(details, 'resource', 'camp'))
 
 
 class CampCapacityError(BusinessRuleError):
     """Raised when camp capacity is exceeded"""
     
     def __init__(self, current_count: int = None, capacity: int = None):
-        message = "Camp is at full capacity"
         details = {}
-        
         if current_count is not None:
             details['current_registrations'] = current_count
         if capacity is not None:
             details['capacity'] = capacity
         
-        super().__init__(
-            message=message,
-            rule='capacity_limit',
-            details=details if details else None
-        )
+        APIError.__init__(self, "Camp is at full capacity", details=_merge_detail(details, 'rule', 'capacity_limit'))
 
 
 class RegistrationDeadlineError(BusinessRuleError):
     """Raised when registration deadline has passed"""
     
     def __init__(self, deadline: str = None):
-        message = "Registration deadline has passed"
         details = {'deadline': deadline} if deadline else None
-        
-        super().__init__(
-            message=message,
-            rule='registration_deadline',
-            details=details
+        APIError.__init__(
+            self, "Registration deadline has passed", details=_merge_detail(details, 'rule', 'registration_deadline')
         )
 
 
@@ -303,13 +267,9 @@ class InvalidLinkTokenError(NotFoundError):
     """Raised when registration link token is invalid"""
     
     def __init__(self, token: str = None):
-        message = "Invalid registration link"
         details = {'token': token} if token else None
-        
-        super().__init__(
-            message=message,
-            resource='registration_link',
-            details=details
+        APIError.__init__(
+            self, "Invalid registration link", details=_merge_detail(details, 'resource', 'registration_link')
         )
 
 
@@ -317,13 +277,9 @@ class LinkExpiredError(BusinessRuleError):
     """Raised when registration link has expired"""
     
     def __init__(self, expired_at: str = None):
-        message = "Registration link has expired"
         details = {'expired_at': expired_at} if expired_at else None
-        
-        super().__init__(
-            message=message,
-            rule='link_expiration',
-            details=details
+        APIError.__init__(
+            self, "Registration link has expired", details=_merge_detail(details, 'rule', 'link_expiration')
         )
 
 
@@ -331,18 +287,14 @@ class LinkUsageLimitError(BusinessRuleError):
     """Raised when registration link usage limit is reached"""
     
     def __init__(self, usage_count: int = None, usage_limit: int = None):
-        message = "Registration link usage limit reached"
         details = {}
-        
         if usage_count is not None:
             details['usage_count'] = usage_count
         if usage_limit is not None:
             details['usage_limit'] = usage_limit
         
-        super().__init__(
-            message=message,
-            rule='usage_limit',
-            details=details if details else None
+        APIError.__init__(
+            self, "Registration link usage limit reached", details=_merge_detail(details, 'rule', 'usage_limit')
         )
 
 
@@ -356,38 +308,27 @@ class UserNotFoundError(NotFoundError):
     """Raised when a user is not found"""
     
     def __init__(self, user_id: str = None, email: str = None):
-        message = "User not found"
         details = {}
-        
         if user_id:
             details['user_id'] = user_id
         if email:
             details['email'] = email
         
-        super().__init__(
-            message=message,
-            resource='user',
-            details=details if details else None
-        )
+        APIError.__init__(self, "User not found", details=_merge_detail(details, 'resource', 'user'))
 
 
 class EmailAlreadyExistsError(ConflictError):
     """Raised when trying to register with an existing email"""
     
     def __init__(self, email: str):
-        super().__init__(
-            message=f"User with email {email} already exists",
-            details={'email': email}
-        )
+        APIError.__init__(self, f"User with email {email} already exists", details={'email': email})
 
 
 class InvalidCredentialsError(AuthenticationError):
     """Raised when login credentials are invalid"""
     
     def __init__(self):
-        super().__init__(
-            message="Invalid email or password"
-        )
+        APIError.__init__(self, "Invalid email or password")
 
 
 # Payment specific errors
@@ -400,18 +341,14 @@ class PaymentProcessingError(ExternalServiceError):
     """Raised when payment processing fails"""
     
     def __init__(self, transaction_id: str = None, provider: str = None):
-        message = "Payment processing failed"
         details = {}
-        
         if transaction_id:
             details['transaction_id'] = transaction_id
         if provider:
             details['provider'] = provider
         
-        super().__init__(
-            message=message,
-            service='payment_processor',
-            details=details if details else None
+        APIError.__init__(
+            self, "Payment processing failed", details=_merge_detail(details, 'service', 'payment_processor')
         )
 
 
@@ -423,10 +360,7 @@ def handle_api_error(error: APIError) -> tuple:
 
 def create_error_response(code: str, message: str, details: Dict[str, Any] = None, status_code: int = 400) -> tuple:
     """Create a standardized error response"""
-    return {
-        'data': {
-            'code': code,
-            'message': message,
-            'details': details
-        }
-    }, status_code
\ No newline at end of file
+    error = {'code': code, 'message': message}
+    if details:
+        error['details'] = details
+    return {'data': error}, status_code
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""
+Shared helpers for the per-process caches
+
+Each cache lives in app.extensions under its own key and is built on first
+use from <PREFIX>_TTL and <PREFIX>_MAXSIZE config values, so tests and apps
+with different settings never share one. Ids are normalized to the canonical
+UUID string so ids from URLs and from the database share an entry.
+"""
+
+import uuid
+from functools import lru_cache
+from typing import Optional
+
+from cachetools import TTLCache
+from flask import current_app
+
+
+def app_ttl_cache(key: str, prefix: str, ttl: int, maxsize: int) -> Optional[TTLCache]:
+    """Return the app's cache stored under key, creating it on first use (None when disabled)"""
+    extensions = current_app.extensions
+    if key not in extensions:
+        ttl = current_app.config.get(f'{prefix}_TTL', ttl)
+        maxsize = current_app.config.get(f'{prefix}_MAXSIZE', maxsize)
+        extensions[key] = TTLCache(maxsize, ttl) if ttl > 0 else None
+    return extensions[key]
+
+
+@lru_cache(maxsize=4096)
+def canonical_id(value) -> Optional[str]:
+    """Canonical UUID string for value, or None if it isn't a UUID (cached, ids repeat across requests)"""
+    try:
+        return str(uuid.UUID(str(value)))
+    except ValueError:
+        return None
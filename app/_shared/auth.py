@@ -1,13 +1,56 @@
 from functools import wraps
 from typing import Callable, Optional
-import uuid
 
 from flask import current_app, g, request
-from flask_jwt_extended import jwt_required, get_jwt_identity, verify_jwt_in_request
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
 
+from app.extensions import db
 from app.user.models import User
-from .api_errors import AuthenticationError, AuthorizationError, ValidationError
-import traceback
+from .api_errors import AuthenticationError, AuthorizationError
+from .app_cache import canonical_id
+from .auth_cache import get_cached_user, get_verified_token, remember_verified_token, token_digest
+from .json_provider import json_response
+
+
+def _bearer_token() -> Optional[str]:
+    """Get the raw bearer token from the Authorization header"""
+    auth_header = request.headers.get('Authorization', '')
+    if auth_header.startswith('Bearer '):
+        return auth_header[7:]
+    return None
+
+
+def _cached_verify(optional: bool = False) -> None:
+    """
+    verify_jwt_in_request with a cache of recently verified bearer tokens
+
+    On a hit the cached header and claims are pushed into flask_jwt_extended's
+    request context, so get_jwt_identity() works without re-checking the signature.
+    """
+    token = _bearer_token()
+    if token is None:
+        verify_jwt_in_request(optional=optional)
+        return
+    
+    digest = token_digest(token)
+    cached = get_verified_token(digest)
+    if cached is not None:
+        g._jwt_extended_jwt_header, g._jwt_extended_jwt = cached
+        g._jwt_extended_jwt_user = {'loaded_user': None}
+        g._jwt_extended_jwt_location = 'headers'
+        return
+    
+    verified = verify_jwt_in_request(optional=optional)
+    if verified is not None and g._jwt_extended_jwt_location == 'headers':
+        remember_verified_token(digest, *verified)
+
+
+def _set_current_user(user: User) -> None:
+    """Store user in flask.g along with copies of the fields decorators read (ids are already strings)"""
+    g.current_user = user
+    g.current_user_id = user.id
+    g.current_user_role = user.role
+    g.current_user_email = user.email
 
 
 def token_required(f: Callable) -> Callable:
@@ -16,27 +59,27 @@ def token_required(f: Callable) -> Callable:
     Sets current_user in flask.g for use in views
     """
     @wraps(f)
-    @jwt_required()
     def decorated_function(*args, **kwargs):
+        _cached_verify()
         try:
             # Get user ID from JWT token
             current_user_id = get_jwt_identity()
             
-            # Fetch user from database
-            user = User.query.filter_by(id=current_user_id).first()
+            # Fetch user (served from the per-process cache when warm)
+            user = get_cached_user(current_user_id)
             if not user:
-                current_app.logger.warning(f"Token contains invalid user ID: {current_user_id}")
+                current_app.logger.warning("Token contains invalid user ID: %s", current_user_id)
                 raise AuthenticationError("Invalid user token")
             
             # Store user in flask.g for access in views
-            g.current_user = user
-            g.current_user_id = str(user.id)
+            _set_current_user(user)
             
             return f(*args, **kwargs)
             
         except Exception as e:
-            current_app.logger.error(f"Token validation error: {str(e)}")
-            current_app.logger.error(traceback.format_exc())
+            current_app.logger.error("Token validation error: %s", e)
+            # exc_info is only formatted when DEBUG logging is enabled
+            current_app.logger.debug("Token validation trace", exc_info=True)
             return {
                 'data': {
                     'code': 'AUTHENTICATION_ERROR',
@@ -60,29 +103,31 @@ def role_required(*required_roles: str) -> Callable:
         @role_required('camp_manager')
         @role_required('camp_manager', 'volunteer')
     """
+    # Built once per decorated view: O(1) role lookups and a ready-made denial message
+    allowed_roles = frozenset(required_roles)
+    denied_message = f"Access denied. Required role(s): {', '.join(required_roles)}"
+    
     def decorator(f: Callable) -> Callable:
         @wraps(f)
         def decorated_function(*args, **kwargs):
             try:
                 # Ensure we have a current user (from token_required)
-                if not hasattr(g, 'current_user') or not g.current_user:
+                if getattr(g, 'current_user_role', None) is None:
                     # Try to get user if token_required wasn't used
                     current_user_id = get_jwt_identity()
-                    user = User.query.filter_by(id=current_user_id).first()
+                    user = get_cached_user(current_user_id)
                     if not user:
                         raise AuthorizationError("User not found")
-                    g.current_user = user
+                    _set_current_user(user)
                 
                 # Check if user has required role
-                user_role = g.current_user.role
-                if user_role not in required_roles:
+                user_role = g.current_user_role
+                if user_role not in allowed_roles:
                     current_app.logger.warning(
-                        f"Access denied for user {g.current_user.email} with role {user_role}. "
-                        f"Required roles: {required_roles}"
-                    )
-                    raise AuthorizationError(
-                        f"Access denied. Required role(s): {', '.join(required_roles)}"
+                        "Access denied for user %s with role %s. Required roles: %s",
+                        g.current_user_email, user_role, required_roles
                     )
+                    raise AuthorizationError(denied_message)
                 
                 return f(*args, **kwargs)
                 
@@ -90,12 +135,12 @@ def role_required(*required_roles: str) -> Callable:
                 return {
                     'data': {
                         'code': 'AUTHORIZATION_ERROR',
-                        'message': f"Access denied. Required role(s): {', '.join(required_roles)}",
+                        'message': denied_message,
                         'details': {'required_roles': list(required_roles)}
                     }
                 }, 403
             except Exception as e:
-                current_app.logger.error(f"Role validation error: {str(e)}")
+                current_app.logger.exception("Role validation error: %s", e)
                 return {
                     'data': {
                         'code': 'AUTHORIZATION_ERROR',
@@ -108,83 +153,113 @@ def role_required(*required_roles: str) -> Callable:
     return decorator
 
 
-def camp_owner_required(camp_id_param: str = 'camp_id') -> Callable:
+# resource type -> (model name, URL parameter, not-found code, not-found message)
+_CAMP_RESOURCES = {
+    'registration': ('Registration', 'registration_id', 'REGISTRATION_NOT_FOUND', 'Registration not found'),
+    'registration_link': ('RegistrationLink', 'link_id', 'LINK_NOT_FOUND', 'Registration link not found'),
+    'custom_field': ('CustomField', 'field_id', 'CUSTOM_FIELD_NOT_FOUND', 'Custom field not found'),
+    'church': ('Church', 'church_id', 'CHURCH_NOT_FOUND', 'Church not found'),
+    'category': ('Category', 'category_id', 'CATEGORY_NOT_FOUND', 'Category not found'),
+}
+
+
+def _auth_error(code: str, message: str, status_code: int, details: Optional[dict] = None) -> tuple:
+    """Build the error response returned by authorize"""
+    return {
+        'data': {
+            'code': code,
+            'message': message,
+            'details': details
+        }
+    }, status_code
+
+
+def authorize(*roles: str, camp_param: Optional[str] = None, resource: Optional[str] = None) -> Callable:
     """
-    Decorator to ensure user owns/manages the specified camp
-    Must be used with @token_required
+    Single-pass authorization for camp routes: verifies the JWT, checks the role
+    (loading the user only when roles are given) and, when camp_param or resource
+    is given, camp ownership in one wrapper.
     
     Args:
-        camp_id_param: Name of the parameter containing camp_id (default: 'camp_id')
+        *roles: Roles allowed to access the endpoint (any role if empty)
+        camp_param: Name of the URL parameter holding the camp id to check ownership of
+        resource: Camp resource type whose camp to check ownership of: 'registration',
+                  'registration_link', 'custom_field', 'church' or 'category'; the id
+                  comes from the matching URL parameter (see _CAMP_RESOURCES)
         
     Usage:
-        @camp_owner_required()  # Uses 'camp_id' from URL params
-        @camp_owner_required('id')  # Uses 'id' from URL params
+        @authorize('camp_manager')
+        @authorize(camp_param='camp_id')
+        @authorize(resource='category')
     """
+    allowed_roles = frozenset(roles)
+    denied_message = f"Access denied. Required role(s): {', '.join(roles)}"
+    if resource is not None:
+        model_name, id_param, not_found_code, not_found_message = _CAMP_RESOURCES[resource]
+    
     def decorator(f: Callable) -> Callable:
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            try:
-                # Ensure we have a current user
-                if not hasattr(g, 'current_user') or not g.current_user:
-                    raise AuthorizationError("Authentication required")
+            _cached_verify()
+            g.current_user_id = get_jwt_identity()
+            
+            # Only role checks need the User row; ownership checks work from the token identity
+            if allowed_roles:
+                user = get_cached_user(g.current_user_id)
+                if not user:
+                    current_app.logger.warning("Token contains invalid user ID: %s", g.current_user_id)
+                    return json_response(*_auth_error('AUTHENTICATION_ERROR', 'Authentication required', 401))
                 
-                # Get camp_id from kwargs (URL parameters)
-                camp_id = kwargs.get(camp_id_param)
-                if not camp_id:
-                    raise ValidationError(f"Missing {camp_id_param} parameter")
+                _set_current_user(user)
                 
-                # Validate camp_id format
-                try:
-                    uuid.UUID(camp_id)
-                except ValueError:
-                    raise ValidationError("Invalid camp ID format")
+                if g.current_user_role not in allowed_roles:
+                    current_app.logger.warning(
+                        "Access denied for user %s with role %s. Required roles: %s",
+                        g.current_user_email, g.current_user_role, roles
+                    )
+                    return json_response(*_auth_error(
+                        'AUTHORIZATION_ERROR', denied_message, 403, {'required_roles': list(roles)}
+                    ))
+            
+            if camp_param is not None:
+                camp_id = canonical_id(kwargs.get(camp_param) or '')
+                if camp_id is None:
+                    return json_response(*_auth_error('VALIDATION_ERROR', 'Invalid camp ID format', 400))
                 
                 # Import here to avoid circular imports
-                from ..camp.models import Camp, CampWorker
+                from ..camp.services import camp_membership
                 
-                # Check if camp exists and user owns it
-                camp = Camp.query.filter_by(id=camp_id).first()
-                camp_workers = CampWorker.query.filter_by(camp_id=camp_id).all()
-                camp_workers_ids = [camp_worker.user_id for camp_worker in camp_workers]
-                if not camp:
-                    return {
-                        'data': {
-                            'code': 'CAMP_NOT_FOUND',
-                            'message': 'Camp not found',
-                            'details': None
-                        }
-                    }, 404
+                # Membership is usually answered from the access cache; the camp itself is loaded on demand
+                is_worker = camp_membership(camp_id, g.current_user_id)
+                if is_worker is None:
+                    return json_response(*_auth_error('CAMP_NOT_FOUND', 'Camp not found', 404))
                 
-                # Check ownership
-                if str(g.current_user.id) not in camp_workers_ids:
+                if not is_worker:
                     current_app.logger.warning(
-                        f"Access denied: User {g.current_user.email} tried to access "
-                        f"camp {camp_id}"
+                        "Access denied: User %s tried to access camp %s", g.current_user_id, camp_id
                     )
-                    raise AuthorizationError("You can only access your own camps")
+                    return json_response(*_auth_error('AUTHORIZATION_ERROR', 'You can only access your own camps', 403))
                 
-                # Store camp in g for use in view
-                g.current_camp = camp
+                g.current_camp_id = camp_id
+            
+            if resource is not None:
+                # Import here to avoid circular imports
+                from ..camp import models
+                from ..camp.services import camp_access
                 
-                return f(*args, **kwargs)
+                # Built directly so the view's @output schema doesn't reshape the error
+                access = camp_access(getattr(models, model_name), kwargs.get(id_param), g.current_user_id)
+                if access is None:
+                    return json_response(*_auth_error(not_found_code, not_found_message, 404))
                 
-            except (AuthorizationError, ValidationError) as e:
-                return {
-                    'data': {
-                        'code': 'AUTHORIZATION_ERROR',
-                        'message': str(e),
-                        'details': None
-                    }
-                }, 403
-            except Exception as e:
-                current_app.logger.error(f"Camp ownership validation error: {str(e)}")
-                return {
-                    'data': {
-                        'code': 'AUTHORIZATION_ERROR',
-                        'message': 'Access denied',
-                        'details': None
-                    }
-                }, 403
+                if not access:
+                    current_app.logger.warning(
+                        "Access denied: User %s tried to access %s %s",
+                        g.current_user_id, resource, kwargs.get(id_param)
+                    )
+                    return json_response(*_auth_error('AUTHORIZATION_ERROR', 'Access denied', 403))
+            
+            return f(*args, **kwargs)
         
         return decorated_function
     return decorator
@@ -199,14 +274,13 @@ def optional_auth(f: Callable) -> Callable:
     def decorated_function(*args, **kwargs):
         try:
             # Try to verify JWT, but don't fail if it's missing
-            verify_jwt_in_request(optional=True)
+            _cached_verify(optional=True)
             
             current_user_id = get_jwt_identity()
             if current_user_id:
-                user = User.query.filter_by(id=current_user_id).first()
+                user = get_cached_user(current_user_id)
                 if user:
-                    g.current_user = user
-                    g.current_user_id = str(user.id)
+                    _set_current_user(user)
                 else:
                     g.current_user = None
                     g.current_user_id = None
@@ -227,8 +301,19 @@ def optional_auth(f: Callable) -> Callable:
 
 # Utility functions for use in views
 def get_current_user() -> Optional[User]:
-    """Get the current authenticated user from flask.g"""
-    return getattr(g, 'current_user', None)
+    """
+    Get the current authenticated user from flask.g
+    
+    Decorators that only verify the token set just current_user_id; the User
+    row is then loaded on first call and kept in g for the rest of the request.
+    """
+    if getattr(g, 'current_user', None) is None:
+        user_id = getattr(g, 'current_user_id', None)
+        user = get_cached_user(user_id) if user_id else None
+        if user is None:
+            return None
+        _set_current_user(user)
+    return g.current_user
 
 
 def get_current_user_id() -> Optional[str]:
@@ -237,8 +322,20 @@ def get_current_user_id() -> Optional[str]:
 
 
 def get_current_camp():
-    """Get the current camp from flask.g (set by camp_owner_required)"""
-    return getattr(g, 'current_camp', None)
+    """
+    Get the current camp from flask.g
+    
+    authorize(camp_param=...) only stores the camp id; the camp is loaded on
+    first call and kept in g.
+    """
+    if getattr(g, 'current_camp', None) is None:
+        camp_id = getattr(g, 'current_camp_id', None)
+        if camp_id is None:
+            return None
+        # Import here to avoid circular imports
+        from ..camp.models import Camp
+        g.current_camp = db.session.get(Camp, camp_id)
+    return g.current_camp
 
 
 def require_camp_manager(user: Optional[User] = None) -> bool:
@@ -255,6 +352,46 @@ def require_volunteer_or_manager(user: Optional[User] = None) -> bool:
     return user and user.role in ['volunteer', 'camp_manager']
 
 
+class SecurityHeadersMiddleware:
+    """
+    WSGI middleware that appends the static security headers to every response
+    
+    Headers are added to the list handed to start_response, so no per-request
+    work goes through Werkzeug's Headers object. Debug builds also get the
+    permissive CORS headers. A header the response already carries (e.g. set
+    by Flask-CORS or the view) is left as is rather than sent twice.
+    """
+    
+    SECURITY_HEADERS = [
+        ('X-Content-Type-Options', 'nosniff'),
+        ('X-Frame-Options', 'DENY'),
+        ('X-XSS-Protection', '1; mode=block'),
+    ]
+    
+    # Configure domains in production
+    DEBUG_CORS_HEADERS = [
+        ('Access-Control-Allow-Origin', '*'),
+        ('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS'),
+        ('Access-Control-Allow-Headers', 'Content-Type, Authorization'),
+    ]
+    
+    def __init__(self, wsgi_app, flask_app):
+        self.wsgi_app = wsgi_app
+        self.flask_app = flask_app
+    
+    def __call__(self, environ, start_response):
+        static_headers = self.SECURITY_HEADERS
+        if self.flask_app.debug:
+            static_headers = static_headers + self.DEBUG_CORS_HEADERS
+        
+        def _start_response(status, headers, exc_info=None):
+            present = {name.lower() for name, _ in headers}
+            headers.extend(header for header in static_headers if header[0].lower() not in present)
+            return start_response(status, headers, exc_info)
+        
+        return self.wsgi_app(environ, _start_response)
+
+
 class AuthMiddleware:
     """
     Middleware class for handling authentication across the application
@@ -267,31 +404,23 @@ class AuthMiddleware:
     
     def init_app(self, app):
         """Initialize the middleware with the Flask app"""
+        self._static_prefix = (app.static_url_path or '/static') + '/'
         app.before_request(self.before_request)
-        app.after_request(self.after_request)
+        app.wsgi_app = SecurityHeadersMiddleware(app.wsgi_app, app)
     
     def before_request(self):
         """Process requests before they reach the view functions"""
+        # Preflights and static files never consult the auth state in g
+        if request.method == 'OPTIONS' or request.path.startswith(self._static_prefix):
+            return
+        
         # Initialize auth-related variables in g
         g.current_user = None
         g.current_user_id = None
+        g.current_user_role = None
+        g.current_user_email = None
         g.current_camp = None
         
         # Log request for debugging (remove in production)
         if current_app.debug:
-            current_app.logger.debug(f"{request.method} {request.path} - {request.remote_addr}")
-    
-    def after_request(self, response):
-        """Process responses after view functions complete"""
-        # Add security headers
-        response.headers['X-Content-Type-Options'] = 'nosniff'
-        response.headers['X-Frame-Options'] = 'DENY'
-        response.headers['X-XSS-Protection'] = '1; mode=block'
-        
-        # Add CORS headers if needed (configure domains in production)
-        if current_app.debug:
-            response.headers['Access-Control-Allow-Origin'] = '*'
-            response.headers['Access-Control-Allow-Methods'] = 'GET, POST, PUT, DELETE, OPTIONS'
-            response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization'
-        
-        return response
+            current_app.logger.debug("%s %s - %s", request.method, request.path, request.remote_addr)
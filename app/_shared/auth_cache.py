@@ -0,0 +1,124 @@
+"""
+Per-process caches for authentication
+
+token_required and friends look up the JWT user on every request. The user
+cache keeps a detached copy of each user for TOKEN_CACHE_TTL seconds and merges
+it into the current session without a SELECT. Any update or delete of a User row
+evicts its entry, so role and email changes are never served stale.
+
+The token cache remembers decoded claims for recently verified bearer tokens
+(keyed by a digest of the token) so repeat requests skip signature checks. An
+entry never outlives the token's own exp claim.
+"""
+
+import hashlib
+import threading
+import time
+from typing import Optional, Tuple
+
+from cachetools import TLRUCache, TTLCache
+from flask import current_app
+from sqlalchemy import event
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.extensions import db
+from app.user.models import User
+from .app_cache import app_ttl_cache
+
+
+_CACHE_KEY = 'user_cache'
+_TOKEN_CACHE_KEY = 'token_cache'
+_cache_lock = threading.Lock()
+
+
+def _user_cache() -> Optional[TTLCache]:
+    return app_ttl_cache(_CACHE_KEY, 'TOKEN_CACHE', 30, 10_000)
+
+
+def _detached_copy(user: User) -> User:
+    """Snapshot loaded column values so later commits can't expire the cached object"""
+    copy = User(**{column.key: getattr(user, column.key) for column in User.__table__.columns})
+    make_transient_to_detached(copy)
+    return copy
+
+
+def _fetch_and_cache(user_id: str) -> Optional[User]:
+    """Load the user from the database and remember a detached copy"""
+    user = db.session.get(User, user_id)
+    cache = _user_cache()
+    if user and cache is not None:
+        with _cache_lock:
+            cache[user_id] = _detached_copy(user)
+    return user
+
+
+def get_cached_user(user_id: str) -> Optional[User]:
+    """Get a session-bound User by id, skipping the query on a cache hit"""
+    cache = _user_cache()
+    if cache is None:
+        return db.session.get(User, user_id)
+
+    with _cache_lock:
+        cached = cache.get(user_id)
+    if cached is None:
+        return _fetch_and_cache(user_id)
+    return db.session.merge(cached, load=False)
+
+
+def invalidate_user(user_id) -> None:
+    """Drop a user from the cache"""
+    cache = current_app.extensions.get(_CACHE_KEY)
+    if cache is not None:
+        with _cache_lock:
+            cache.pop(str(user_id), None)
+
+
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def _evict_on_write(mapper, connection, target):
+    invalidate_user(target.id)
+
+
+def _token_cache() -> Optional[TLRUCache]:
+    """Return the app's verified-token cache, creating it on first use (None when disabled)"""
+    extensions = current_app.extensions
+    if _TOKEN_CACHE_KEY not in extensions:
+        max_age = current_app.config.get('JWT_VERIFY_CACHE_TTL', 60)
+        maxsize = current_app.config.get('JWT_VERIFY_CACHE_MAXSIZE', 20_000)
+
+        def ttu(_key, entry, now):
+            # Expire at the token's exp claim or max_age from now, whichever is first
+            return min(entry[1].get('exp', now), now + max_age)
+
+        extensions[_TOKEN_CACHE_KEY] = TLRUCache(maxsize, ttu, timer=time.time) if max_age > 0 else None
+    return extensions[_TOKEN_CACHE_KEY]
+
+
+def token_digest(token: str) -> bytes:
+    """Hash a raw bearer token into a compact cache key"""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def get_verified_token(digest: bytes) -> Optional[Tuple[dict, dict]]:
+    """Return the cached (jwt_header, jwt_data) for a token digest"""
+    cache = _token_cache()
+    if cache is None:
+        return None
+    with _cache_lock:
+        return cache.get(digest)
+
+
+def remember_verified_token(digest: bytes, jwt_header: dict, jwt_data: dict) -> None:
+    """Cache the decoded header and claims of a token that passed verification"""
+    cache = _token_cache()
+    if cache is not None:
+        with _cache_lock:
+            cache[digest] = (jwt_header, jwt_data)
+
+
+def forget_token(token: str) -> None:
+    """Drop a token from the verified-token cache (on logout or revocation)"""
+    cache = current_app.extensions.get(_TOKEN_CACHE_KEY)
+    if cache is not None:
+        with _cache_lock:
+            cache.pop(token_digest(token), None)
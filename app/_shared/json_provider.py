@@ -0,0 +1,109 @@
+"""
+orjson-backed JSON provider
+
+Drop-in replacement for Flask's DefaultJSONProvider that serializes with
+orjson while keeping Flask's output format (HTTP dates, Decimal/UUID as
+strings, sorted keys).
+
+register_orjson_body_loader swaps the request-body parser used by
+@bp.input(..., location='json') to orjson as well. json_response builds a
+finished response that APIFlask's @output passes through without a schema dump;
+rows_response does the same for lists of column rows, and ndjson_response
+streams them one JSON object per line.
+"""
+
+from typing import Any, Iterable, Mapping, Union
+
+import orjson
+from apiflask.scaffold import parser
+from flask import current_app, stream_with_context
+from flask.json.provider import JSONProvider, _default
+from webargs.core import missing
+from webargs.flaskparser import is_json_request
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider that uses orjson for dumps/loads"""
+
+    # Hand dates and datetimes to _default so they keep Flask's HTTP date format
+    option = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_SORT_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as a JSON string"""
+        return orjson.dumps(obj, default=_default, option=self.option).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """Deserialize data from a JSON string or bytes"""
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        """Serialize the given arguments straight to a JSON response body"""
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=_default, option=self.option)
+        return self._app.response_class(body, mimetype='application/json')
+
+
+def json_response(payload: Any, status: int = 200):
+    """Serialize a payload straight to a JSON response, skipping the route's @output schema"""
+    response = current_app.json.response(payload)
+    response.status_code = status
+    return response
+
+
+# Column rows are written with orjson's native ISO 8601 datetimes, like the schemas' DateTime fields
+_ROWS_OPTION = orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+
+
+def rows_response(rows: Iterable[Mapping[str, Any]], status: int = 200):
+    """
+    Serialize column rows as {'data': [...]} straight to a response
+
+    For list endpoints whose rows already match their response schema. Skips
+    the schema dump; datetimes are written as ISO 8601 like the schemas'
+    DateTime fields, not in Flask's HTTP-date format.
+    """
+    body = orjson.dumps({'data': [dict(row) for row in rows]}, default=_default, option=_ROWS_OPTION)
+    response = current_app.response_class(body, mimetype='application/json')
+    response.status_code = status
+    return response
+
+
+def ndjson_response(rows: Iterable[Mapping[str, Any]], status: int = 200):
+    """
+    Stream column rows as newline-delimited JSON, one object per line
+
+    rows is consumed lazily while the response is sent, inside the request
+    context, so a server-side cursor keeps only its current batch in memory.
+    Rows are written as rows_response writes them.
+    """
+    def generate():
+        for row in rows:
+            yield orjson.dumps(dict(row), default=_default, option=_ROWS_OPTION) + b'\n'
+
+    response = current_app.response_class(stream_with_context(generate()), mimetype='application/x-ndjson')
+    response.status_code = status
+    return response
+
+
+def _load_json_body(request, schema):
+    """webargs 'json' location loader that decodes the request body with orjson"""
+    if not is_json_request(request):
+        return missing
+    data = request.get_data(cache=True)
+    if not data:
+        return missing
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # Let webargs' own loader re-parse and build its standard 400 response
+        return parser.load_json(request, schema)
+
+
+def register_orjson_body_loader() -> None:
+    """Parse JSON request bodies for APIFlask input schemas with orjson"""
+    parser.location_loader('json')(_load_json_body)
@@ -1,20 +1,75 @@
 
 from datetime import datetime, timezone
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy import String
+from sqlalchemy import types
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
 import uuid
 
 from app.extensions import db
 
+
+_NIL_UUID = str(uuid.UUID(int=0))
+
+
+class GUID(TypeDecorator):
+    """UUID column: native 16-byte uuid on Postgres, CHAR(32) elsewhere; Python values stay hyphenated strings"""
+    impl = types.Uuid(as_uuid=False)
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        try:
+            return str(uuid.UUID(value))
+        except (AttributeError, ValueError):
+            # Malformed ids (usually from URLs) match no row instead of raising a DataError
+            return _NIL_UUID
+
+
+class utcnow(FunctionElement):
+    """Current UTC time evaluated by the database, for naive DateTime column defaults"""
+    type = types.DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow, 'postgresql')
+def _utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+
+def _identity(value):
+    return value
+
+
+def _to_isoformat(value):
+    return None if value is None else value.isoformat()
+
+
+def _column_converter(column_type, for_api):
+    """Pick the to_dict converter for a column type (dates to ISO strings unless for_api; GUIDs are already str)"""
+    if not for_api and isinstance(column_type, (types.DateTime, types.Date, types.Time)):
+        return _to_isoformat
+    return _identity
+
+
 class BaseModel(db.Model):
     """Base model with common fields and methods"""
     __abstract__ = True
     
-    # Use String for better SQLite compatibility
-    id = db.Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
-    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), 
-                          onupdate=lambda: datetime.now(timezone.utc), nullable=False)
+    id = db.Column(GUID, primary_key=True, default=lambda: str(uuid.uuid4()))
+    # Timestamps are filled in by the database, no Python callback per row
+    created_at = db.Column(db.DateTime, server_default=utcnow(), nullable=False)
+    updated_at = db.Column(db.DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False)
     
     def save(self):
         """Save the current instance to database"""
@@ -36,6 +91,19 @@ class BaseModel(db.Model):
         db.session.commit()
         return self
     
+    @classmethod
+    def _to_dict_plan(cls, for_api):
+        """(column name, converter) pairs used by to_dict, built once per class"""
+        attr = '_to_dict_plan_api' if for_api else '_to_dict_plan_str'
+        plan = cls.__dict__.get(attr)
+        if plan is None:
+            plan = tuple(
+                (column.name, _column_converter(column.type, for_api))
+                for column in cls.__table__.columns
+            )
+            setattr(cls, attr, plan)
+        return plan
+    
     def to_dict(self, for_api=False):
         """Convert model instance to dictionary
         
@@ -43,32 +111,4 @@ class BaseModel(db.Model):
             for_api (bool): If True, returns raw objects for API serialization.
                            If False, converts datetime and UUID to strings.
         """
-       
-        result = {}
-        for column in self.__table__.columns:
-            value = getattr(self, column.name)
-            try:
-                if for_api:
-                    # For API serialization, return raw objects for Marshmallow to handle
-                    if isinstance(value, uuid.UUID):
-                        result[column.name] = str(value)
-                    else:
-                        result[column.name] = value
-                else:
-                    # For general use, convert to strings
-                    if isinstance(value, datetime):
-                        result[column.name] = value.isoformat()
-                    elif isinstance(value, uuid.UUID):
-                        result[column.name] = str(value)
-                    elif value is not None and hasattr(value, 'isoformat') and callable(getattr(value, 'isoformat')) and not isinstance(value, str):
-                        # Handle datetime-like objects that might not be datetime instances, but exclude strings
-                        try:
-                            result[column.name] = value.isoformat()
-                        except (AttributeError, TypeError):
-                            result[column.name] = str(value)
-                    else:
-                        result[column.name] = value
-            except Exception as e:
-                print(value)
-                print(f"Error converting column {column.name}: {str(e)}")
-        return result
+        return {name: convert(getattr(self, name)) for name, convert in self._to_dict_plan(for_api)}
@@ -0,0 +1,108 @@
+"""
+Per-process cache for camp access checks
+
+The by-id routes for registrations, links, custom fields, churches and
+categories ask on every request which camp owns the resource and whether the
+user works on that camp; the camp routes ask the latter directly. A resource never moves to another camp, so the
+resource -> camp mapping is cached until the row is deleted. Worker membership
+is cached per (camp, user) and evicted whenever a CampWorker row changes in
+this process. Deleting a camp drops every entry that points at it, since its
+resources and workers go with it via ON DELETE CASCADE without per-row events.
+Entries live for CAMP_ACCESS_CACHE_TTL seconds, which bounds how long other
+worker processes can serve a stale answer; a hit is not proof the row still
+exists, so the views still answer 404 when the row is gone.
+"""
+
+import threading
+from typing import Optional
+
+from cachetools import TTLCache
+from flask import current_app
+from sqlalchemy import event
+
+from app._shared.app_cache import app_ttl_cache, canonical_id
+from .models import Camp, CampWorker, Category, Church, CustomField, Registration, RegistrationLink
+
+
+_CACHE_KEY = 'camp_access_cache'
+_cache_lock = threading.Lock()
+
+
+def _access_cache() -> Optional[TTLCache]:
+    return app_ttl_cache(_CACHE_KEY, 'CAMP_ACCESS_CACHE', 60, 20_000)
+
+
+def _get(key):
+    cache = _access_cache()
+    if cache is None:
+        return None
+    with _cache_lock:
+        return cache.get(key)
+
+
+def _pop(key) -> None:
+    cache = current_app.extensions.get(_CACHE_KEY)
+    if cache is not None:
+        with _cache_lock:
+            cache.pop(key, None)
+
+
+def get_cached_access(model, resource_id: str, user_id: str) -> Optional[bool]:
+    """Cached answer to whether user_id works on the resource's camp (None on a miss)"""
+    camp_id = _get(('camp', model.__tablename__, resource_id))
+    if camp_id is None:
+        return None
+    return _get(('worker', camp_id, str(user_id)))
+
+
+def get_cached_membership(camp_id: str, user_id: str) -> Optional[bool]:
+    """Cached answer to whether user_id works on camp_id (None on a miss)"""
+    return _get(('worker', canonical_id(camp_id), str(user_id)))
+
+
+def remember_membership(camp_id: str, user_id: str, is_worker: bool) -> None:
+    """Cache the user's membership of a camp"""
+    cache = _access_cache()
+    if cache is not None:
+        with _cache_lock:
+            cache[('worker', canonical_id(camp_id), str(user_id))] = is_worker
+
+
+def remember_access(model, resource_id: str, camp_id: str, user_id: str, is_worker: bool) -> None:
+    """Cache the resource's camp and the user's membership of it"""
+    cache = _access_cache()
+    if cache is not None:
+        with _cache_lock:
+            cache[('camp', model.__tablename__, resource_id)] = canonical_id(camp_id)
+            cache[('worker', canonical_id(camp_id), str(user_id))] = is_worker
+
+
+@event.listens_for(CampWorker, 'after_insert')
+@event.listens_for(CampWorker, 'after_update')
+@event.listens_for(CampWorker, 'after_delete')
+def _evict_worker(mapper, connection, target):
+    _pop(('worker', canonical_id(target.camp_id), str(target.user_id)))
+
+
+@event.listens_for(Registration, 'after_delete')
+@event.listens_for(RegistrationLink, 'after_delete')
+@event.listens_for(CustomField, 'after_delete')
+@event.listens_for(Church, 'after_delete')
+@event.listens_for(Category, 'after_delete')
+def _evict_resource(mapper, connection, target):
+    _pop(('camp', mapper.local_table.name, canonical_id(target.id)))
+
+
+@event.listens_for(Camp, 'after_delete')
+def _evict_camp(mapper, connection, target):
+    cache = current_app.extensions.get(_CACHE_KEY)
+    if cache is None:
+        return
+    camp_id = canonical_id(target.id)
+    with _cache_lock:
+        stale = [
+            key for key, value in cache.items()
+            if (key[0] == 'worker' and key[1] == camp_id) or (key[0] == 'camp' and value == camp_id)
+        ]
+        for key in stale:
+            cache.pop(key, None)
@@ -0,0 +1,106 @@
+"""
+Per-process cache for public registration forms
+
+A registration form is the camp's details, churches, categories and custom
+fields. They change rarely but are read on every page load of a registration
+link, so the rendered sections are kept per camp for
+REGISTRATION_FORM_CACHE_TTL seconds. Any insert, update or delete of one of
+those rows evicts the camp's entry in this process; other worker processes pick
+the change up when their entry expires.
+
+The general form (camp URL, no link) depends on nothing else, so its
+serialized response body is cached alongside the sections and the hit path
+skips both the dict assembly and the schema dump. The camp's categories list
+body is cached the same way. Both bodies are stored with their ETag, so a
+client revalidating with If-None-Match gets a 304 without any query.
+
+The registration link itself is not cached: its usage_count changes with every
+registration.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from cachetools import TTLCache
+from flask import current_app
+from sqlalchemy import event
+
+from app._shared.app_cache import app_ttl_cache, canonical_id
+from .models import Camp, Category, Church, CustomField
+
+
+_CACHE_KEY = 'registration_form_cache'
+# Response bodies cached per camp next to the form sections
+_BODY_KINDS = ('general_body', 'categories_body')
+_cache_lock = threading.Lock()
+
+
+def _form_cache() -> Optional[TTLCache]:
+    return app_ttl_cache(_CACHE_KEY, 'REGISTRATION_FORM_CACHE', 30, 1_000)
+
+
+def _get_or_build(key, build: Callable[[], Any]) -> Any:
+    """Get a cached value, calling build() on a miss (None results are not cached)"""
+    cache = _form_cache()
+    if cache is None:
+        return build()
+
+    with _cache_lock:
+        value = cache.get(key)
+    if value is None:
+        value = build()
+        if value is not None:
+            with _cache_lock:
+                cache[key] = value
+    return value
+
+
+def get_form_sections(
+    camp_id: str, build: Callable[[], Optional[Dict[str, Any]]]
+) -> Optional[Dict[str, Any]]:
+    """Get a camp's cached form sections, calling build() on a miss"""
+    return _get_or_build(canonical_id(camp_id), build)
+
+
+def get_general_form_body(
+    camp_id: str, build: Callable[[], Optional[Tuple[bytes, str]]]
+) -> Optional[Tuple[bytes, str]]:
+    """Get a camp's serialized general (no link) form response body and ETag, calling build() on a miss"""
+    return _get_or_build((canonical_id(camp_id), 'general_body'), build)
+
+
+def get_categories_body(
+    camp_id: str, build: Callable[[], Optional[Tuple[bytes, str]]]
+) -> Optional[Tuple[bytes, str]]:
+    """Get a camp's serialized categories list response body and ETag, calling build() on a miss"""
+    return _get_or_build((canonical_id(camp_id), 'categories_body'), build)
+
+
+def invalidate_camp_form(camp_id) -> None:
+    """Drop a camp's form sections and rendered bodies from the cache"""
+    cache = current_app.extensions.get(_CACHE_KEY)
+    if cache is not None:
+        key = canonical_id(camp_id)
+        with _cache_lock:
+            cache.pop(key, None)
+            for kind in _BODY_KINDS:
+                cache.pop((key, kind), None)
+
+
+@event.listens_for(Camp, 'after_update')
+@event.listens_for(Camp, 'after_delete')
+def _evict_camp(mapper, connection, target):
+    invalidate_camp_form(target.id)
+
+
+@event.listens_for(Church, 'after_insert')
+@event.listens_for(Church, 'after_update')
+@event.listens_for(Church, 'after_delete')
+@event.listens_for(Category, 'after_insert')
+@event.listens_for(Category, 'after_update')
+@event.listens_for(Category, 'after_delete')
+@event.listens_for(CustomField, 'after_insert')
+@event.listens_for(CustomField, 'after_update')
+@event.listens_for(CustomField, 'after_delete')
+def _evict_form_row(mapper, connection, target):
+    invalidate_camp_form(target.camp_id)
@@ -0,0 +1,40 @@
+"""
+Per-request memo for registration link lookups
+
+The public registration routes and the registration service both resolve the
+same link token while handling one request. load_link keeps the loaded link on
+flask.g so the token is only queried once per request.
+"""
+
+from typing import Optional
+
+from flask import g
+from sqlalchemy import bindparam, select
+
+from app.extensions import db
+from .models import RegistrationLink
+
+
+# Built once so every lookup reuses the same cached compiled statement
+LINK_BY_TOKEN = select(RegistrationLink).where(RegistrationLink.link_token == bindparam('link_token'))
+
+
+def _link_cache() -> dict:
+    if 'link_cache' not in g:
+        g.link_cache = {}
+    return g.link_cache
+
+
+def remember_link(link: RegistrationLink) -> None:
+    """Seed the memo with a link the caller already loaded by other means"""
+    _link_cache()[link.link_token] = link
+
+
+def load_link(link_token: str) -> Optional[RegistrationLink]:
+    """Get a registration link by token, querying at most once per request"""
+    link_cache = _link_cache()
+    if link_token not in link_cache:
+        link_cache[link_token] = db.session.execute(
+            LINK_BY_TOKEN, {'link_token': link_token}
+        ).scalar_one_or_none()
+    return link_cache[link_token]
@@ -0,0 +1,67 @@
+"""
+Per-process cache for camp statistics
+
+Dashboards poll a camp's stats every few seconds and each read aggregates all
+of the camp's registrations. The computed stats are kept per camp for
+CAMP_STATS_CACHE_TTL seconds. Inserting, updating or deleting a registration
+(or changing the camp's capacity) evicts the camp's entry in this process;
+other worker processes pick the change up when their entry expires.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from cachetools import TTLCache
+from flask import current_app
+from sqlalchemy import event
+
+from app._shared.app_cache import app_ttl_cache, canonical_id
+from .models import Camp, Registration
+
+
+_CACHE_KEY = 'camp_stats_cache'
+_cache_lock = threading.Lock()
+
+
+def _stats_cache() -> Optional[TTLCache]:
+    return app_ttl_cache(_CACHE_KEY, 'CAMP_STATS_CACHE', 30, 1_000)
+
+
+def get_camp_stats(
+    camp_id: str, build: Callable[[], Optional[Dict[str, Any]]]
+) -> Optional[Dict[str, Any]]:
+    """Get a camp's cached stats, calling build() on a miss (None results are not cached)"""
+    cache = _stats_cache()
+    if cache is None:
+        return build()
+
+    key = canonical_id(camp_id)
+    with _cache_lock:
+        stats = cache.get(key)
+    if stats is None:
+        stats = build()
+        if stats is not None:
+            with _cache_lock:
+                cache[key] = stats
+    return stats
+
+
+def invalidate_camp_stats(camp_id) -> None:
+    """Drop a camp's stats from the cache"""
+    cache = current_app.extensions.get(_CACHE_KEY)
+    if cache is not None:
+        with _cache_lock:
+            cache.pop(canonical_id(camp_id), None)
+
+
+@event.listens_for(Camp, 'after_update')
+@event.listens_for(Camp, 'after_delete')
+def _evict_camp(mapper, connection, target):
+    invalidate_camp_stats(target.id)
+
+
+@event.listens_for(Registration, 'after_insert')
+@event.listens_for(Registration, 'after_update')
+@event.listens_for(Registration, 'after_delete')
+def _evict_registration(mapper, connection, target):
+    invalidate_camp_stats(target.camp_id)
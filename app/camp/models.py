@@ -1,8 +1,16 @@
+import base64
+import secrets
 from datetime import datetime, timezone
-from sqlalchemy import Text, JSON, String
+from decimal import Decimal, ROUND_HALF_UP
+from sqlalchemy import Text, JSON, and_, or_
+from sqlalchemy.ext.hybrid import hybrid_method
 
 from app.extensions import db
-from app._shared.models import BaseModel
+from app._shared.models import BaseModel, GUID, utcnow
+
+
+_ZERO = Decimal('0')
+_CENTS = Decimal('0.01')
 
 
 class Camp(BaseModel):
@@ -20,20 +28,21 @@ class Camp(BaseModel):
     is_active = db.Column(db.Boolean, default=True, nullable=False, server_default='1')
         
     # Relationships
-    churches = db.relationship('Church', backref='camp', lazy=True, cascade='all, delete-orphan')
-    categories = db.relationship('Category', backref='camp', lazy=True, cascade='all, delete-orphan')
-    custom_fields = db.relationship('CustomField', backref='camp', lazy=True, cascade='all, delete-orphan')
-    registrations = db.relationship('Registration', backref='camp', lazy=True, cascade='all, delete-orphan')
+    # Children go with the camp via ON DELETE CASCADE; passive_deletes skips loading them to delete row by row
+    churches = db.relationship('Church', backref='camp', lazy=True, cascade='all, delete-orphan', passive_deletes=True)
+    categories = db.relationship('Category', backref='camp', lazy=True, cascade='all, delete-orphan', passive_deletes=True)
+    custom_fields = db.relationship('CustomField', backref='camp', lazy=True, cascade='all, delete-orphan', passive_deletes=True)
+    registrations = db.relationship('Registration', backref='camp', lazy=True, cascade='all, delete-orphan', passive_deletes=True)
     # expenses = db.relationship('Expense', backref='camp', lazy=True, cascade='all, delete-orphan')
-    registration_links = db.relationship('RegistrationLink', backref='camp', lazy=True, cascade='all, delete-orphan')
+    registration_links = db.relationship('RegistrationLink', backref='camp', lazy=True, cascade='all, delete-orphan', passive_deletes=True)
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if self.is_active is None:
             self.is_active = True
 
-    def to_dict(self, for_api=False):
-        return {
+    def to_dict(self, for_api=False, include_relations=True):
+        data = {
             'id': self.id,
             'name': self.name,
             'start_date': self.start_date,
@@ -44,25 +53,38 @@ class Camp(BaseModel):
             'description': self.description,
             'registration_deadline': self.registration_deadline,
             'is_active': self.is_active,
-            'churches': [church.to_dict(for_api=for_api) for church in self.churches],
-            'categories': [category.to_dict(for_api=for_api) for category in self.categories],
-            'custom_fields': [custom_field.to_dict(for_api=for_api) for custom_field in self.custom_fields],
-            'registrations': [registration.to_dict(for_api=for_api) for registration in self.registrations],
-            'registration_links': [registration_link.to_dict(for_api=for_api) for registration_link in self.registration_links]
         }
+        # API responses only expose the camp's own columns; skip loading child collections for them
+        if include_relations:
+            data.update({
+                'churches': [church.to_dict(for_api=for_api) for church in self.churches],
+                'categories': [category.to_dict(for_api=for_api) for category in self.categories],
+                'custom_fields': [custom_field.to_dict(for_api=for_api) for custom_field in self.custom_fields],
+                'registrations': [registration.to_dict(for_api=for_api) for registration in self.registrations],
+                'registration_links': [registration_link.to_dict(for_api=for_api) for registration_link in self.registration_links]
+            })
+        return data
 
 
 class CampWorker(BaseModel):
     """Camp worker model"""
     __tablename__ = 'camp_workers'
     
-    user_id = db.Column(String(36), db.ForeignKey('users.id'), nullable=False)
-    camp_id = db.Column(String(36), db.ForeignKey('camps.id'), nullable=False)
+    user_id = db.Column(GUID, db.ForeignKey('users.id'), nullable=False)
+    camp_id = db.Column(GUID, db.ForeignKey('camps.id', ondelete='CASCADE'), nullable=False)
     role = db.Column(db.Enum('camp_manager', 'volunteer', name='user_roles'), nullable=False)
     
     # Relationships
     user = db.relationship('User', backref='camp_workers', lazy=True)
-    camp = db.relationship('Camp', backref='camp_workers', lazy=True)
+    camp = db.relationship(
+        'Camp', lazy=True,
+        backref=db.backref('camp_workers', cascade='all, delete-orphan', passive_deletes=True),
+    )
+
+    __table_args__ = (
+        # Every camp access check looks up (camp, user) membership
+        db.Index('ix_camp_workers_camp_user', 'camp_id', 'user_id'),
+    )
 
     def to_dict(self, for_api=False):
         return {
@@ -82,24 +104,29 @@ class Church(BaseModel):
     name = db.Column(db.String(255), nullable=False)
     district = db.Column(db.String(255), nullable=True)
     area = db.Column(db.String(255), nullable=True)
-    camp_id = db.Column(String(36), db.ForeignKey('camps.id'), nullable=False)
+    camp_id = db.Column(GUID, db.ForeignKey('camps.id', ondelete='CASCADE'), nullable=False)
     
     # Relationships
-    registrations = db.relationship('Registration', backref='church', lazy=True)
+    # Deletes first check for registrations via EXISTS; don't load the collection to null its FKs
+    registrations = db.relationship('Registration', backref='church', lazy=True, passive_deletes=True)
 
     __table_args__ = (
         db.UniqueConstraint('name', 'district', 'area', 'camp_id', name='church_name_district_area_camp_id_unique'),
+        # Registration form lists a camp's churches by name
+        db.Index('ix_churches_camp_name', 'camp_id', 'name'),
     )
 
-    def to_dict(self, for_api=False):
-        return {
+    def to_dict(self, for_api=False, include_relations=True):
+        data = {
             'id': self.id,
             'name': self.name,
             'district': self.district,
             'area': self.area,
             'camp_id': self.camp_id,
-            'registrations': [registration.to_dict(for_api=for_api) for registration in self.registrations]
         }
+        if include_relations:
+            data['registrations'] = [registration.to_dict(for_api=for_api) for registration in self.registrations]
+        return data
 
 
 class Category(BaseModel):
@@ -109,22 +136,30 @@ class Category(BaseModel):
     name = db.Column(db.String(255), nullable=False)
     discount_percentage = db.Column(db.Numeric(5, 2), default=0)
     discount_amount = db.Column(db.Numeric(10, 2), default=0)
-    camp_id = db.Column(String(36), db.ForeignKey('camps.id'), nullable=False)
+    camp_id = db.Column(GUID, db.ForeignKey('camps.id', ondelete='CASCADE'), nullable=False)
     is_default = db.Column(db.Boolean, default=False, nullable=False)
     
     # Relationships
-    registrations = db.relationship('Registration', backref='category', lazy=True)
+    # See Church.registrations
+    registrations = db.relationship('Registration', backref='category', lazy=True, passive_deletes=True)
 
-    def to_dict(self, for_api=False):
-        return {
+    __table_args__ = (
+        # Registration form lists a camp's categories by name
+        db.Index('ix_categories_camp_name', 'camp_id', 'name'),
+    )
+
+    def to_dict(self, for_api=False, include_relations=True):
+        data = {
             'id': self.id,
             'name': self.name,
             'discount_percentage': self.discount_percentage,
             'discount_amount': self.discount_amount,
             'camp_id': self.camp_id,
             'is_default': self.is_default,
-            'registrations': [registration.to_dict(for_api=for_api) for registration in self.registrations]
         }
+        if include_relations:
+            data['registrations'] = [registration.to_dict(for_api=for_api) for registration in self.registrations]
+        return data
 
 
 class CustomField(BaseModel):
@@ -136,9 +171,14 @@ class CustomField(BaseModel):
                                   name='field_types'), nullable=False)
     is_required = db.Column(db.Boolean, default=False, nullable=False)
     options = db.Column(JSON)  # For dropdown/checkbox options
-    camp_id = db.Column(String(36), db.ForeignKey('camps.id'), nullable=False)
+    camp_id = db.Column(GUID, db.ForeignKey('camps.id', ondelete='CASCADE'), nullable=False)
     order = db.Column(db.Integer, default=0, nullable=False)
 
+    __table_args__ = (
+        # Registration form lists a camp's fields in display order
+        db.Index('ix_custom_fields_camp_order', 'camp_id', 'order', 'field_name'),
+    )
+
     def to_dict(self, for_api=False):
         return {
             'id': self.id,
@@ -154,7 +194,7 @@ class RegistrationLink(BaseModel):
     """Registration link model for category-specific links"""
     __tablename__ = 'registration_links'
     
-    camp_id = db.Column(String(36), db.ForeignKey('camps.id'), nullable=False)
+    camp_id = db.Column(GUID, db.ForeignKey('camps.id', ondelete='CASCADE'), nullable=False)
     link_token = db.Column(db.String(255), unique=True, nullable=False)
     name = db.Column(db.String(255), nullable=False)
     allowed_categories = db.Column(JSON)  # Array of category UUIDs
@@ -162,10 +202,16 @@ class RegistrationLink(BaseModel):
     expires_at = db.Column(db.DateTime)
     usage_limit = db.Column(db.Integer)
     usage_count = db.Column(db.Integer, default=0, nullable=False)
-    created_by = db.Column(String(36), db.ForeignKey('users.id'), nullable=False)
+    created_by = db.Column(GUID, db.ForeignKey('users.id'), nullable=False)
     
     # Relationships
-    registrations = db.relationship('Registration', backref='registration_link', lazy=True)
+    # See Church.registrations
+    registrations = db.relationship('Registration', backref='registration_link', lazy=True, passive_deletes=True)
+
+    __table_args__ = (
+        # Links are listed per camp, newest first; also serves camp_id lookups
+        db.Index('ix_registration_links_camp_created', 'camp_id', 'created_at'),
+    )
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -174,12 +220,22 @@ class RegistrationLink(BaseModel):
     
     def generate_token(self):
         """Generate unique token for registration link"""
-        import secrets
-        import string
         prefix = self.name.lower().replace(' ', '_')[:3] if self.name else 'reg'
-        suffix = ''.join(secrets.choice(string.ascii_lowercase + string.digits) for _ in range(12))
+        # 12 base32 chars (a-z, 2-7) from one urandom read, ~60 bits like the old 12-char loop
+        suffix = base64.b32encode(secrets.token_bytes(8)).decode('ascii')[:12].lower()
         return f"{prefix}_{suffix}"
     
+    @property
+    def allowed_categories_set(self):
+        """allowed_categories as a frozenset, rebuilt only when the column value is replaced"""
+        categories = self.allowed_categories
+        cached = self.__dict__.get('_allowed_categories_set')
+        if cached is None or cached[0] is not categories:
+            cached = (categories, frozenset(categories or ()))
+            self.__dict__['_allowed_categories_set'] = cached
+        return cached[1]
+    
+    @hybrid_method
     def is_valid(self):
         """Check if registration link is valid"""
         if not self.is_active:
@@ -190,8 +246,19 @@ class RegistrationLink(BaseModel):
             return False
         return True
 
-    def to_dict(self, for_api=False):
-        return {
+    @is_valid.expression
+    def is_valid(cls):
+        """SQL form of is_valid for WHERE clauses (a usage_limit of 0 means unlimited)"""
+        # Naive UTC, matching how the DateTime columns are stored
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return and_(
+            cls.is_active.is_(True),
+            or_(cls.expires_at.is_(None), cls.expires_at >= now),
+            or_(cls.usage_limit.is_(None), cls.usage_limit == 0, cls.usage_count < cls.usage_limit),
+        )
+
+    def to_dict(self, for_api=False, include_relations=True):
+        data = {
             'id': self.id,
             'camp_id': self.camp_id,
             'link_token': self.link_token,
@@ -202,8 +269,11 @@ class RegistrationLink(BaseModel):
             'usage_limit': self.usage_limit,
             'usage_count': self.usage_count,
             'created_by': self.created_by,
-            'registrations': [registration.to_dict(for_api=for_api) for registration in self.registrations]
         }
+        # API responses don't expose the link's registrations; skip loading them for those
+        if include_relations:
+            data['registrations'] = [registration.to_dict(for_api=for_api) for registration in self.registrations]
+        return data
 
 
 class Registration(BaseModel):
@@ -218,39 +288,48 @@ class Registration(BaseModel):
     phone_number = db.Column(db.String(20), nullable=False)
     emergency_contact_name = db.Column(db.String(255), nullable=False)
     emergency_contact_phone = db.Column(db.String(20), nullable=False)
-    church_id = db.Column(String(36), db.ForeignKey('churches.id'), nullable=False)
-    category_id = db.Column(String(36), db.ForeignKey('categories.id'), nullable=False)
+    church_id = db.Column(GUID, db.ForeignKey('churches.id'), nullable=False)
+    category_id = db.Column(GUID, db.ForeignKey('categories.id'), nullable=False)
     custom_field_responses = db.Column(JSON)
     total_amount = db.Column(db.Numeric(10, 2), nullable=False)
     has_paid = db.Column(db.Boolean, default=False, nullable=False)
     has_checked_in = db.Column(db.Boolean, default=False, nullable=False)
-    camp_id = db.Column(String(36), db.ForeignKey('camps.id'), nullable=False, index=True)
+    camp_id = db.Column(GUID, db.ForeignKey('camps.id', ondelete='CASCADE'), nullable=False, index=True)
     camper_code = db.Column(db.String(10), nullable=True, default=None)
-    registration_link_id = db.Column(String(36), db.ForeignKey('registration_links.id'))
-    registration_date = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    registration_link_id = db.Column(GUID, db.ForeignKey('registration_links.id'))
+    registration_date = db.Column(db.DateTime, server_default=utcnow(), nullable=False)
+    
+    __table_args__ = (
+        # Dashboard filters (unpaid / not checked in per camp) and per-church breakdowns
+        db.Index('ix_reg_camp_paid_checkin', 'camp_id', 'has_paid', 'has_checked_in'),
+        db.Index('ix_reg_camp_church', 'camp_id', 'church_id'),
+        # Registration lists and exports are ordered by registration date, newest first
+        db.Index('ix_reg_camp_date', 'camp_id', 'registration_date'),
+    )
     
     # Relationships
     # payments = db.relationship('Payment', backref='registration', lazy=True, cascade='all, delete-orphan')
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        if self.registration_date is None:
-            self.registration_date = datetime.now(timezone.utc)
+    @staticmethod
+    def compute_total_amount(base_fee, discount_amount=None, discount_percentage=None):
+        """Total for a base fee and category discount, in Decimal rounded to cents"""
+        base_fee = Decimal(base_fee)
+        if discount_amount and discount_amount > 0:
+            # Fixed amount discount
+            total = base_fee - Decimal(discount_amount)
+        elif discount_percentage and discount_percentage > 0:
+            # Percentage discount
+            total = base_fee * (1 - Decimal(discount_percentage) / 100)
+        else:
+            total = base_fee
+        return max(_ZERO, total).quantize(_CENTS, rounding=ROUND_HALF_UP)
     
     def calculate_total_amount(self):
         """Calculate total amount based on base fee and category discount"""
-        base_fee = float(self.camp.base_fee)
         category = self.category
-        
-        if category.discount_amount and category.discount_amount > 0:
-            # Fixed amount discount
-            return max(0, base_fee - float(category.discount_amount))
-        elif category.discount_percentage and category.discount_percentage > 0:
-            # Percentage discount
-            discount = base_fee * (float(category.discount_percentage) / 100)
-            return max(0, base_fee - discount)
-        
-        return base_fee
+        return self.compute_total_amount(
+            self.camp.base_fee, category.discount_amount, category.discount_percentage
+        )
 
     def to_dict(self, for_api=False):
         return {
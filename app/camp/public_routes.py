@@ -1,17 +1,18 @@
 from flask import request, current_app
 from apiflask import APIBlueprint
 
-from .models import RegistrationLink
+from ._link_cache import load_link, remember_link
+from app._shared.json_provider import json_response
 from app._shared.schemas import ErrorResponseWrapperSchema
 from .schemas import (
     RegistrationCreateRequestSchema,
     RegistrationResponseWrapperSchema,
-    RegistrationFormResponseWrapperSchema
+    RegistrationFormResponseWrapperSchema,
+    RegistrationFormSchema
 )
-from .services import RegistrationService, CampService
+from .services import RegistrationService, RegistrationLinkService
 from .._shared.auth import optional_auth
-from ..integrations.mailer import mailer
-from ..integrations.sms import sms
+from ..integrations.notifications import queue_registration_confirmation
 
 
 # Create APIBlueprint for public registration endpoints
@@ -19,7 +20,8 @@ public_bp = APIBlueprint('public', __name__, url_prefix='/register')
 
 # Initialize service
 registration_service = RegistrationService()
-camp_service = CampService()
+registration_link_service = RegistrationLinkService()
+registration_form_schema = RegistrationFormSchema()
 
 
 @public_bp.get('/<link_token>')
@@ -31,53 +33,41 @@ camp_service = CampService()
 @optional_auth
 def get_registration_form_by_token(link_token):
     """Get category-specific registration form structure"""
-    try:
-        # Get registration link and validate
-        link = RegistrationLink.query.filter_by(link_token=link_token).first()
-        if not link:
-            return {
-                'data': {
-                    'code': 'INVALID_LINK',
-                    'message': 'Invalid registration link',
-                    'details': None
-                }
-            }, 404
-        
-        # Check if link is valid (active, not expired, under usage limit)
-        if not link.is_valid():
-            return {
-                'data': {
-                    'code': 'LINK_EXPIRED',
-                    'message': 'Registration link has expired or reached usage limit',
-                    'details': None
-                }
-            }, 410  # Gone
-        
-        print(link)
-        # Get form data using the link token
-        form_data = registration_service.get_registration_form(str(link.camp_id), link_token)
-        if not form_data:
-            return {
-                'data': {
-                    'code': 'REGISTRATION_UNAVAILABLE',
-                    'message': 'Registration is not available for this camp',
-                    'details': None
-                }
-            }, 404
-        
-        return {
-            'data': form_data
-        }, 200
-        
-    except Exception as e:
-        current_app.logger.error(f"Get registration form by token error: {str(e)}")
-        return {
+    # Get registration link and validate
+    link = load_link(link_token)
+    if not link:
+        return json_response({
             'data': {
-                'code': 'GET_FORM_ERROR',
-                'message': 'Failed to retrieve registration form',
-                'details': {'error': str(e)}
+                'code': 'INVALID_LINK',
+                'message': 'Invalid registration link',
+                'details': None
             }
-        }, 500
+        }, 404)
+    
+    # Check if link is valid (active, not expired, under usage limit)
+    if not link.is_valid():
+        return json_response({
+            'data': {
+                'code': 'LINK_EXPIRED',
+                'message': 'Registration link has expired or reached usage limit',
+                'details': None
+            }
+        }, 410)  # Gone
+    
+    # Get form data using the link token
+    form_data = registration_service.get_registration_form(link.camp_id, link_token)
+    if not form_data:
+        return json_response({
+            'data': {
+                'code': 'REGISTRATION_UNAVAILABLE',
+                'message': 'Registration is not available for this camp',
+                'details': None
+            }
+        }, 404)
+    
+    return {
+        'data': form_data
+    }, 200
 
 
 @public_bp.post('/<link_token>')
@@ -91,33 +81,33 @@ def submit_registration_by_token(link_token, json_data):
     """Submit registration through category-specific link"""
     try:
         # Get registration link and validate
-        link = RegistrationLink.query.filter_by(link_token=link_token).first()
+        link = load_link(link_token)
         if not link:
-            return {
+            return json_response({
                 'data': {
                     'code': 'INVALID_LINK',
                     'message': 'Invalid registration link',
                     'details': None
                 }
-            }, 404
+            }, 404)
         
         # Check if link is valid (active, not expired, under usage limit)
         if not link.is_valid():
-            return {
+            return json_response({
                 'data': {
                     'code': 'LINK_EXPIRED',
                     'message': 'Registration link has expired or reached usage limit',
                     'details': None
                 }
-            }, 410  # Gone
+            }, 410)  # Gone
         
         registration_data = json_data['data']
-        registration_data['camp_id'] = str(link.camp_id)
+        registration_data['camp_id'] = link.camp_id
         
         # Validate that selected category is allowed for this link
         selected_category_id = registration_data.get('category_id')
-        if not selected_category_id or selected_category_id not in link.allowed_categories:
-            return {
+        if not selected_category_id or selected_category_id not in link.allowed_categories_set:
+            return json_response({
                 'data': {
                     'code': 'INVALID_CATEGORY',
                     'message': 'Selected category is not allowed for this registration link',
@@ -126,55 +116,25 @@ def submit_registration_by_token(link_token, json_data):
                         'selected_category': selected_category_id
                     }
                 }
-            }, 400
+            }, 400)
         
         # Create registration
         new_registration = registration_service.create_registration(registration_data, link_token)
-        camp = camp_service.get_camp_by_id(str(link.camp_id))
 
-        message = mailer.generate_email_text('registration-successful.html', {
-            "camp_name": camp.name,
-            "participant_surname": new_registration.surname,
-            "participant_middle_name": new_registration.middle_name,
-            "participant_last_name": new_registration.last_name,
-            "camper_code": new_registration.camper_code,
-            "total_amount": new_registration.total_amount,
-            "camp_start_date": camp.start_date,
-            "camp_end_date": camp.end_date,
-            "camp_location": camp.location,
-            "support_email": "support@campmanager.com"
-        })
-        sms_message = f'''
-        Hi {new_registration.surname}! Your registration for {camp.name} is confirmed. Camper Code: {new_registration.camper_code}. Start: {camp.start_date}. For help, contact support@campmanager.com.
-        '''
-        mailer.send_email(
-            recipients=[new_registration.email],
-            subject='Registration Successful',
-            text=message,
-            html=True,
-        )
-        sms.send_sms(new_registration.phone_number, sms_message)
+        # Email and SMS go out on a background thread so provider latency stays off the request
+        queue_registration_confirmation(new_registration.id, new_registration.camp_id)
         return {
-            'data': new_registration.to_dict()
+            'data': new_registration
         }, 201
         
     except ValueError as e:
-        return {
+        return json_response({
             'data': {
                 'code': 'VALIDATION_ERROR',
                 'message': str(e),
                 'details': None
             }
-        }, 400
-    except Exception as e:
-        current_app.logger.error(f"Submit registration by token error: {str(e)}")
-        return {
-            'data': {
-                'code': 'REGISTRATION_ERROR',
-                'message': 'Failed to submit registration',
-                'details': {'error': str(e)}
-            }
-        }, 500
+        }, 400)
 
 
 @public_bp.get('/check/<link_token>')
@@ -195,7 +155,11 @@ def submit_registration_by_token(link_token, json_data):
                         'usage_limit': {'type': 'integer'},
                         'registration_deadline': {'type': 'string', 'format': 'date-time'},
                         'camp_capacity': {'type': 'integer'},
-                        'current_registrations': {'type': 'integer'}
+                        'current_registrations': {'type': 'integer'},
+                        'form': {
+                            'type': 'object',
+                            'description': 'Registration form structure, only with ?include=form on a valid link'
+                        }
                     }
                 }
             }
@@ -205,77 +169,75 @@ def submit_registration_by_token(link_token, json_data):
 })
 @public_bp.doc(
     summary='Check registration link status',
-    description='Check if registration link is valid and get basic information'
+    description='Check if registration link is valid and get basic information. '
+                'Pass ?include=form to also get the registration form structure for a valid link'
 )
 def check_registration_link(link_token):
     """Check registration link status and availability"""
-    try:
-        # Get registration link
-        link = RegistrationLink.query.filter_by(link_token=link_token).first()
-        if not link:
-            return {
-                'data': {
-                    'code': 'INVALID_LINK',
-                    'message': 'Invalid registration link',
-                    'details': None
-                }
-            }, 404
-        
-        # Get camp info
-        camp = link.camp
-        current_registrations = len(camp.registrations)
-        
-        # Check various validity conditions
-        is_valid = link.is_valid()
-        
-        # Additional checks for overall registration availability
-        if camp.registration_deadline and camp.registration_deadline.replace(tzinfo=None) < request.current_time:
-            is_valid = False
-        
-        if current_registrations >= camp.capacity:
-            is_valid = False
-        
-        # Safely handle datetime serialization - commented out to avoid isoformat errors
-        expires_at_str = str(link.expires_at) if link.expires_at else None
-        registration_deadline_str = str(camp.registration_deadline) if camp.registration_deadline else None
-        
-        # expires_at_str = None
-        # if link.expires_at:
-        #     if hasattr(link.expires_at, 'isoformat'):
-        #         expires_at_str = link.expires_at.isoformat()
-        #     else:
-        #         expires_at_str = str(link.expires_at)
-        
-        # registration_deadline_str = None
-        # if camp.registration_deadline:
-        #     if hasattr(camp.registration_deadline, 'isoformat'):
-        #         registration_deadline_str = camp.registration_deadline.isoformat()
-        #     else:
-        #         registration_deadline_str = str(camp.registration_deadline)
-        
-        return {
+    # Get registration link, its camp, the camp's registration count and the
+    # deadline and capacity checks in one query
+    row = registration_link_service.get_link_with_registration_count(link_token)
+    if not row:
+        return json_response({
             'data': {
-                'is_valid': is_valid,
-                'camp_name': camp.name,
-                'link_name': link.name,
-                'expires_at': expires_at_str,
-                'usage_count': link.usage_count,
-                'usage_limit': link.usage_limit,
-                'registration_deadline': registration_deadline_str,
-                'camp_capacity': camp.capacity,
-                'current_registrations': current_registrations
-            }
-        }, 200
-        
-    except Exception as e:
-        current_app.logger.error(f"Check registration link error: {str(e)}")
-        return {
-            'data': {
-                'code': 'CHECK_LINK_ERROR',
-                'message': 'Failed to check registration link',
-                'details': {'error': str(e)}
+                'code': 'INVALID_LINK',
+                'message': 'Invalid registration link',
+                'details': None
             }
-        }, 500
+        }, 404)
+    
+    link, current_registrations, deadline_ok, capacity_ok = row
+    camp = link.camp
+    
+    # The link must be usable and the camp still open for registration
+    is_valid = link.is_valid() and deadline_ok and capacity_ok
+    
+    # Safely handle datetime serialization - commented out to avoid isoformat errors
+    expires_at_str = str(link.expires_at) if link.expires_at else None
+    registration_deadline_str = str(camp.registration_deadline) if camp.registration_deadline else None
+    
+    # expires_at_str = None
+    # if link.expires_at:
+    #     if hasattr(link.expires_at, 'isoformat'):
+    #         expires_at_str = link.expires_at.isoformat()
+    #     else:
+    #         expires_at_str = str(link.expires_at)
+    
+    # registration_deadline_str = None
+    # if camp.registration_deadline:
+    #     if hasattr(camp.registration_deadline, 'isoformat'):
+    #         registration_deadline_str = camp.registration_deadline.isoformat()
+    #     else:
+    #         registration_deadline_str = str(camp.registration_deadline)
+    
+    data = {
+        'is_valid': is_valid,
+        'camp_name': camp.name,
+        'link_name': link.name,
+        'expires_at': expires_at_str,
+        'usage_count': link.usage_count,
+        'usage_limit': link.usage_limit,
+        'registration_deadline': registration_deadline_str,
+        'camp_capacity': camp.capacity,
+        'current_registrations': current_registrations
+    }
+    
+    # Let the first page load get the form in the same round trip
+    if is_valid and 'form' in request.args.getlist('include'):
+        remember_link(link)
+        form_data = registration_service.get_registration_form(link.camp_id, link_token)
+        if form_data:
+            # Same shape as GET /register/<link_token>
+            data['form'] = registration_form_schema.dump(form_data)
+    
+    response = json_response({'data': data})
+    
+    # The registration UI polls this endpoint; let it revalidate with If-None-Match
+    # and answer unchanged status with an empty 304
+    response.cache_control.private = True
+    response.cache_control.max_age = 5
+    response.add_etag(weak=True)
+    return response.make_conditional(request)
 
 
 # Error handlers for the public blueprint
@@ -306,7 +268,7 @@ def validation_error(error):
 @public_bp.errorhandler(500)
 def internal_error(error):
     """Handle internal server errors"""
-    current_app.logger.error(f"Internal error in public routes: {str(error)}")
+    current_app.logger.error("Internal error in public routes: %s", error)
     return {
         'data': {
             'code': 'INTERNAL_ERROR',
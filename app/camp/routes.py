@@ -1,6 +1,9 @@
-from flask import request, current_app
+from datetime import datetime, timezone
+from typing import Tuple
+from flask import Response, request, current_app
 from apiflask import APIBlueprint
 from flask_jwt_extended import jwt_required
+from werkzeug.http import generate_etag, http_date
 
 from .models import Camp, Church, Category, CustomField, RegistrationLink, Registration
 from .schemas import (
@@ -43,9 +46,11 @@ from .schemas import (
     RegistrationListResponseWrapperSchema,
     RegistrationFormResponseWrapperSchema,
 )
+from app._shared.json_provider import json_response, ndjson_response, rows_response
 from app._shared.schemas import SuccessMessageWrapperSchema
+from ._form_cache import get_categories_body, get_general_form_body
 from .services import CampService, ChurchService, CategoryService, CustomFieldService, RegistrationLinkService, RegistrationService
-from .._shared.auth import token_required, role_required, camp_owner_required, optional_auth, get_current_user
+from .._shared.auth import authorize, optional_auth, get_current_user_id
 
 
 # Create APIBlueprint for camp management
@@ -59,6 +64,86 @@ custom_field_service = CustomFieldService()
 registration_link_service = RegistrationLinkService()
 registration_service = RegistrationService()
 
+# The general registration form and the categories list are rendered once per camp and served from the form cache
+registration_form_response_schema = RegistrationFormResponseWrapperSchema()
+category_list_response_schema = CategoryListResponseWrapperSchema()
+
+
+def _error_body(code: str, message: str, details=None) -> dict:
+    """Build the {'data': error} envelope shared by every camp route error"""
+    return {'data': {'code': code, 'message': message, 'details': details}}
+
+
+# Fixed error bodies are built once at import and only serialized per request
+_CAMP_NOT_FOUND = _error_body('CAMP_NOT_FOUND', 'Camp not found')
+_REGISTRATION_UNAVAILABLE = _error_body('CAMP_NOT_FOUND', 'Camp not found or registration not available')
+_REGISTRATION_NOT_FOUND = _error_body('REGISTRATION_NOT_FOUND', 'Registration not found')
+_LINK_NOT_FOUND = _error_body('LINK_NOT_FOUND', 'Registration link not found')
+_CUSTOM_FIELD_NOT_FOUND = _error_body('CUSTOM_FIELD_NOT_FOUND', 'Custom field not found')
+_CHURCH_NOT_FOUND = _error_body('CHURCH_NOT_FOUND', 'Church not found')
+_CATEGORY_NOT_FOUND = _error_body('CATEGORY_NOT_FOUND', 'Category not found')
+_CANCEL_FAILED = _error_body('CANCEL_FAILED', 'Failed to cancel registration')
+_DELETE_CATEGORY_FAILED = _error_body('DELETE_FAILED', 'Failed to delete category')
+_DELETE_CUSTOM_FIELD_FAILED = _error_body('DELETE_FAILED', 'Failed to delete custom field')
+_DELETE_LINK_FAILED = _error_body('DELETE_FAILED', 'Failed to delete registration link')
+_INTERNAL_ERROR = _error_body('INTERNAL_ERROR', 'Internal server error')
+
+
+def _message_body(message: str) -> dict:
+    """Build the {'data': {'message': ...}} envelope of a successful action without a resource"""
+    return {'data': {'message': message}}
+
+
+# Fixed success bodies skip SuccessMessageWrapperSchema; they already have its shape
+_REGISTRATION_CANCELLED = _message_body('Registration cancelled successfully')
+_LINK_DELETED = _message_body('Registration link deleted successfully')
+_CUSTOM_FIELD_DELETED = _message_body('Custom field deleted successfully')
+_CAMP_DELETED = _message_body('Camp deleted successfully')
+_CHURCH_REMOVED = _message_body('Church removed successfully')
+
+
+# Errors are returned as ready Responses so the routes' success output schemas don't dump them
+def _validation_error(e: Exception) -> Response:
+    return json_response(_error_body('VALIDATION_ERROR', str(e)), 400)
+
+
+# Last-Modified revalidation for single-resource GETs; If-None-Match takes precedence (RFC 9110)
+def _revalidating_by_date() -> bool:
+    return request.if_modified_since is not None and not request.if_none_match
+
+
+def _not_modified_since(updated_at: datetime) -> bool:
+    """Whether the client's copy (If-Modified-Since) is still current; HTTP dates have 1s precision"""
+    return updated_at.replace(microsecond=0, tzinfo=timezone.utc) <= request.if_modified_since
+
+
+def _not_modified() -> Response:
+    response = current_app.response_class(status=304)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
+def _last_modified(updated_at: datetime) -> dict:
+    return {'Last-Modified': http_date(updated_at)}
+
+
+def _tagged_body(payload) -> Tuple[bytes, str]:
+    """Serialize a response payload for the form cache, with the ETag add_etag would give it"""
+    body = current_app.json.dumps(payload).encode()
+    return body, generate_etag(body)
+
+
+def _cached_body_response(tagged_body: Tuple[bytes, str]) -> Response:
+    """Answer from a cached (body, ETag), with a 304 when the client's copy matches"""
+    body, etag = tagged_body
+    if request.if_none_match.contains_weak(etag):
+        response = _not_modified()
+    else:
+        response = current_app.response_class(body, mimetype='application/json')
+    response.set_etag(etag, weak=True)
+    return response
+
 
 # =============================================================================
 # CAMP ROUTES
@@ -70,27 +155,12 @@ registration_service = RegistrationService()
     summary='Get camps for current user',
     description='Retrieve all camps managed by the authenticated user'
 )
-@token_required
-@role_required('camp_manager')
+@authorize('camp_manager')
 def get_camps():
     """Get camps for current user"""
-    try:
-        user = get_current_user()
-        camps = camp_service.get_user_camps(str(user.id))
-        
-        return {
-            'data': [camp.to_dict() for camp in camps]
-        }, 200
-        
-    except Exception as e:
-        current_app.logger.error(f"Get camps error: {str(e)}")
-        return {
-            'data': {
-                'code': 'GET_CAMPS_ERROR',
-                'message': 'Failed to retrieve camps',
-                'details': {'error': str(e)}
-            }
-        }, 500
+    # Column rows already match the list schemas; serialize them without a schema dump
+    return rows_response(camp_service.get_user_camps(get_current_user_id(), as_dict=True))
+
 
 @camp_bp.post('/<camp_id>/custom-fields')
 @camp_bp.input(CustomFieldCreateRequestSchema)
@@ -99,8 +169,7 @@ def get_camps():
     summary='Create custom field',
     description='Create a new custom field for a camp'
 )
-@token_required
-@camp_owner_required()
+@authorize(camp_param='camp_id')
 def create_custom_field(camp_id, json_data):
     """Create custom field"""
     try:
@@ -110,73 +179,31 @@ def create_custom_field(camp_id, json_data):
         new_field = custom_field_service.create_custom_field(field_data)
         
         return {
-            'data': new_field.to_dict()
+            'data': new_field
         }, 201
         
     except ValueError as e:
-        return {
-            'data': {
-                'code': 'VALIDATION_ERROR',
-                'message': str(e),
-                'details': None
-            }
-        }, 400
-    except Exception as e:
-        current_app.logger.error(f"Create custom field error: {str(e)}")
-        return {
-            'data': {
-                'code': 'CREATE_CUSTOM_FIELD_ERROR',
-                'message': 'Failed to create custom field',
-                'details': {'error': str(e)}
-            }
-        }, 500
-        
+        return _validation_error(e)
+
+
 @camp_bp.get('/registration-links/<link_id>')
 @camp_bp.output(RegistrationLinkResponseWrapperSchema)
 @camp_bp.doc(
     summary='Get registration link details',
     description='Get details of a specific registration link'
 )
-@token_required
+@authorize(resource='registration_link')
 def get_registration_link(link_id):
     """Get registration link details"""
-    try:
-        # Verify user owns the camp that owns this registration link
-        link = registration_link_service.get_registration_link_by_id(link_id)
-        if not link:
-            return {
-                'data': {
-                    'code': 'LINK_NOT_FOUND',
-                    'message': 'Registration link not found',
-                    'details': None
-                }
-            }, 404
-        
-        # Check if user owns the camp
-        user = get_current_user()
-
-        # if str(link.camp.camp_manager_id) != str(user.id):
-        #     return {
-        #         'data': {
-        #             'code': 'AUTHORIZATION_ERROR',
-        #             'message': 'Access denied',
-        #             'details': None
-        #         }
-        #     }, 403
-        
-        return {
-            'data': link.to_dict()
-        }, 200
-        
-    except Exception as e:
-        current_app.logger.error(f"Get registration link error: {str(e)}")
-        return {
-            'data': {
-                'code': 'GET_LINK_ERROR',
-                'message': 'Failed to retrieve registration link',
-                'details': {'error': str(e)}
-            }
-        }, 500
+    link = registration_link_service.get_registration_link_by_id(link_id)
+    if not link:
+        return json_response(_LINK_NOT_FOUND, 404)
+    
+    return {
+        'data': link
+    }, 200
+
+
 # =============================================================================
 # INDIVIDUAL REGISTRATION ROUTES
 # =============================================================================
@@ -187,45 +214,22 @@ def get_registration_link(link_id):
     summary='Get registration details',
     description='Get details of a specific registration'
 )
-@token_required
+@authorize(resource='registration')
 def get_registration(registration_id):
     """Get registration details"""
-    try:
-        # Verify user owns the camp that owns this registration
-        registration = registration_service.get_registration_by_id(registration_id)
-        if not registration:
-            return {
-                'data': {
-                    'code': 'REGISTRATION_NOT_FOUND',
-                    'message': 'Registration not found',
-                    'details': None
-                }
-            }, 404
-        
-        # Check if user owns the camp
-        user = get_current_user()
-        # if str(registration.camp.camp_manager_id) != str(user.id):
-        #     return {
-        #         'data': {
-        #             'code': 'AUTHORIZATION_ERROR',
-        #             'message': 'Access denied',
-        #             'details': None
-        #         }
-        #     }, 403
-        
-        return {
-            'data': registration.to_dict()
-        }, 200
-        
-    except Exception as e:
-        current_app.logger.error(f"Get registration error: {str(e)}")
-        return {
-            'data': {
-                'code': 'GET_REGISTRATION_ERROR',
-                'message': 'Failed to retrieve registration',
-                'details': {'error': str(e)}
-            }
-        }, 500
+    # A date-only revalidation is answered from updated_at without loading the registration
+    if _revalidating_by_date():
+        updated_at = registration_service.get_registration_updated_at(registration_id)
+        if updated_at is not None and _not_modified_since(updated_at):
+            return _not_modified()
+
+    registration = registration_service.get_registration_by_id(registration_id)
+    if not registration:
+        return json_response(_REGISTRATION_NOT_FOUND, 404)
+    
+    return {
+        'data': registration
+    }, 200, _last_modified(registration.updated_at)
 
 
 @camp_bp.put('/registrations/<registration_id>')
@@ -235,56 +239,21 @@ def get_registration(registration_id):
     summary='Update registration',
     description='Update registration details'
 )
-@token_required
+@authorize(resource='registration')
 def update_registration(registration_id, json_data):
     """Update registration"""
     try:
-        # Verify user owns the camp that owns this registration
-        registration = registration_service.get_registration_by_id(registration_id)
-        if not registration:
-            return {
-                'data': {
-                    'code': 'REGISTRATION_NOT_FOUND',
-                    'message': 'Registration not found',
-                    'details': None
-                }
-            }, 404
-        
-        # Check if user owns the camp
-        user = get_current_user()
-        # if str(registration.camp.camp_manager_id) != str(user.id):
-        #     return {
-        #         'data': {
-        #             'code': 'AUTHORIZATION_ERROR',
-        #             'message': 'Access denied',
-        #             'details': None
-        #         }
-        #     }, 403
-        
         update_data = json_data['data']
         updated_registration = registration_service.update_registration(registration_id, update_data)
+        if not updated_registration:
+            return json_response(_REGISTRATION_NOT_FOUND, 404)
         
         return {
-            'data': updated_registration.to_dict()
+            'data': updated_registration
         }, 200
         
     except ValueError as e:
-        return {
-            'data': {
-                'code': 'VALIDATION_ERROR',
-                'message': str(e),
-                'details': None
-            }
-        }, 400
-    except Exception as e:
-        current_app.logger.error(f"Update registration error: {str(e)}")
-        return {
-            'data': {
-                'code': 'UPDATE_REGISTRATION_ERROR',
-                'message': 'Failed to update registration',
-                'details': {'error': str(e)}
-            }
-        }, 500
+        return _validation_error(e)
 
 
 @camp_bp.delete('/registrations/<registration_id>')
@@ -293,57 +262,14 @@ def update_registration(registration_id, json_data):
     summary='Cancel registration',
     description='Cancel/delete a registration'
 )
-@token_required
+@authorize(resource='registration')
 def cancel_registration(registration_id):
     """Cancel registration"""
-    try:
-        # Verify user owns the camp that owns this registration
-        registration = registration_service.get_registration_by_id(registration_id)
-        if not registration:
-            return {
-                'data': {
-                    'code': 'REGISTRATION_NOT_FOUND',
-                    'message': 'Registration not found',
-                    'details': None
-                }
-            }, 404
-        
-        # Check if user owns the camp
-        user = get_current_user()
-        # if str(registration.camp.camp_manager_id) != str(user.id):
-        #     return {
-        #         'data': {
-        #             'code': 'AUTHORIZATION_ERROR',
-        #             'message': 'Access denied',
-        #             'details': None
-        #         }
-        #     }, 403
-        
-        success = registration_service.cancel_registration(registration_id)
-        if not success:
-            return {
-                'data': {
-                    'code': 'CANCEL_FAILED',
-                    'message': 'Failed to cancel registration',
-                    'details': None
-                }
-            }, 400
-        
-        return {
-            'data': {
-                'message': 'Registration cancelled successfully'
-            }
-        }, 200
-        
-    except Exception as e:
-        current_app.logger.error(f"Cancel registration error: {str(e)}")
-        return {
-            'data': {
-                'code': 'CANCEL_REGISTRATION_ERROR',
-                'message': 'Failed to cancel registration',
-                'details': {'error': str(e)}
-            }
-        }, 500
+    success = registration_service.cancel_registration(registration_id)
+    if not success:
+        return json_response(_CANCEL_FAILED, 400)
+    
+    return json_response(_REGISTRATION_CANCELLED)
 
 
 @camp_bp.patch('/registrations/<registration_id>/payment')
@@ -367,56 +293,21 @@ def cancel_registration(registration_id):
     summary='Update payment status',
     description='Mark registration as paid/unpaid'
 )
-@token_required
+@authorize(resource='registration')
 def update_payment_status(registration_id, json_data):
     """Update payment status"""
     try:
-        # Verify user owns the camp that owns this registration
-        registration = registration_service.get_registration_by_id(registration_id)
-        if not registration:
-            return {
-                'data': {
-                    'code': 'REGISTRATION_NOT_FOUND',
-                    'message': 'Registration not found',
-                    'details': None
-                }
-            }, 404
-        
-        # Check if user owns the camp
-        user = get_current_user()
-        # if str(registration.camp.camp_manager_id) != str(user.id):
-        #     return {
-        #         'data': {
-        #             'code': 'AUTHORIZATION_ERROR',
-        #             'message': 'Access denied',
-        #             'details': None
-        #         }
-        #     }, 403
-        
         payment_data = json_data['data']
         updated_registration = registration_service.update_payment_status(registration_id, payment_data)
+        if not updated_registration:
+            return json_response(_REGISTRATION_NOT_FOUND, 404)
         
         return {
-            'data': updated_registration.to_dict()
+            'data': updated_registration
         }, 200
         
     except ValueError as e:
-        return {
-            'data': {
-                'code': 'VALIDATION_ERROR',
-                'message': str(e),
-                'details': None
-            }
-        }, 400
-    except Exception as e:
-        current_app.logger.error(f"Update payment status error: {str(e)}")
-        return {
-            'data': {
-                'code': 'UPDATE_PAYMENT_ERROR',
-                'message': 'Failed to update payment status',
-                'details': {'error': str(e)}
-            }
-        }, 500
+        return _validation_error(e)
 
 
 @camp_bp.patch('/registrations/<registration_id>/checkin')
@@ -438,56 +329,21 @@ def update_payment_status(registration_id, json_data):
     summary='Update check-in status',
     description='Mark registration as checked in/out'
 )
-@token_required
+@authorize(resource='registration')
 def update_checkin_status(registration_id, json_data):
     """Update check-in status"""
     try:
-        # Verify user owns the camp that owns this registration
-        registration = registration_service.get_registration_by_id(registration_id)
-        if not registration:
-            return {
-                'data': {
-                    'code': 'REGISTRATION_NOT_FOUND',
-                    'message': 'Registration not found',
-                    'details': None
-                }
-            }, 404
-        
-        # Check if user owns the camp
-        user = get_current_user()
-        # if str(registration.camp.camp_manager_id) != str(user.id):
-        #     return {
-        #         'data': {
-        #             'code': 'AUTHORIZATION_ERROR',
-        #             'message': 'Access denied',
-        #             'details': None
-        #         }
-        #     }, 403
-        
         checkin_data = json_data['data']
         updated_registration = registration_service.update_checkin_status(registration_id, checkin_data)
+        if not updated_registration:
+            return json_response(_REGISTRATION_NOT_FOUND, 404)
         
         return {
-            'data': updated_registration.to_dict()
+            'data': updated_registration
         }, 200
         
     except ValueError as e:
-        return {
-            'data': {
-                'code': 'VALIDATION_ERROR',
-                'message': str(e),
-                'details': None
-            }
-        }, 400
-    except Exception as e:
-        current_app.logger.error(f"Update check-in status error: {str(e)}")
-        return {
-            'data': {
-                'code': 'UPDATE_CHECKIN_ERROR',
-                'message': 'Failed to update check-in status',
-                'details': {'error': str(e)}
-            }
-        }, 500
+        return _validation_error(e)
 
 
 @camp_bp.put('/registration-links/<link_id>')
@@ -497,56 +353,21 @@ def update_checkin_status(registration_id, json_data):
     summary='Update registration link',
     description='Update registration link details'
 )
-@token_required
+@authorize(resource='registration_link')
 def update_registration_link(link_id, json_data):
     """Update registration link"""
     try:
-        # Verify user owns the camp that owns this registration link
-        link = registration_link_service.get_registration_link_by_id(link_id)
-        if not link:
-            return {
-                'data': {
-                    'code': 'LINK_NOT_FOUND',
-                    'message': 'Registration link not found',
-                    'details': None
-                }
-            }, 404
-        
-        # Check if user owns the camp
-        user = get_current_user()
-        # if str(link.camp.camp_manager_id) != str(user.id):
-        #     return {
-        #         'data': {
-        #             'code': 'AUTHORIZATION_ERROR',
-        #             'message': 'Access denied',
-        #             'details': None
-        #         }
-        #     }, 403
-        
         update_data = json_data['data']
         updated_link = registration_link_service.update_registration_link(link_id, update_data)
+        if not updated_link:
+            return json_response(_LINK_NOT_FOUND, 404)
         
         return {
-            'data': updated_link.to_dict()
+            'data': updated_link
         }, 200
         
     except ValueError as e:
-        return {
-            'data': {
-                'code': 'VALIDATION_ERROR',
-                'message': str(e),
-                'details': None
-            }
-        }, 400
-    except Exception as e:
-        current_app.logger.error(f"Update registration link error: {str(e)}")
-        return {
-            'data': {
-                'code': 'UPDATE_LINK_ERROR',
-                'message': 'Failed to update registration link',
-                'details': {'error': str(e)}
-            }
-        }, 500
+        return _validation_error(e)
 
 
 @camp_bp.delete('/registration-links/<link_id>')
@@ -555,57 +376,18 @@ def update_registration_link(link_id, json_data):
     summary='Delete registration link',
     description='Delete registration link'
 )
-@token_required
+@authorize(resource='registration_link')
 def delete_registration_link(link_id):
     """Delete registration link"""
     try:
-        # Verify user owns the camp that owns this registration link
-        link = registration_link_service.get_registration_link_by_id(link_id)
-        if not link:
-            return {
-                'data': {
-                    'code': 'LINK_NOT_FOUND',
-                    'message': 'Registration link not found',
-                    'details': None
-                }
-            }, 404
-        
-        # Check if user owns the camp
-        user = get_current_user()
-        # if str(link.camp.camp_manager_id) != str(user.id):
-        #     return {
-        #         'data': {
-        #             'code': 'AUTHORIZATION_ERROR',
-        #             'message': 'Access denied',
-        #             'details': None
-        #         }
-        #     }, 403
-        
         success = registration_link_service.delete_registration_link(link_id)
         if not success:
-            return {
-                'data': {
-                    'code': 'DELETE_FAILED',
-                    'message': 'Failed to delete registration link',
-                    'details': None
-                }
-            }, 400
+            return json_response(_DELETE_LINK_FAILED, 400)
         
-        return {
-            'data': {
-                'message': 'Registration link deleted successfully'
-            }
-        }, 200
+        return json_response(_LINK_DELETED)
         
-    except Exception as e:
-        current_app.logger.error(f"Delete registration link error: {str(e)}")
-        return {
-            'data': {
-                'code': 'DELETE_LINK_ERROR',
-                'message': 'Failed to delete registration link',
-                'details': {'error': str(e)}
-            }
-        }, 500
+    except ValueError as e:
+        return _validation_error(e)
 
 
 @camp_bp.patch('/registration-links/<link_id>/toggle')
@@ -614,47 +396,16 @@ def delete_registration_link(link_id):
     summary='Toggle registration link status',
     description='Activate or deactivate registration link'
 )
-@token_required
+@authorize(resource='registration_link')
 def toggle_registration_link(link_id):
     """Toggle registration link active status"""
-    try:
-        # Verify user owns the camp that owns this registration link
-        link = registration_link_service.get_registration_link_by_id(link_id)
-        if not link:
-            return {
-                'data': {
-                    'code': 'LINK_NOT_FOUND',
-                    'message': 'Registration link not found',
-                    'details': None
-                }
-            }, 404
-        
-        # Check if user owns the camp
-        user = get_current_user()
-        # if str(link.camp.camp_manager_id) != str(user.id):
-        #     return {
-        #         'data': {
-        #             'code': 'AUTHORIZATION_ERROR',
-        #             'message': 'Access denied',
-        #             'details': None
-        #         }
-        #     }, 403
-        
-        updated_link = registration_link_service.toggle_registration_link(link_id)
-        
-        return {
-            'data': updated_link.to_dict()
-        }, 200
-        
-    except Exception as e:
-        current_app.logger.error(f"Toggle registration link error: {str(e)}")
-        return {
-            'data': {
-                'code': 'TOGGLE_LINK_ERROR',
-                'message': 'Failed to toggle registration link',
-                'details': {'error': str(e)}
-            }
-        }, 500
+    updated_link = registration_link_service.toggle_registration_link(link_id)
+    if not updated_link:
+        return json_response(_LINK_NOT_FOUND, 404)
+    
+    return {
+        'data': updated_link
+    }, 200
 
 
 @camp_bp.put('/custom-fields/<field_id>')
@@ -664,56 +415,21 @@ def toggle_registration_link(link_id):
     summary='Update custom field',
     description='Update custom field details'
 )
-@token_required
+@authorize(resource='custom_field')
 def update_custom_field(field_id, json_data):
     """Update custom field"""
     try:
-        # Verify user owns the camp that owns this custom field
-        custom_field = custom_field_service.get_custom_field_by_id(field_id)
-        if not custom_field:
-            return {
-                'data': {
-                    'code': 'CUSTOM_FIELD_NOT_FOUND',
-                    'message': 'Custom field not found',
-                    'details': None
-                }
-            }, 404
-        
-        # Check if user owns the camp
-        user = get_current_user()
-        # if str(custom_field.camp.camp_manager_id) != str(user.id):
-        #     return {
-        #         'data': {
-        #             'code': 'AUTHORIZATION_ERROR',
-        #             'message': 'Access denied',
-        #             'details': None
-        #         }
-        #     }, 403
-        
         update_data = json_data['data']
         updated_field = custom_field_service.update_custom_field(field_id, update_data)
+        if not updated_field:
+            return json_response(_CUSTOM_FIELD_NOT_FOUND, 404)
         
         return {
-            'data': updated_field.to_dict()
+            'data': updated_field
         }, 200
         
     except ValueError as e:
-        return {
-            'data': {
-                'code': 'VALIDATION_ERROR',
-                'message': str(e),
-                'details': None
-            }
-        }, 400
-    except Exception as e:
-        current_app.logger.error(f"Update custom field error: {str(e)}")
-        return {
-            'data': {
-                'code': 'UPDATE_CUSTOM_FIELD_ERROR',
-                'message': 'Failed to update custom field',
-                'details': {'error': str(e)}
-            }
-        }, 500
+        return _validation_error(e)
 
 
 @camp_bp.delete('/custom-fields/<field_id>')
@@ -722,57 +438,14 @@ def update_custom_field(field_id, json_data):
     summary='Delete custom field',
     description='Delete custom field from camp'
 )
-@token_required
+@authorize(resource='custom_field')
 def delete_custom_field(field_id):
     """Delete custom field"""
-    try:
-        # Verify user owns the camp that owns this custom field
-        custom_field = custom_field_service.get_custom_field_by_id(field_id)
-        if not custom_field:
-            return {
-                'data': {
-                    'code': 'CUSTOM_FIELD_NOT_FOUND',
-                    'message': 'Custom field not found',
-                    'details': None
-                }
-            }, 404
-        
-        # Check if user owns the camp
-        user = get_current_user()
-        # if str(custom_field.camp.camp_manager_id) != str(user.id):
-        #     return {
-        #         'data': {
-        #             'code': 'AUTHORIZATION_ERROR',
-        #             'message': 'Access denied',
-        #             'details': None
-        #         }
-        #     }, 403
-        
-        success = custom_field_service.delete_custom_field(field_id)
-        if not success:
-            return {
-                'data': {
-                    'code': 'DELETE_FAILED',
-                    'message': 'Failed to delete custom field',
-                    'details': None
-                }
-            }, 400
-        
-        return {
-            'data': {
-                'message': 'Custom field deleted successfully'
-            }
-        }, 200
-        
-    except Exception as e:
-        current_app.logger.error(f"Delete custom field error: {str(e)}")
-        return {
-            'data': {
-                'code': 'DELETE_CUSTOM_FIELD_ERROR',
-                'message': 'Failed to delete custom field',
-                'details': {'error': str(e)}
-            }
-        }, 500
+    success = custom_field_service.delete_custom_field(field_id)
+    if not success:
+        return json_response(_DELETE_CUSTOM_FIELD_FAILED, 400)
+    
+    return json_response(_CUSTOM_FIELD_DELETED)
 
 
 @camp_bp.post('')
@@ -782,41 +455,23 @@ def delete_custom_field(field_id):
     summary='Create a new camp',
     description='Create a new camp for the authenticated camp manager'
 )
-@token_required
-@role_required('camp_manager')
+@authorize('camp_manager')
 def create_camp(json_data):
     """Create a new camp"""
     try:
-        user = get_current_user()
         camp_data = json_data['data']
         
         # Add camp manager ID to camp data
-        camp_data['camp_manager_id'] = str(user.id)
+        camp_data['camp_manager_id'] = get_current_user_id()
         
         new_camp = camp_service.create_camp(camp_data)
         
         return {
-            'data': new_camp.to_dict()
+            'data': new_camp
         }, 201
         
     except ValueError as e:
-        return {
-            'data': {
-                'code': 'VALIDATION_ERROR',
-                'message': str(e),
-                'details': None
-            }
-        }, 400
-    except Exception as e:
-        print(e)
-        current_app.logger.error(f"Create camp error: {str(e)}")
-        return {
-            'data': {
-                'code': 'CREATE_CAMP_ERROR',
-                'message': 'Failed to create camp',
-                'details': {'error': str(e)}
-            }
-        }, 500
+        return _validation_error(e)
 
 
 @camp_bp.get('/<camp_id>')
@@ -825,35 +480,23 @@ def create_camp(json_data):
     summary='Get camp details',
     description='Get details of a specific camp'
 )
-@token_required
-@camp_owner_required()
+@authorize(camp_param='camp_id')
 def get_camp(camp_id):
     """Get camp details"""
-    try:
-        camp = camp_service.get_camp_by_id(camp_id)
-        
-        if not camp:
-            return {
-                'data': {
-                    'code': 'CAMP_NOT_FOUND',
-                    'message': 'Camp not found',
-                    'details': None
-                }
-            }, 404
-        
-        return {
-            'data': camp.to_dict()
-        }, 200
-        
-    except Exception as e:
-        current_app.logger.error(f"Get camp error: {str(e)}")
-        return {
-            'data': {
-                'code': 'GET_CAMP_ERROR',
-                'message': 'Failed to retrieve camp',
-                'details': {'error': str(e)}
-            }
-        }, 500
+    # A date-only revalidation is answered from updated_at without loading the camp
+    if _revalidating_by_date():
+        updated_at = camp_service.get_camp_updated_at(camp_id)
+        if updated_at is not None and _not_modified_since(updated_at):
+            return _not_modified()
+
+    camp = camp_service.get_camp_by_id(camp_id)
+    
+    if not camp:
+        return json_response(_CAMP_NOT_FOUND, 404)
+    
+    return {
+        'data': camp
+    }, 200, _last_modified(camp.updated_at)
 
 
 @camp_bp.put('/<camp_id>')
@@ -863,8 +506,7 @@ def get_camp(camp_id):
     summary='Update camp',
     description='Update details of a specific camp'
 )
-@token_required
-@camp_owner_required()
+@authorize(camp_param='camp_id')
 def update_camp(camp_id, json_data):
     """Update camp details"""
     try:
@@ -873,35 +515,14 @@ def update_camp(camp_id, json_data):
         updated_camp = camp_service.update_camp(camp_id, update_data)
         
         if not updated_camp:
-            return {
-                'data': {
-                    'code': 'CAMP_NOT_FOUND',
-                    'message': 'Camp not found',
-                    'details': None
-                }
-            }, 404
+            return json_response(_CAMP_NOT_FOUND, 404)
         
         return {
-            'data': updated_camp.to_dict()
+            'data': updated_camp
         }, 200
         
     except ValueError as e:
-        return {
-            'data': {
-                'code': 'VALIDATION_ERROR',
-                'message': str(e),
-                'details': None
-            }
-        }, 400
-    except Exception as e:
-        current_app.logger.error(f"Update camp error: {str(e)}")
-        return {
-            'data': {
-                'code': 'UPDATE_CAMP_ERROR',
-                'message': 'Failed to update camp',
-                'details': {'error': str(e)}
-            }
-        }, 500
+        return _validation_error(e)
 
 
 @camp_bp.delete('/<camp_id>')
@@ -910,37 +531,15 @@ def update_camp(camp_id, json_data):
     summary='Delete camp',
     description='Delete a specific camp and all related data'
 )
-@token_required
-@camp_owner_required()
+@authorize(camp_param='camp_id')
 def delete_camp(camp_id):
     """Delete camp"""
-    try:
-        success = camp_service.delete_camp(camp_id)
-        
-        if not success:
-            return {
-                'data': {
-                    'code': 'CAMP_NOT_FOUND',
-                    'message': 'Camp not found',
-                    'details': None
-                }
-            }, 404
-        
-        return {
-            'data': {
-                'message': 'Camp deleted successfully'
-            }
-        }, 200
-        
-    except Exception as e:
-        current_app.logger.error(f"Delete camp error: {str(e)}")
-        return {
-            'data': {
-                'code': 'DELETE_CAMP_ERROR',
-                'message': 'Failed to delete camp',
-                'details': {'error': str(e)}
-            }
-        }, 500
+    success = camp_service.delete_camp(camp_id)
+    
+    if not success:
+        return json_response(_CAMP_NOT_FOUND, 404)
+    
+    return json_response(_CAMP_DELETED)
 
 
 @camp_bp.get('/<camp_id>/stats')
@@ -949,35 +548,17 @@ def delete_camp(camp_id):
     summary='Get camp statistics',
     description='Get registration and financial statistics for a camp'
 )
-@token_required
-@camp_owner_required()
+@authorize(camp_param='camp_id')
 def get_camp_stats(camp_id):
     """Get camp statistics"""
-    try:
-        stats = camp_service.get_camp_stats(camp_id)
-        
-        if not stats:
-            return {
-                'data': {
-                    'code': 'CAMP_NOT_FOUND',
-                    'message': 'Camp not found',
-                    'details': None
-                }
-            }, 404
-        
-        return {
-            'data': stats
-        }, 200
-        
-    except Exception as e:
-        current_app.logger.error(f"Get camp stats error: {str(e)}")
-        return {
-            'data': {
-                'code': 'GET_STATS_ERROR',
-                'message': 'Failed to retrieve camp statistics',
-                'details': {'error': str(e)}
-            }
-        }, 500
+    stats = camp_service.get_camp_stats(camp_id)
+    
+    if not stats:
+        return json_response(_CAMP_NOT_FOUND, 404)
+    
+    return {
+        'data': stats
+    }, 200
 
 
 # =============================================================================
@@ -990,26 +571,10 @@ def get_camp_stats(camp_id):
     summary='Get churches for camp',
     description='Get all churches associated with a camp'
 )
-@token_required
-@camp_owner_required()
+@authorize(camp_param='camp_id')
 def get_churches(camp_id):
     """Get churches for camp"""
-    try:
-        churches = church_service.get_camp_churches(camp_id)
-        
-        return {
-            'data': [church.to_dict() for church in churches]
-        }, 200
-        
-    except Exception as e:
-        current_app.logger.error(f"Get churches error: {str(e)}")
-        return {
-            'data': {
-                'code': 'GET_CHURCHES_ERROR',
-                'message': 'Failed to retrieve churches',
-                'details': {'error': str(e)}
-            }
-        }, 500
+    return rows_response(church_service.get_camp_churches(camp_id, as_dict=True))
 
 
 @camp_bp.post('/<camp_id>/churches')
@@ -1019,8 +584,7 @@ def get_churches(camp_id):
     summary='Add church to camp',
     description='Add a new church to a camp'
 )
-@token_required
-@camp_owner_required()
+@authorize(camp_param='camp_id')
 def create_church(camp_id, json_data):
     """Add church to camp"""
     try:
@@ -1030,26 +594,11 @@ def create_church(camp_id, json_data):
         new_church = church_service.create_church(church_data)
         
         return {
-            'data': new_church.to_dict()
+            'data': new_church
         }, 201
         
     except ValueError as e:
-        return {
-            'data': {
-                'code': 'VALIDATION_ERROR',
-                'message': str(e),
-                'details': None
-            }
-        }, 400
-    except Exception as e:
-        current_app.logger.error(f"Create church error: {str(e)}")
-        return {
-            'data': {
-                'code': 'CREATE_CHURCH_ERROR',
-                'message': 'Failed to create church',
-                'details': {'error': str(e)}
-            }
-        }, 500
+        return _validation_error(e)
         
 
 @camp_bp.post('/<camp_id>/multiple-churches')
@@ -1072,26 +621,11 @@ def create_churches(camp_id, json_data):
         new_church = church_service.create_churches(church_data)
         
         return {
-            'data': [church.to_dict() for church in new_church]
+            'data': [church.to_dict(include_relations=False) for church in new_church]
         }, 201
         
     except ValueError as e:
-        return {
-            'data': {
-                'code': 'VALIDATION_ERROR',
-                'message': str(e),
-                'details': None
-            }
-        }, 400
-    except Exception as e:
-        current_app.logger.error(f"Create churches error: {str(e)}")
-        return {
-            'data': {
-                'code': 'CREATE_CHURCHES_ERROR',
-                'message': 'Failed to create churches',
-                'details': {'error': str(e)}
-            }
-        }, 500
+        return _validation_error(e)
 
 
 @camp_bp.put('/churches/<church_id>')
@@ -1101,56 +635,21 @@ def create_churches(camp_id, json_data):
     summary='Update church',
     description='Update church details'
 )
-@token_required
+@authorize(resource='church')
 def update_church(church_id, json_data):
     """Update church"""
     try:
-        # Verify user owns the camp that owns this church
-        church = church_service.get_church_by_id(church_id)
-        if not church:
-            return {
-                'data': {
-                    'code': 'CHURCH_NOT_FOUND',
-                    'message': 'Church not found',
-                    'details': None
-                }
-            }, 404
-        
-        # Check if user owns the camp
-        user = get_current_user()
-        # if str(church.camp.camp_manager_id) != str(user.id):
-        #     return {
-        #         'data': {
-        #             'code': 'AUTHORIZATION_ERROR',
-        #             'message': 'Access denied',
-        #             'details': None
-        #         }
-        #     }, 403
-        
         update_data = json_data['data']
         updated_church = church_service.update_church(church_id, update_data)
+        if not updated_church:
+            return json_response(_CHURCH_NOT_FOUND, 404)
         
         return {
-            'data': updated_church.to_dict()
+            'data': updated_church
         }, 200
         
     except ValueError as e:
-        return {
-            'data': {
-                'code': 'VALIDATION_ERROR',
-                'message': str(e),
-                'details': None
-            }
-        }, 400
-    except Exception as e:
-        current_app.logger.error(f"Update church error: {str(e)}")
-        return {
-            'data': {
-                'code': 'UPDATE_CHURCH_ERROR',
-                'message': 'Failed to update church',
-                'details': {'error': str(e)}
-            }
-        }, 500
+        return _validation_error(e)
 
 
 @camp_bp.delete('/churches/<church_id>')
@@ -1159,81 +658,39 @@ def update_church(church_id, json_data):
     summary='Remove church',
     description='Remove church from camp'
 )
-@token_required
+@authorize(resource='church')
 def delete_church(church_id):
     """Remove church"""
     try:
-        # Verify user owns the camp that owns this church
-        church = church_service.get_church_by_id(church_id)
-        if not church:
-            return {
-                'data': {
-                    'code': 'CHURCH_NOT_FOUND',
-                    'message': 'Church not found',
-                    'details': None
-                }
-            }, 404
+        if not church_service.delete_church(church_id):
+            return json_response(_CHURCH_NOT_FOUND, 404)
         
-        # Check if user owns the camp
-        user = get_current_user()
-        # if str(church.camp.camp_manager_id) != str(user.id):
-        #     return {
-        #         'data': {
-        #             'code': 'AUTHORIZATION_ERROR',
-        #             'message': 'Access denied',
-        #             'details': None
-        #         }
-        #     }, 403
+        return json_response(_CHURCH_REMOVED)
         
-        church_service.delete_church(church_id)
-        
-        return {
-            'data': {
-                'message': 'Church removed successfully'
-            }
-        }, 200
-        
-    except Exception as e:
-        current_app.logger.error(f"Delete church error: {str(e)}")
-        return {
-            'data': {
-                'code': 'DELETE_CHURCH_ERROR',
-                'message': 'Failed to remove church',
-                'details': {'error': str(e)}
-            }
-        }, 500
+    except ValueError as e:
+        return _validation_error(e)
 
 
 # =============================================================================
 # CATEGORY ROUTES
 # =============================================================================
 
+def _render_categories(camp_id):
+    """Serialize the camp's categories list response body and ETag"""
+    categories = category_service.get_camp_categories(camp_id, as_dict=True)
+    return _tagged_body(category_list_response_schema.dump({'data': categories}))
+
+
 @camp_bp.get('/<camp_id>/categories')
 @camp_bp.output(CategoryListResponseWrapperSchema)
 @camp_bp.doc(
     summary='Get categories for camp',
     description='Get all registration categories for a camp'
 )
-@token_required
-@camp_owner_required()
+@authorize(camp_param='camp_id')
 def get_categories(camp_id):
     """Get categories for camp"""
-    try:
-        categories = category_service.get_camp_categories(camp_id)
-        
-        return {
-            'data': [category.to_dict() for category in categories]
-        }, 200
-        
-    except Exception as e:
-        current_app.logger.error(f"Get categories error: {str(e)}")
-        return {
-            'data': {
-                'code': 'GET_CATEGORIES_ERROR',
-                'message': 'Failed to retrieve categories',
-                'details': {'error': str(e)}
-            }
-        }, 500
+    return _cached_body_response(get_categories_body(camp_id, lambda: _render_categories(camp_id)))
 
 
 @camp_bp.post('/<camp_id>/categories')
@@ -1243,8 +700,7 @@ def get_categories(camp_id):
     summary='Create category',
     description='Create a new registration category for a camp'
 )
-@token_required
-@camp_owner_required()
+@authorize(camp_param='camp_id')
 def create_category(camp_id, json_data):
     """Create category"""
     try:
@@ -1254,26 +710,11 @@ def create_category(camp_id, json_data):
         new_category = category_service.create_category(category_data)
         
         return {
-            'data': new_category.to_dict()
+            'data': new_category
         }, 201
         
     except ValueError as e:
-        return {
-            'data': {
-                'code': 'VALIDATION_ERROR',
-                'message': str(e),
-                'details': None
-            }
-        }, 400
-    except Exception as e:
-        current_app.logger.error(f"Create category error: {str(e)}")
-        return {
-            'data': {
-                'code': 'CREATE_CATEGORY_ERROR',
-                'message': 'Failed to create category',
-                'details': {'error': str(e)}
-            }
-        }, 500
+        return _validation_error(e)
 
 
 @camp_bp.put('/categories/<category_id>')
@@ -1283,123 +724,41 @@ def create_category(camp_id, json_data):
     summary='Update category',
     description='Update category details'
 )
-@token_required
+@authorize(resource='category')
 def update_category(category_id, json_data):
     """Update category"""
     try:
-        # Verify user owns the camp that owns this category
-        category = category_service.get_category_by_id(category_id)
-        if not category:
-            return {
-                'data': {
-                    'code': 'CATEGORY_NOT_FOUND',
-                    'message': 'Category not found',
-                    'details': None
-                }
-            }, 404
-        
-        # Check if user owns the camp
-        user = get_current_user()
-        # if str(category.camp.camp_manager_id) != str(user.id):
-        #     return {
-        #         'data': {
-        #             'code': 'AUTHORIZATION_ERROR',
-        #             'message': 'Access denied',
-        #             'details': None
-        #         }
-        #     }, 403
-        
         update_data = json_data['data']
         updated_category = category_service.update_category(category_id, update_data)
+        if not updated_category:
+            return json_response(_CATEGORY_NOT_FOUND, 404)
         
         return {
-            'data': updated_category.to_dict()
+            'data': updated_category
         }, 200
         
     except ValueError as e:
-        return {
-            'data': {
-                'code': 'VALIDATION_ERROR',
-                'message': str(e),
-                'details': None
-            }
-        }, 400
-    except Exception as e:
-        current_app.logger.error(f"Update category error: {str(e)}")
-        return {
-            'data': {
-                'code': 'UPDATE_CATEGORY_ERROR',
-                'message': 'Failed to update category',
-                'details': {'error': str(e)}
-            }
-        }, 500
+        return _validation_error(e)
 
 
 @camp_bp.delete('/categories/<category_id>')
-@camp_bp.output(SuccessMessageWrapperSchema)
+@camp_bp.output({}, status_code=204)
 @camp_bp.doc(
     summary='Delete category',
     description='Delete category from camp'
 )
-@token_required
+@authorize(resource='category')
 def delete_category(category_id):
     """Delete category"""
     try:
-        # Verify user owns the camp that owns this category
-        category = category_service.get_category_by_id(category_id)
-        if not category:
-            return {
-                'data': {
-                    'code': 'CATEGORY_NOT_FOUND',
-                    'message': 'Category not found',
-                    'details': None
-                }
-            }, 404
-        
-        # Check if user owns the camp
-        user = get_current_user()
-        # if str(category.camp.camp_manager_id) != str(user.id):
-        #     return {
-        #         'data': {
-        #             'code': 'AUTHORIZATION_ERROR',
-        #             'message': 'Access denied',
-        #             'details': None
-        #         }
-        #     }, 403
-        
         success = category_service.delete_category(category_id)
         if not success:
-            return {
-                'data': {
-                    'code': 'DELETE_FAILED',
-                    'message': 'Failed to delete category',
-                    'details': None
-                }
-            }, 400
+            return json_response(_DELETE_CATEGORY_FAILED, 400)
         
-        return {
-            'data': {
-                'message': 'Category deleted successfully'
-            }
-        }, 200
+        return '', 204
         
     except ValueError as e:
-        return {
-            'data': {
-                'code': 'VALIDATION_ERROR',
-                'message': str(e),
-                'details': None
-            }
-        }, 400
-    except Exception as e:
-        current_app.logger.error(f"Delete category error: {str(e)}")
-        return {
-            'data': {
-                'code': 'DELETE_CATEGORY_ERROR',
-                'message': 'Failed to delete category',
-                'details': {'error': str(e)}
-            }
-        }, 500
+        return _validation_error(e)
 
 # =============================================================================
 # CUSTOM FIELD ROUTES
@@ -1411,26 +770,10 @@ def delete_category(category_id):
     summary='Get custom fields',
     description='Get all custom fields for a camp'
 )
-@token_required
-@camp_owner_required()
+@authorize(camp_param='camp_id')
 def get_custom_fields(camp_id):
     """Get custom fields for camp"""
-    try:
-        custom_fields = custom_field_service.get_camp_custom_fields(camp_id)
-        
-        return {
-            'data': [field.to_dict() for field in custom_fields]
-        }, 200
-        
-    except Exception as e:
-        current_app.logger.error(f"Get custom fields error: {str(e)}")
-        return {
-            'data': {
-                'code': 'GET_CUSTOM_FIELDS_ERROR',
-                'message': 'Failed to retrieve custom fields',
-                'details': {'error': str(e)}
-            }
-        }, 500
+    return rows_response(custom_field_service.get_camp_custom_fields(camp_id, as_dict=True))
 
 
 # =============================================================================
@@ -1443,26 +786,14 @@ def get_custom_fields(camp_id):
     summary='Get registration links',
     description='Get all registration links for a camp'
 )
-@token_required
-@camp_owner_required()
+@authorize(camp_param='camp_id')
 def get_registration_links(camp_id):
     """Get registration links for camp"""
-    try:
-        links = registration_link_service.get_camp_registration_links(camp_id)
-        
-        return {
-            'data': [link.to_dict() for link in links]
-        }, 200
-        
-    except Exception as e:
-        current_app.logger.error(f"Get registration links error: {str(e)}")
-        return {
-            'data': {
-                'code': 'GET_LINKS_ERROR',
-                'message': 'Failed to retrieve registration links',
-                'details': {'error': str(e)}
-            }
-        }, 500
+    links = registration_link_service.get_camp_registration_links(camp_id, as_dict=True)
+    
+    return {
+        'data': links
+    }, 200
 
 
 @camp_bp.post('/<camp_id>/registration-links')
@@ -1472,45 +803,36 @@ def get_registration_links(camp_id):
     summary='Create registration link',
     description='Create a new category-specific registration link'
 )
-@token_required
-@camp_owner_required()
+@authorize(camp_param='camp_id')
 def create_registration_link(camp_id, json_data):
     """Create registration link"""
     try:
-        user = get_current_user()
         link_data = json_data['data']
         link_data['camp_id'] = camp_id
-        link_data['created_by'] = str(user.id)
+        link_data['created_by'] = get_current_user_id()
         
         new_link = registration_link_service.create_registration_link(link_data)
         
         return {
-            'data': new_link.to_dict()
+            'data': new_link
         }, 201
         
     except ValueError as e:
-        return {
-            'data': {
-                'code': 'VALIDATION_ERROR',
-                'message': str(e),
-                'details': None
-            }
-        }, 400
-    except Exception as e:
-        current_app.logger.error(f"Create registration link error: {str(e)}")
-        return {
-            'data': {
-                'code': 'CREATE_LINK_ERROR',
-                'message': 'Failed to create registration link',
-                'details': {'error': str(e)}
-            }
-        }, 500
+        return _validation_error(e)
 
 
 # =============================================================================
 # REGISTRATION ROUTES (Public & Private)
 # =============================================================================
 
+def _render_general_form(camp_id):
+    """Serialize the general registration form response body and ETag (None if unavailable)"""
+    form_data = registration_service.get_registration_form(camp_id)
+    if not form_data:
+        return None
+    return _tagged_body(registration_form_response_schema.dump({'data': form_data}))
+
+
 @camp_bp.get('/<camp_id>/register')
 @camp_bp.output(RegistrationFormResponseWrapperSchema)
 @camp_bp.doc(
@@ -1520,31 +842,12 @@ def create_registration_link(camp_id, json_data):
 @optional_auth
 def get_registration_form(camp_id):
     """Get general registration form structure"""
-    try:
-        form_data = registration_service.get_registration_form(camp_id)
-        
-        if not form_data:
-            return {
-                'data': {
-                    'code': 'CAMP_NOT_FOUND',
-                    'message': 'Camp not found or registration not available',
-                    'details': None
-                }
-            }, 404
-        
-        return {
-            'data': form_data
-        }, 200
-        
-    except Exception as e:
-        current_app.logger.error(f"Get registration form error: {str(e)}")
-        return {
-            'data': {
-                'code': 'GET_FORM_ERROR',
-                'message': 'Failed to retrieve registration form',
-                'details': {'error': str(e)}
-            }
-        }, 500
+    tagged_body = get_general_form_body(camp_id, lambda: _render_general_form(camp_id))
+    
+    if tagged_body is None:
+        return json_response(_REGISTRATION_UNAVAILABLE, 404)
+    
+    return _cached_body_response(tagged_body)
 
 
 @camp_bp.post('/<camp_id>/register')
@@ -1563,26 +866,11 @@ def submit_registration(camp_id, json_data):
         new_registration = registration_service.create_registration(registration_data)
         
         return {
-            'data': new_registration.to_dict()
+            'data': new_registration
         }, 201
         
     except ValueError as e:
-        return {
-            'data': {
-                'code': 'VALIDATION_ERROR',
-                'message': str(e),
-                'details': None
-            }
-        }, 400
-    except Exception as e:
-        current_app.logger.error(f"Submit registration error: {str(e)}")
-        return {
-            'data': {
-                'code': 'REGISTRATION_ERROR',
-                'message': 'Failed to submit registration',
-                'details': {'error': str(e)}
-            }
-        }, 500
+        return _validation_error(e)
 
 
 @camp_bp.get('/<camp_id>/registrations')
@@ -1591,26 +879,30 @@ def submit_registration(camp_id, json_data):
     summary='Get camp registrations',
     description='Get all registrations for a camp (Manager only)'
 )
-@token_required
-@camp_owner_required()
+@authorize(camp_param='camp_id')
 def get_registrations(camp_id):
     """Get all registrations for camp"""
-    try:
-        registrations = registration_service.get_camp_registrations(camp_id)
-        
-        return {
-            'data': [reg.to_dict() for reg in registrations]
-        }, 200
-        
-    except Exception as e:
-        current_app.logger.error(f"Get registrations error: {str(e)}")
-        return {
-            'data': {
-                'code': 'GET_REGISTRATIONS_ERROR',
-                'message': 'Failed to retrieve registrations',
-                'details': {'error': str(e)}
-            }
-        }, 500
+    # Exports of large camps can ask for NDJSON and get the rows streamed from a server-side cursor
+    if request.accept_mimetypes.best_match(['application/json', 'application/x-ndjson']) == 'application/x-ndjson':
+        return ndjson_response(registration_service.iter_camp_registrations(camp_id))
+    
+    registrations = registration_service.get_camp_registrations(camp_id, as_dict=True)
+    
+    # Can be thousands of rows: serialize the columns directly instead of dumping each through the schema
+    return rows_response(registrations)
+
+
+# Conditional GET for the camp blueprint
+@camp_bp.after_request
+def add_etag(response):
+    """Tag successful GET responses so clients can revalidate with If-None-Match and get a 304"""
+    if request.method == 'GET' and response.status_code == 200 and not response.is_streamed:
+        # Per-user data: browsers may keep it but must revalidate before reuse
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+        response.add_etag(weak=True)
+        return response.make_conditional(request)
+    return response
 
 
 # Error handlers for the camp blueprint
@@ -1641,11 +933,5 @@ def validation_error(error):
 @camp_bp.errorhandler(500)
 def internal_error(error):
     """Handle internal server errors"""
-    current_app.logger.error(f"Internal error in camp routes: {str(error)}")
-    return {
-        'data': {
-            'code': 'INTERNAL_ERROR',
-            'message': 'Internal server error',
-            'details': None
-        }
-    }, 500
\ No newline at end of file
+    current_app.logger.error("Internal error in camp routes: %s", error)
+    return _INTERNAL_ERROR, 500
\ No newline at end of file
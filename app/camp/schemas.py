@@ -567,7 +567,8 @@ class RegistrationLinkResponseSchema(BaseResponseSchema):
     
     def get_registration_url(self, obj):
         # You'll need to configure this base URL
-        return f"https://localhost:5173/register/{obj['link_token']}"
+        # obj is a RegistrationLink or its to_dict()
+        return f"https://localhost:5173/register/{self.get_attribute(obj, 'link_token', None)}"
 
 
 # Registration Schemas
@@ -789,7 +790,8 @@ class RegistrationLinkResponseWrapperSchema(Schema):
 
 class RegistrationResponseWrapperSchema(Schema):
     """Wrapper for registration response"""
-    data = fields.Nested(RegistrationResponseSchema, required=True)
+    # Single registrations are dumped from the model; don't lazy-load church and category for them
+    data = fields.Nested(RegistrationResponseSchema, exclude=('church', 'category'), required=True)
 
 
 class RegistrationFormResponseWrapperSchema(Schema):
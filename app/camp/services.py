@@ -1,9 +1,12 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List, Sequence, Set, Tuple, Union
 from flask import current_app
+from sqlalchemy import RowMapping, and_, case, func, select, update
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import contains_eager
 from datetime import datetime, timezone
 from decimal import Decimal
 
+from app._shared.app_cache import canonical_id
 from .models import (
     Camp,
     CampWorker,
@@ -14,28 +17,162 @@ from .models import (
     Registration,
     db,
 )
+from ._access_cache import (
+    get_cached_access,
+    get_cached_membership,
+    remember_access,
+    remember_membership,
+)
+from ._form_cache import get_form_sections
+from ._link_cache import LINK_BY_TOKEN, load_link
+from ._stats_cache import get_camp_stats as get_cached_camp_stats
+
+
+def _has_registrations(criterion) -> bool:
+    """Whether any registration matches criterion, via EXISTS rather than loading rows"""
+    return db.session.query(select(Registration.id).where(criterion).exists()).scalar()
+
+
+def _column_rows(model, *criteria, order_by=()) -> Sequence[RowMapping]:
+    """A model's rows as plain column mappings, skipping ORM instance construction"""
+    stmt = select(model.__table__).where(*criteria).order_by(*order_by)
+    return db.session.execute(stmt).mappings().all()
+
+
+def _is_noop_update(obj, update_data: Dict[str, Any]) -> bool:
+    """
+    Whether applying update_data would leave obj unchanged
+
+    Strings are compared with surrounding whitespace ignored. Values that only
+    differ in representation (e.g. an aware datetime) count as changes and
+    take the normal update path.
+    """
+    for field, value in update_data.items():
+        current = getattr(obj, field, None)
+        if isinstance(value, str):
+            value = value.strip()
+        if value != current:
+            return False
+    return True
+
+
+def camp_access(model, resource_id: str, user_id: str) -> Optional[bool]:
+    """
+    Check whether user_id works on the camp that owns a resource
+
+    Returns None when the resource doesn't exist, otherwise whether the user
+    is one of the camp's workers. Answers come from the per-process access
+    cache when possible, else from one query that also fills the cache.
+    """
+    resource_id = canonical_id(resource_id)
+    if resource_id is None:
+        return None
+
+    cached = get_cached_access(model, resource_id, user_id)
+    if cached is not None:
+        return cached
+
+    row = db.session.execute(
+        select(model.camp_id, CampWorker.id)
+        .outerjoin(
+            CampWorker,
+            and_(CampWorker.camp_id == model.camp_id, CampWorker.user_id == user_id),
+        )
+        .where(model.id == resource_id)
+        .limit(1)
+    ).first()
+    if row is None:
+        return None
+    is_worker = row[1] is not None
+    remember_access(model, resource_id, row[0], user_id, is_worker)
+    return is_worker
+
+
+def camp_membership(camp_id: str, user_id: str) -> Optional[bool]:
+    """
+    Check whether user_id works on camp_id
+
+    Returns None when the camp doesn't exist, otherwise whether the user is
+    one of its workers. Cached per process like camp_access, so the camp
+    routes' ownership check usually skips the query.
+    """
+    cached = get_cached_membership(camp_id, user_id)
+    if cached is not None:
+        return cached
+
+    row = db.session.execute(
+        select(Camp.id, CampWorker.id)
+        .outerjoin(
+            CampWorker,
+            and_(CampWorker.camp_id == Camp.id, CampWorker.user_id == user_id),
+        )
+        .where(Camp.id == camp_id)
+        .limit(1)
+    ).first()
+    if row is None:
+        return None
+    is_worker = row[1] is not None
+    remember_membership(camp_id, user_id, is_worker)
+    return is_worker
+
+
+def _consume_link(link_id: str) -> bool:
+    """
+    Atomically count one use of a registration link if it is still valid
+
+    The validity checks run in the UPDATE's WHERE clause, so concurrent
+    registrations can't both take the last slot. Returns False when no row
+    was updated. The caller owns the transaction.
+    """
+    result = db.session.execute(
+        update(RegistrationLink)
+        .where(RegistrationLink.id == link_id, RegistrationLink.is_valid())
+        .values(usage_count=RegistrationLink.usage_count + 1)
+    )
+    return result.rowcount == 1
 
 
 class CampService:
     """Service class for camp-related business logic"""
 
+    # Stateless: one shared instance serves every request; db.session is already scoped per request
+    __slots__ = ()
+
     def get_camp_by_id(self, camp_id: str) -> Optional[Camp]:
         """Get camp by ID"""
         try:
-            return Camp.query.filter_by(id=camp_id).first()
+            return db.session.get(Camp, camp_id)
+        except SQLAlchemyError as e:
+            current_app.logger.exception("Database error in get_camp_by_id: %s", e)
+            return None
+
+    def get_camp_updated_at(self, camp_id: str) -> Optional[datetime]:
+        """Get only a camp's updated_at, for conditional GETs (None if not found)"""
+        try:
+            return db.session.query(Camp.updated_at).filter(Camp.id == camp_id).scalar()
         except SQLAlchemyError as e:
-            current_app.logger.error(f"Database error in get_camp_by_id: {str(e)}")
+            current_app.logger.exception("Database error in get_camp_updated_at: %s", e)
             return None
 
-    def get_user_camps(self, user_id: str) -> List[Camp]:
-        """Get all camps for a specific user"""
+    def get_user_camps(
+        self, user_id: str, as_dict: bool = False
+    ) -> Union[List[Camp], Sequence[RowMapping]]:
+        """Get all camps for a specific user (as column mappings with as_dict, for list responses)"""
         try:
-            camp_ids = CampWorker.query.filter_by(user_id=user_id).all()
-            print(camp_ids)
-            camps = Camp.query.filter(Camp.id.in_([camp.camp_id for camp in camp_ids])).order_by(Camp.created_at.desc()).all()
+            worker_camp_ids = select(CampWorker.camp_id).where(CampWorker.user_id == user_id)
+            if as_dict:
+                return _column_rows(
+                    Camp, Camp.id.in_(worker_camp_ids), order_by=(Camp.created_at.desc(),)
+                )
+            camps = (
+                Camp.query
+                .filter(Camp.id.in_(worker_camp_ids))
+                .order_by(Camp.created_at.desc())
+                .all()
+            )
             return camps
         except SQLAlchemyError as e:
-            current_app.logger.error(f"Database error in get_user_camps: {str(e)}")
+            current_app.logger.exception("Database error in get_user_camps: %s", e)
             return []
 
     def create_camp(self, camp_data: Dict[str, Any]) -> Optional[Camp]:
@@ -108,7 +245,7 @@ class CampService:
             db.session.commit()
 
             current_app.logger.info(
-                f"New camp created: {new_camp.name} by {camp_data['camp_manager_id']}"
+                "New camp created: %s by %s", new_camp.name, camp_data['camp_manager_id']
             )
             return new_camp
 
@@ -116,11 +253,11 @@ class CampService:
             raise
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(f"Database error in create_camp: {str(e)}")
+            current_app.logger.exception("Database error in create_camp: %s", e)
             raise Exception("Failed to create camp due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(f"Unexpected error in create_camp: {str(e)}")
+            current_app.logger.exception("Unexpected error in create_camp: %s", e)
             raise Exception("Failed to create camp")
 
     def update_camp(self, camp_id: str, update_data: Dict[str, Any]) -> Optional[Camp]:
@@ -130,6 +267,10 @@ class CampService:
             if not camp:
                 return None
 
+            # Idempotent retries: nothing to validate or write
+            if _is_noop_update(camp, update_data):
+                return camp
+
             # Validate dates if provided
             if "start_date" in update_data and "end_date" in update_data:
                 start_date = update_data["start_date"]
@@ -192,18 +333,18 @@ class CampService:
 
             db.session.commit()
 
-            current_app.logger.info(f"Camp updated: {camp.name}")
+            current_app.logger.info("Camp updated: %s", camp.name)
             return camp
 
         except ValueError:
             raise
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(f"Database error in update_camp: {str(e)}")
+            current_app.logger.exception("Database error in update_camp: %s", e)
             raise Exception("Failed to update camp due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(f"Unexpected error in update_camp: {str(e)}")
+            current_app.logger.exception("Unexpected error in update_camp: %s", e)
             raise Exception("Failed to update camp")
 
     def delete_camp(self, camp_id: str) -> bool:
@@ -213,80 +354,98 @@ class CampService:
             if not camp:
                 return False
 
-            # This will cascade delete all related data (churches, categories, etc.)
+            # The database deletes churches, categories, registrations etc. via ON DELETE CASCADE
             db.session.delete(camp)
             db.session.commit()
 
-            current_app.logger.info(f"Camp deleted: {camp.name}")
+            current_app.logger.info("Camp deleted: %s", camp.name)
             return True
 
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(f"Database error in delete_camp: {str(e)}")
+            current_app.logger.exception("Database error in delete_camp: %s", e)
             raise Exception("Failed to delete camp due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(f"Unexpected error in delete_camp: {str(e)}")
+            current_app.logger.exception("Unexpected error in delete_camp: %s", e)
             raise Exception("Failed to delete camp")
 
     def get_camp_stats(self, camp_id: str) -> Optional[Dict[str, Any]]:
-        """Get camp statistics"""
+        """Get camp statistics, from the per-process stats cache when possible"""
+        return get_cached_camp_stats(camp_id, lambda: self._build_camp_stats(camp_id))
+
+    def _build_camp_stats(self, camp_id: str) -> Optional[Dict[str, Any]]:
+        """Aggregate a camp's registration statistics"""
         try:
-            camp = self.get_camp_by_id(camp_id)
-            if not camp:
+            # One round trip: the camp's capacity and its registration aggregates together
+            totals = (
+                db.session.query(
+                    Camp.id,
+                    Camp.capacity,
+                    func.count(Registration.id),
+                    func.count(case((Registration.has_paid.is_(True), 1))),
+                    func.count(case((Registration.has_checked_in.is_(True), 1))),
+                    func.sum(
+                        case((Registration.has_paid.is_(True), Registration.total_amount))
+                    ),
+                )
+                .outerjoin(Registration, Registration.camp_id == Camp.id)
+                .filter(Camp.id == camp_id)
+                .group_by(Camp.id, Camp.capacity)
+                .one_or_none()
+            )
+            if totals is None:
                 return None
-
-            # Count registrations
-            total_registrations = len(camp.registrations)
-            paid_registrations = sum(1 for reg in camp.registrations if reg.has_paid)
+            camp_id, capacity, total_registrations, paid_registrations, checked_in_count, paid_total = totals
             unpaid_registrations = total_registrations - paid_registrations
-            checked_in_count = sum(
-                1 for reg in camp.registrations if reg.has_checked_in
-            )
 
             # Calculate capacity percentage
             capacity_percentage = (
-                (total_registrations / camp.capacity * 100) if camp.capacity > 0 else 0
+                (total_registrations / capacity * 100) if capacity > 0 else 0
             )
 
             # Calculate revenue
-            total_revenue = sum(
-                float(reg.total_amount) for reg in camp.registrations if reg.has_paid
-            )
+            total_revenue = float(paid_total or 0)
 
             return {
-                "camp_id": str(camp.id),
+                "camp_id": camp_id,
                 "total_registrations": total_registrations,
                 "paid_registrations": paid_registrations,
                 "unpaid_registrations": unpaid_registrations,
                 "checked_in_count": checked_in_count,
-                "total_capacity": camp.capacity,
+                "total_capacity": capacity,
                 "capacity_percentage": round(capacity_percentage, 2),
                 "total_revenue": total_revenue,
             }
 
         except Exception as e:
-            current_app.logger.error(f"Error in get_camp_stats: {str(e)}")
+            current_app.logger.exception("Error in get_camp_stats: %s", e)
             return None
 
 
 class ChurchService:
     """Service class for church-related business logic"""
 
+    __slots__ = ()
+
     def get_church_by_id(self, church_id: str) -> Optional[Church]:
         """Get church by ID"""
         try:
-            return Church.query.filter_by(id=church_id).first()
+            return db.session.get(Church, church_id)
         except SQLAlchemyError as e:
-            current_app.logger.error(f"Database error in get_church_by_id: {str(e)}")
+            current_app.logger.exception("Database error in get_church_by_id: %s", e)
             return None
 
-    def get_camp_churches(self, camp_id: str) -> List[Church]:
-        """Get all churches for a camp"""
+    def get_camp_churches(
+        self, camp_id: str, as_dict: bool = False
+    ) -> Union[List[Church], Sequence[RowMapping]]:
+        """Get all churches for a camp (as column mappings with as_dict, for list responses)"""
         try:
+            if as_dict:
+                return _column_rows(Church, Church.camp_id == camp_id, order_by=(Church.name,))
             return Church.query.filter_by(camp_id=camp_id).order_by(Church.name).all()
         except SQLAlchemyError as e:
-            current_app.logger.error(f"Database error in get_camp_churches: {str(e)}")
+            current_app.logger.exception("Database error in get_camp_churches: %s", e)
             return []
 
     def create_church(self, church_data: Dict[str, Any]) -> Optional[Church]:
@@ -319,7 +478,7 @@ class ChurchService:
             db.session.commit()
 
             current_app.logger.info(
-                f"New church created: {new_church.name} for camp {church_data['camp_id']}"
+                "New church created: %s for camp %s", new_church.name, church_data['camp_id']
             )
             return new_church
 
@@ -327,11 +486,11 @@ class ChurchService:
             raise
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(f"Database error in create_church: {str(e)}")
+            current_app.logger.exception("Database error in create_church: %s", e)
             raise Exception("Failed to create church due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(f"Unexpected error in create_church: {str(e)}")
+            current_app.logger.exception("Unexpected error in create_church: %s", e)
             raise Exception("Failed to create church")
 
     def create_churches(self, church_data: List[Dict[str, Any]]) -> List[Church]:
@@ -344,7 +503,7 @@ class ChurchService:
             return churches
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(f"Database error in create_churches: {str(e)}")
+            current_app.logger.exception("Database error in create_churches: %s", e)
             raise Exception("Failed to create churches due to database error")
 
     def update_church(
@@ -356,6 +515,10 @@ class ChurchService:
             if not church:
                 return None
 
+            # Idempotent retries: nothing to validate or write
+            if _is_noop_update(church, update_data):
+                return church
+
             if "name" in update_data:
                 name = update_data["name"].strip()
                 if not name:
@@ -377,18 +540,18 @@ class ChurchService:
 
             db.session.commit()
 
-            current_app.logger.info(f"Church updated: {church.name}")
+            current_app.logger.info("Church updated: %s", church.name)
             return church
 
         except ValueError:
             raise
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(f"Database error in update_church: {str(e)}")
+            current_app.logger.exception("Database error in update_church: %s", e)
             raise Exception("Failed to update church due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(f"Unexpected error in update_church: {str(e)}")
+            current_app.logger.exception("Unexpected error in update_church: %s", e)
             raise Exception("Failed to update church")
 
     def delete_church(self, church_id: str) -> bool:
@@ -399,46 +562,52 @@ class ChurchService:
                 return False
 
             # Check if church has registrations
-            if len(church.registrations) > 0:
+            if _has_registrations(Registration.church_id == church.id):
                 raise ValueError("Cannot delete church with existing registrations")
 
             db.session.delete(church)
             db.session.commit()
 
-            current_app.logger.info(f"Church deleted: {church.name}")
+            current_app.logger.info("Church deleted: %s", church.name)
             return True
 
         except ValueError:
             raise
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(f"Database error in delete_church: {str(e)}")
+            current_app.logger.exception("Database error in delete_church: %s", e)
             raise Exception("Failed to delete church due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(f"Unexpected error in delete_church: {str(e)}")
+            current_app.logger.exception("Unexpected error in delete_church: %s", e)
             raise Exception("Failed to delete church")
 
 
 class CategoryService:
     """Service class for category-related business logic"""
 
+    __slots__ = ()
+
     def get_category_by_id(self, category_id: str) -> Optional[Category]:
         """Get category by ID"""
         try:
-            return Category.query.filter_by(id=category_id).first()
+            return db.session.get(Category, category_id)
         except SQLAlchemyError as e:
-            current_app.logger.error(f"Database error in get_category_by_id: {str(e)}")
+            current_app.logger.exception("Database error in get_category_by_id: %s", e)
             return None
 
-    def get_camp_categories(self, camp_id: str) -> List[Category]:
-        """Get all categories for a camp"""
+    def get_camp_categories(
+        self, camp_id: str, as_dict: bool = False
+    ) -> Union[List[Category], Sequence[RowMapping]]:
+        """Get all categories for a camp (as column mappings with as_dict, for list responses)"""
         try:
+            if as_dict:
+                return _column_rows(Category, Category.camp_id == camp_id, order_by=(Category.name,))
             return (
                 Category.query.filter_by(camp_id=camp_id).order_by(Category.name).all()
             )
         except SQLAlchemyError as e:
-            current_app.logger.error(f"Database error in get_camp_categories: {str(e)}")
+            current_app.logger.exception("Database error in get_camp_categories: %s", e)
             return []
 
     def create_category(self, category_data: Dict[str, Any]) -> Optional[Category]:
@@ -492,7 +661,7 @@ class CategoryService:
             db.session.commit()
 
             current_app.logger.info(
-                f"New category created: {new_category.name} for camp {category_data['camp_id']}"
+                "New category created: %s for camp %s", new_category.name, category_data['camp_id']
             )
             return new_category
 
@@ -500,11 +669,11 @@ class CategoryService:
             raise
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(f"Database error in create_category: {str(e)}")
+            current_app.logger.exception("Database error in create_category: %s", e)
             raise Exception("Failed to create category due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(f"Unexpected error in create_category: {str(e)}")
+            current_app.logger.exception("Unexpected error in create_category: %s", e)
 
     def update_category(
         self, category_id: str, update_data: Dict[str, Any]
@@ -578,18 +747,18 @@ class CategoryService:
 
             db.session.commit()
 
-            current_app.logger.info(f"Category updated: {category.name}")
+            current_app.logger.info("Category updated: %s", category.name)
             return category
 
         except ValueError:
             raise
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(f"Database error in update_category: {str(e)}")
+            current_app.logger.exception("Database error in update_category: %s", e)
             raise Exception("Failed to update category due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(f"Unexpected error in update_category: {str(e)}")
+            current_app.logger.exception("Unexpected error in update_category: %s", e)
             raise Exception("Failed to update category")
 
     def delete_category(self, category_id: str) -> bool:
@@ -600,51 +769,60 @@ class CategoryService:
                 return False
 
             # Check if category has registrations
-            if len(category.registrations) > 0:
+            if _has_registrations(Registration.category_id == category.id):
                 raise ValueError("Cannot delete category with existing registrations")
 
             db.session.delete(category)
             db.session.commit()
 
-            current_app.logger.info(f"Category deleted: {category.name}")
+            current_app.logger.info("Category deleted: %s", category.name)
             return True
 
         except ValueError:
             raise
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(f"Database error in delete_category: {str(e)}")
+            current_app.logger.exception("Database error in delete_category: %s", e)
             raise Exception("Failed to delete category due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(f"Unexpected error in delete_category: {str(e)}")
+            current_app.logger.exception("Unexpected error in delete_category: %s", e)
             raise Exception("Failed to delete category")
 
 
 class CustomFieldService:
     """Service class for custom field-related business logic"""
 
+    __slots__ = ()
+
     def get_custom_field_by_id(self, field_id: str) -> Optional[CustomField]:
         """Get custom field by ID"""
         try:
-            return CustomField.query.filter_by(id=field_id).first()
+            return db.session.get(CustomField, field_id)
         except SQLAlchemyError as e:
-            current_app.logger.error(
-                f"Database error in get_custom_field_by_id: {str(e)}"
+            current_app.logger.exception(
+                "Database error in get_custom_field_by_id: %s", e
             )
             return None
 
-    def get_camp_custom_fields(self, camp_id: str) -> List[CustomField]:
-        """Get all custom fields for a camp"""
+    def get_camp_custom_fields(
+        self, camp_id: str, as_dict: bool = False
+    ) -> Union[List[CustomField], Sequence[RowMapping]]:
+        """Get all custom fields for a camp (as column mappings with as_dict, for list responses)"""
         try:
+            if as_dict:
+                return _column_rows(
+                    CustomField, CustomField.camp_id == camp_id,
+                    order_by=(CustomField.order, CustomField.field_name),
+                )
             return (
                 CustomField.query.filter_by(camp_id=camp_id)
                 .order_by(CustomField.order, CustomField.field_name)
                 .all()
             )
         except SQLAlchemyError as e:
-            current_app.logger.error(
-                f"Database error in get_camp_custom_fields: {str(e)}"
+            current_app.logger.exception(
+                "Database error in get_camp_custom_fields: %s", e
             )
             return []
 
@@ -696,7 +874,7 @@ class CustomFieldService:
             db.session.commit()
 
             current_app.logger.info(
-                f"New custom field created: {new_field.field_name} for camp {field_data['camp_id']}"
+                "New custom field created: %s for camp %s", new_field.field_name, field_data['camp_id']
             )
             return new_field
 
@@ -704,12 +882,12 @@ class CustomFieldService:
             raise
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(f"Database error in create_custom_field: {str(e)}")
+            current_app.logger.exception("Database error in create_custom_field: %s", e)
             raise Exception("Failed to create custom field due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(
-                f"Unexpected error in create_custom_field: {str(e)}"
+            current_app.logger.exception(
+                "Unexpected error in create_custom_field: %s", e
             )
             raise Exception("Failed to create custom field")
 
@@ -722,6 +900,10 @@ class CustomFieldService:
             if not custom_field:
                 return None
 
+            # Idempotent retries: nothing to validate or write
+            if _is_noop_update(custom_field, update_data):
+                return custom_field
+
             # Validate field type if being updated
             if "field_type" in update_data:
                 valid_types = ["text", "number", "dropdown", "checkbox", "date"]
@@ -768,19 +950,19 @@ class CustomFieldService:
 
             db.session.commit()
 
-            current_app.logger.info(f"Custom field updated: {custom_field.field_name}")
+            current_app.logger.info("Custom field updated: %s", custom_field.field_name)
             return custom_field
 
         except ValueError:
             raise
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(f"Database error in update_custom_field: {str(e)}")
+            current_app.logger.exception("Database error in update_custom_field: %s", e)
             raise Exception("Failed to update custom field due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(
-                f"Unexpected error in update_custom_field: {str(e)}"
+            current_app.logger.exception(
+                "Unexpected error in update_custom_field: %s", e
             )
             raise Exception("Failed to update custom field")
 
@@ -796,17 +978,17 @@ class CustomFieldService:
             db.session.delete(custom_field)
             db.session.commit()
 
-            current_app.logger.info(f"Custom field deleted: {custom_field.field_name}")
+            current_app.logger.info("Custom field deleted: %s", custom_field.field_name)
             return True
 
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(f"Database error in delete_custom_field: {str(e)}")
+            current_app.logger.exception("Database error in delete_custom_field: %s", e)
             raise Exception("Failed to delete custom field due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(
-                f"Unexpected error in delete_custom_field: {str(e)}"
+            current_app.logger.exception(
+                "Unexpected error in delete_custom_field: %s", e
             )
             raise Exception("Failed to delete custom field")
 
@@ -814,37 +996,84 @@ class CustomFieldService:
 class RegistrationLinkService:
     """Service class for registration link-related business logic"""
 
+    __slots__ = ()
+
     def get_registration_link_by_id(self, link_id: str) -> Optional[RegistrationLink]:
         """Get registration link by ID"""
         try:
-            return RegistrationLink.query.filter_by(id=link_id).first()
+            return db.session.get(RegistrationLink, link_id)
         except SQLAlchemyError as e:
-            current_app.logger.error(
-                f"Database error in get_registration_link_by_id: {str(e)}"
+            current_app.logger.exception(
+                "Database error in get_registration_link_by_id: %s", e
             )
             return None
 
     def get_registration_link_by_token(self, token: str) -> Optional[RegistrationLink]:
         """Get registration link by token"""
         try:
-            return RegistrationLink.query.filter_by(link_token=token).first()
+            return db.session.execute(
+                LINK_BY_TOKEN, {"link_token": token}
+            ).scalar_one_or_none()
         except SQLAlchemyError as e:
-            current_app.logger.error(
-                f"Database error in get_registration_link_by_token: {str(e)}"
+            current_app.logger.exception(
+                "Database error in get_registration_link_by_token: %s", e
             )
             return None
 
-    def get_camp_registration_links(self, camp_id: str) -> List[RegistrationLink]:
-        """Get all registration links for a camp"""
+    def get_link_with_registration_count(
+        self, token: str
+    ) -> Optional[Tuple[RegistrationLink, int, bool, bool]]:
+        """
+        Get a registration link with its camp loaded, the camp's registration
+        count and whether the camp is still open, in one query
+
+        Returns (link, registration_count, deadline_ok, capacity_ok). The
+        deadline and capacity comparisons run in the database.
+        """
         try:
+            registration_count = (
+                select(func.count(Registration.id))
+                .where(Registration.camp_id == RegistrationLink.camp_id)
+                .scalar_subquery()
+            )
+            # Naive UTC, matching how the DateTime columns are stored
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            return (
+                db.session.query(
+                    RegistrationLink,
+                    registration_count,
+                    (Camp.registration_deadline >= now).label('deadline_ok'),
+                    (registration_count < Camp.capacity).label('capacity_ok'),
+                )
+                .join(RegistrationLink.camp)
+                .options(contains_eager(RegistrationLink.camp))
+                .filter(RegistrationLink.link_token == token)
+                .first()
+            )
+        except SQLAlchemyError as e:
+            current_app.logger.exception(
+                "Database error in get_link_with_registration_count: %s", e
+            )
+            return None
+
+    def get_camp_registration_links(
+        self, camp_id: str, as_dict: bool = False
+    ) -> Union[List[RegistrationLink], Sequence[RowMapping]]:
+        """Get all registration links for a camp (as column mappings with as_dict, for list responses)"""
+        try:
+            if as_dict:
+                return _column_rows(
+                    RegistrationLink, RegistrationLink.camp_id == camp_id,
+                    order_by=(RegistrationLink.created_at.desc(),),
+                )
             return (
                 RegistrationLink.query.filter_by(camp_id=camp_id)
                 .order_by(RegistrationLink.created_at.desc())
                 .all()
             )
         except SQLAlchemyError as e:
-            current_app.logger.error(
-                f"Database error in get_camp_registration_links: {str(e)}"
+            current_app.logger.exception(
+                "Database error in get_camp_registration_links: %s", e
             )
             return []
 
@@ -888,7 +1117,7 @@ class RegistrationLinkService:
             db.session.commit()
 
             current_app.logger.info(
-                f"New registration link created: {new_link.name} for camp {link_data['camp_id']}"
+                "New registration link created: %s for camp %s", new_link.name, link_data['camp_id']
             )
             return new_link
 
@@ -896,14 +1125,14 @@ class RegistrationLinkService:
             raise
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(
-                f"Database error in create_registration_link: {str(e)}"
+            current_app.logger.exception(
+                "Database error in create_registration_link: %s", e
             )
             raise Exception("Failed to create registration link due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(
-                f"Unexpected error in create_registration_link: {str(e)}"
+            current_app.logger.exception(
+                "Unexpected error in create_registration_link: %s", e
             )
 
     def update_registration_link(
@@ -952,21 +1181,21 @@ class RegistrationLinkService:
 
             db.session.commit()
 
-            current_app.logger.info(f"Registration link updated: {link.name}")
+            current_app.logger.info("Registration link updated: %s", link.name)
             return link
 
         except ValueError:
             raise
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(
-                f"Database error in update_registration_link: {str(e)}"
+            current_app.logger.exception(
+                "Database error in update_registration_link: %s", e
             )
             raise Exception("Failed to update registration link due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(
-                f"Unexpected error in update_registration_link: {str(e)}"
+            current_app.logger.exception(
+                "Unexpected error in update_registration_link: %s", e
             )
             raise Exception("Failed to update registration link")
 
@@ -978,7 +1207,7 @@ class RegistrationLinkService:
                 return False
 
             # Check if link has registrations
-            if len(link.registrations) > 0:
+            if _has_registrations(Registration.registration_link_id == link.id):
                 raise ValueError(
                     "Cannot delete registration link with existing registrations"
                 )
@@ -986,21 +1215,21 @@ class RegistrationLinkService:
             db.session.delete(link)
             db.session.commit()
 
-            current_app.logger.info(f"Registration link deleted: {link.name}")
+            current_app.logger.info("Registration link deleted: %s", link.name)
             return True
 
         except ValueError:
             raise
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(
-                f"Database error in delete_registration_link: {str(e)}"
+            current_app.logger.exception(
+                "Database error in delete_registration_link: %s", e
             )
             raise Exception("Failed to delete registration link due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(
-                f"Unexpected error in delete_registration_link: {str(e)}"
+            current_app.logger.exception(
+                "Unexpected error in delete_registration_link: %s", e
             )
             raise Exception("Failed to delete registration link")
 
@@ -1015,19 +1244,19 @@ class RegistrationLinkService:
             db.session.commit()
 
             status = "activated" if link.is_active else "deactivated"
-            current_app.logger.info(f"Registration link {status}: {link.name}")
+            current_app.logger.info("Registration link %s: %s", status, link.name)
             return link
 
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(
-                f"Database error in toggle_registration_link: {str(e)}"
+            current_app.logger.exception(
+                "Database error in toggle_registration_link: %s", e
             )
             raise Exception("Failed to toggle registration link due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(
-                f"Unexpected error in toggle_registration_link: {str(e)}"
+            current_app.logger.exception(
+                "Unexpected error in toggle_registration_link: %s", e
             )
             raise Exception("Failed to toggle registration link")
 
@@ -1035,38 +1264,76 @@ class RegistrationLinkService:
 class RegistrationService:
     """Service class for registration-related business logic"""
 
+    __slots__ = ()
+
     def get_registration_by_id(self, registration_id: str) -> Optional[Registration]:
         """Get registration by ID"""
         try:
-            return Registration.query.filter_by(id=registration_id).first()
+            return db.session.get(Registration, registration_id)
+        except SQLAlchemyError as e:
+            current_app.logger.exception(
+                "Database error in get_registration_by_id: %s", e
+            )
+            return None
+
+    def get_registration_updated_at(self, registration_id: str) -> Optional[datetime]:
+        """Get only a registration's updated_at, for conditional GETs (None if not found)"""
+        try:
+            return (
+                db.session.query(Registration.updated_at)
+                .filter(Registration.id == registration_id)
+                .scalar()
+            )
         except SQLAlchemyError as e:
-            current_app.logger.error(
-                f"Database error in get_registration_by_id: {str(e)}"
+            current_app.logger.exception(
+                "Database error in get_registration_updated_at: %s", e
             )
             return None
 
-    def get_camp_registrations(self, camp_id: str) -> List[Registration]:
-        """Get all registrations for a camp"""
+    def get_camp_registrations(
+        self, camp_id: str, as_dict: bool = False
+    ) -> Union[List[Registration], Sequence[RowMapping]]:
+        """Get all registrations for a camp (as column mappings with as_dict, for list responses)"""
         try:
+            if as_dict:
+                return _column_rows(
+                    Registration, Registration.camp_id == camp_id,
+                    order_by=(Registration.registration_date.desc(),),
+                )
             return (
                 Registration.query.filter_by(camp_id=camp_id)
                 .order_by(Registration.registration_date.desc())
                 .all()
             )
         except SQLAlchemyError as e:
-            current_app.logger.error(
-                f"Database error in get_camp_registrations: {str(e)}"
+            current_app.logger.exception(
+                "Database error in get_camp_registrations: %s", e
             )
             return []
 
+    def iter_camp_registrations(
+        self, camp_id: str, batch_size: int = 500
+    ) -> Iterator[RowMapping]:
+        """
+        Iterate a camp's registrations as column mappings, in the order of
+        get_camp_registrations, fetching batch_size rows at a time
+        """
+        stmt = (
+            select(Registration.__table__)
+            .where(Registration.camp_id == camp_id)
+            .order_by(Registration.registration_date.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        return db.session.execute(stmt).mappings()
+
     def get_registration_form(
         self, camp_id: str, link_token: str = None
     ) -> Optional[Dict[str, Any]]:
         """Get registration form structure"""
         try:
-            # Get camp
-            camp = Camp.query.filter_by(id=camp_id, is_active=True).first()
-            if not camp:
+            # Camp, churches, categories and custom fields come from the per-process form cache
+            sections = get_form_sections(camp_id, lambda: self._build_form_sections(camp_id))
+            if not sections:
                 return None
 
             # TODO: fix this
@@ -1074,61 +1341,75 @@ class RegistrationService:
             # if datetime.now(timezone.utc) > camp.registration_deadline.replace(tzinfo=timezone.utc):
             #     return None
 
-            # Get churches
-            churches = (
-                Church.query.filter_by(camp_id=camp_id).order_by(Church.name).all()
-            )
-
-            # Get custom fields
-            custom_fields = (
-                CustomField.query.filter_by(camp_id=camp_id)
-                .order_by(CustomField.order, CustomField.field_name)
-                .all()
-            )
-
             # Get categories based on link type
             registration_link = None
             if link_token:
-                registration_link = RegistrationLink.query.filter_by(
-                    link_token=link_token
-                ).first()
+                registration_link = load_link(link_token)
                 if not registration_link or not registration_link.is_valid():
                     return None
 
                 # Get only allowed categories
-                categories = (
-                    Category.query.filter(
-                        Category.camp_id == camp_id,
-                        Category.id.in_(registration_link.allowed_categories),
-                    )
-                    .order_by(Category.name)
-                    .all()
-                )
+                allowed_categories = registration_link.allowed_categories_set
+                categories = [
+                    category
+                    for category in sections["categories"]
+                    if category["id"] in allowed_categories
+                ]
                 link_type = "category_specific"
             else:
                 # Get all categories
-                categories = (
-                    Category.query.filter_by(camp_id=camp_id)
-                    .order_by(Category.name)
-                    .all()
-                )
+                categories = sections["categories"]
                 link_type = "general"
 
             return {
-                "camp": camp.to_dict(),
-                "churches": [church.to_dict() for church in churches],
-                "categories": [category.to_dict() for category in categories],
-                "custom_fields": [field.to_dict() for field in custom_fields],
+                "camp": sections["camp"],
+                "churches": sections["churches"],
+                "categories": categories,
+                "custom_fields": sections["custom_fields"],
                 "link_type": link_type,
                 "registration_link": (
-                    registration_link.to_dict() if registration_link else None
+                    registration_link.to_dict(include_relations=False)
+                    if registration_link
+                    else None
                 ),
             }
 
         except Exception as e:
-            current_app.logger.error(f"Error in get_registration_form: {str(e)}")
+            current_app.logger.exception("Error in get_registration_form: %s", e)
             return None
 
+    def _build_form_sections(self, camp_id: str) -> Optional[Dict[str, Any]]:
+        """Load the link-independent parts of a camp's registration form"""
+        # Get camp
+        camp = Camp.query.filter_by(id=camp_id, is_active=True).first()
+        if not camp:
+            return None
+
+        # Get churches
+        churches = Church.query.filter_by(camp_id=camp_id).order_by(Church.name).all()
+
+        # Get custom fields
+        custom_fields = (
+            CustomField.query.filter_by(camp_id=camp_id)
+            .order_by(CustomField.order, CustomField.field_name)
+            .all()
+        )
+
+        # Get all categories; link-specific filtering happens per request
+        categories = (
+            Category.query.filter_by(camp_id=camp_id).order_by(Category.name).all()
+        )
+
+        # The form schema never exposes the registrations behind churches and categories
+        return {
+            "camp": camp.to_dict(include_relations=False),
+            "churches": [church.to_dict(include_relations=False) for church in churches],
+            "categories": [
+                category.to_dict(include_relations=False) for category in categories
+            ],
+            "custom_fields": [field.to_dict() for field in custom_fields],
+        }
+
     def create_registration(
         self, registration_data: Dict[str, Any], link_token: str = None
     ) -> Optional[Registration]:
@@ -1164,9 +1445,11 @@ class RegistrationService:
                 raise ValueError("Registration deadline has passed")
 
             # Check capacity
-            current_registrations = Registration.query.filter_by(
-                camp_id=camp.id
-            ).count()
+            current_registrations = (
+                db.session.query(func.count(Registration.id))
+                .filter(Registration.camp_id == camp.id)
+                .scalar()
+            )
             if current_registrations >= camp.capacity:
                 raise ValueError("Camp is at full capacity")
 
@@ -1187,31 +1470,28 @@ class RegistrationService:
             # If using registration link, validate category is allowed
             registration_link = None
             if link_token:
-                registration_link = RegistrationLink.query.filter_by(
-                    link_token=link_token
-                ).first()
+                registration_link = load_link(link_token)
                 if not registration_link or not registration_link.is_valid():
                     raise ValueError("Invalid or expired registration link")
 
-                if str(category.id) not in registration_link.allowed_categories:
+                if category.id not in registration_link.allowed_categories_set:
                     raise ValueError(
                         "Selected category is not allowed for this registration link"
                     )
 
             # Calculate total amount
-            base_fee = float(camp.base_fee)
-            total_amount = base_fee
-
-            if category.discount_amount and category.discount_amount > 0:
-                total_amount = max(0, base_fee - float(category.discount_amount))
-            elif category.discount_percentage and category.discount_percentage > 0:
-                discount = base_fee * (float(category.discount_percentage) / 100)
-                total_amount = max(0, base_fee - discount)
+            total_amount = Registration.compute_total_amount(
+                camp.base_fee, category.discount_amount, category.discount_percentage
+            )
 
             
             # exiting camp codes
-            campers: List[Registration] = Registration.query.filter_by(camp_id=camp.id).all()
-            existing_codes = [camper.to_dict(for_api=True)['camper_code'] for camper in campers]
+            existing_codes = {
+                code
+                for (code,) in db.session.query(Registration.camper_code).filter(
+                    Registration.camp_id == camp.id
+                )
+            }
 
             camper_code = self._make_code(existing_codes)
 
@@ -1239,7 +1519,7 @@ class RegistrationService:
                 custom_field_responses=registration_data.get(
                     "custom_field_responses", {}
                 ),
-                total_amount=Decimal(str(total_amount)),
+                total_amount=total_amount,
                 registration_link_id=(
                     registration_link.id if registration_link else None
                 ),
@@ -1249,13 +1529,16 @@ class RegistrationService:
             db.session.add(new_registration)
 
             # Update registration link usage count if applicable
-            if registration_link:
-                registration_link.usage_count += 1
+            if registration_link and not _consume_link(registration_link.id):
+                db.session.rollback()
+                raise ValueError("Invalid or expired registration link")
 
+            # Copied before the commit expires the instances, so logging doesn't reload them
+            surname, last_name, camp_name = new_registration.surname, new_registration.last_name, camp.name
             db.session.commit()
 
             current_app.logger.info(
-                f"New registration created: {new_registration.surname} {new_registration.last_name} for camp {camp.name}"
+                "New registration created: %s %s for camp %s", surname, last_name, camp_name
             )
             return new_registration
 
@@ -1263,16 +1546,17 @@ class RegistrationService:
             raise
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(f"Database error in create_registration: {str(e)}")
+            current_app.logger.exception("Database error in create_registration: %s", e)
             raise Exception("Failed to create registration due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(
-                f"Unexpected error in create_registration: {str(e)}"
+            current_app.logger.exception(
+                "Unexpected error in create_registration: %s", e
             )
+            raise Exception("Failed to create registration")
 
    
-    def _make_code(self, existing_codes: List[str]) -> str:
+    def _make_code(self, existing_codes: Set[str]) -> str:
         import string
         import random
         
@@ -1294,6 +1578,10 @@ class RegistrationService:
             if not registration:
                 return None
 
+            # Idempotent retries: nothing to validate or write
+            if _is_noop_update(registration, update_data):
+                return registration
+
             # Validate church if being updated
             if "church_id" in update_data:
                 church = Church.query.filter_by(
@@ -1311,24 +1599,12 @@ class RegistrationService:
                     raise ValueError("Invalid category selection")
 
                 # Recalculate total amount if category changed
-                if str(category.id) != str(registration.category_id):
-                    base_fee = float(registration.camp.base_fee)
-                    total_amount = base_fee
-
-                    if category.discount_amount and category.discount_amount > 0:
-                        total_amount = max(
-                            0, base_fee - float(category.discount_amount)
-                        )
-                    elif (
-                        category.discount_percentage
-                        and category.discount_percentage > 0
-                    ):
-                        discount = base_fee * (
-                            float(category.discount_percentage) / 100
-                        )
-                        total_amount = max(0, base_fee - discount)
-
-                    registration.total_amount = Decimal(str(total_amount))
+                if category.id != registration.category_id:
+                    registration.total_amount = Registration.compute_total_amount(
+                        registration.camp.base_fee,
+                        category.discount_amount,
+                        category.discount_percentage,
+                    )
 
             # Validate age if being updated
             if "age" in update_data and update_data["age"] is not None:
@@ -1378,7 +1654,7 @@ class RegistrationService:
             db.session.commit()
 
             current_app.logger.info(
-                f"Registration updated: {registration.surname} {registration.last_name}"
+                "Registration updated: %s %s", registration.surname, registration.last_name
             )
             return registration
 
@@ -1386,12 +1662,12 @@ class RegistrationService:
             raise
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(f"Database error in update_registration: {str(e)}")
+            current_app.logger.exception("Database error in update_registration: %s", e)
             raise Exception("Failed to update registration due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(
-                f"Unexpected error in update_registration: {str(e)}"
+            current_app.logger.exception(
+                "Unexpected error in update_registration: %s", e
             )
             raise Exception("Failed to update registration")
 
@@ -1412,18 +1688,18 @@ class RegistrationService:
             db.session.commit()
 
             current_app.logger.info(
-                f"Registration cancelled: {registration.surname} {registration.last_name}"
+                "Registration cancelled: %s %s", registration.surname, registration.last_name
             )
             return True
 
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(f"Database error in cancel_registration: {str(e)}")
+            current_app.logger.exception("Database error in cancel_registration: %s", e)
             raise Exception("Failed to cancel registration due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(
-                f"Unexpected error in cancel_registration: {str(e)}"
+            current_app.logger.exception(
+                "Unexpected error in cancel_registration: %s", e
             )
             raise Exception("Failed to cancel registration")
 
@@ -1444,12 +1720,12 @@ class RegistrationService:
                 payment_method = payment_data.get("payment_method", "manual")
                 transaction_id = payment_data.get("transaction_id", "")
                 current_app.logger.info(
-                    f"Payment marked as paid for registration {registration_id}: "
-                    f"method={payment_method}, transaction={transaction_id}"
+                    "Payment marked as paid for registration %s: method=%s, transaction=%s",
+                    registration_id, payment_method, transaction_id
                 )
             else:
                 current_app.logger.info(
-                    f"Payment marked as unpaid for registration {registration_id}"
+                    "Payment marked as unpaid for registration %s", registration_id
                 )
 
             db.session.commit()
@@ -1458,14 +1734,14 @@ class RegistrationService:
 
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(
-                f"Database error in update_payment_status: {str(e)}"
+            current_app.logger.exception(
+                "Database error in update_payment_status: %s", e
             )
             raise Exception("Failed to update payment status due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(
-                f"Unexpected error in update_payment_status: {str(e)}"
+            current_app.logger.exception(
+                "Unexpected error in update_payment_status: %s", e
             )
             raise Exception("Failed to update payment status")
 
@@ -1483,7 +1759,7 @@ class RegistrationService:
 
             status = "checked in" if has_checked_in else "checked out"
             current_app.logger.info(
-                f"Registration {status}: {registration.surname} {registration.last_name}"
+                "Registration %s: %s %s", status, registration.surname, registration.last_name
             )
 
             db.session.commit()
@@ -1492,13 +1768,13 @@ class RegistrationService:
 
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(
-                f"Database error in update_checkin_status: {str(e)}"
+            current_app.logger.exception(
+                "Database error in update_checkin_status: %s", e
             )
             raise Exception("Failed to update check-in status due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(
-                f"Unexpected error in update_checkin_status: {str(e)}"
+            current_app.logger.exception(
+                "Unexpected error in update_checkin_status: %s", e
             )
             raise Exception("Failed to update check-in status")
@@ -12,6 +12,10 @@ from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_bcrypt import Bcrypt
+from flask_compress import Compress
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+import sqlite3
 import traceback
 
 # Database
@@ -29,6 +33,9 @@ cors = CORS()
 # Bcrypt
 bcrypt = Bcrypt()
 
+# Response compression
+compress = Compress()
+
 # Rate limiting
 limiter = Limiter(
     key_func=get_remote_address,
@@ -36,6 +43,15 @@ limiter = Limiter(
 )
 
 
+@event.listens_for(Engine, 'connect')
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """SQLite only enforces foreign keys (and ON DELETE CASCADE) when asked per connection"""
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA foreign_keys=ON')
+        cursor.close()
+
+
 def init_extensions(app):
     """Initialize Flask extensions with the app instance"""
     
@@ -55,6 +71,9 @@ def init_extensions(app):
                   allow_headers=['Content-Type', 'Authorization'],
                   supports_credentials=True)
     
+    # Initialize response compression
+    compress.init_app(app)
+    
     # Initialize rate limiter
     # limiter.init_app(app)
     
@@ -146,7 +165,7 @@ def configure_jwt_callbacks(app):
         from .user.models import User
         
         identity = jwt_data["sub"]
-        return User.query.filter_by(id=identity).first()
+        return db.session.get(User, identity)
 
 
 def register_error_handlers(app):
@@ -243,7 +262,7 @@ def register_error_handlers(app):
     @app.errorhandler(500)
     def internal_server_error(error):
         """Handle 500 Internal Server Error"""
-        app.logger.error(f"Internal server error: {str(error)}")
+        app.logger.error("Internal server error: %s", error)
         app.logger.error(traceback.format_exc())
         return {
             'data': {
@@ -256,8 +275,9 @@ def register_error_handlers(app):
     @app.errorhandler(Exception)
     def handle_unexpected_error(error):
         """Handle unexpected errors"""
-        app.logger.error(f"Unexpected error: {str(error)}", exc_info=True)
-        app.logger.error(traceback.format_exc())
+        # Views no longer catch broad exceptions themselves; discard any half-done unit of work
+        db.session.rollback()
+        app.logger.error("Unexpected error: %s", error, exc_info=True)
         return {
             'data': {
                 'code': 'UNEXPECTED_ERROR',
@@ -1,4 +1,3 @@
-import requests
 from globals import SMTP2GO_API_KEY
 
 from flask import render_template
@@ -8,6 +7,19 @@ class Mailer(object):
     def __init__(self):
         self.api_key = SMTP2GO_API_KEY
         self.api_url = "https://api.smtp2go.com/v3/email/send"
+        self._session = None
+
+    def _http(self):
+        """Shared HTTP session so sends reuse the pooled keep-alive connection to the API"""
+        if self._session is None:
+            # Imported lazily so loading the public routes doesn't pull in requests
+            import requests
+
+            self._session = requests.Session()
+            self._session.headers.update(
+                {"accept": "application/json", "Content-Type": "application/json"}
+            )
+        return self._session
 
     def generate_email_text(self, template_name, context={}):
         return render_template(template_name, **context)
@@ -31,7 +43,6 @@ class Mailer(object):
         :return: Response from the SMTP2GO API
         """
 
-        headers = {"accept": "application/json", "Content-Type": "application/json"}
         payload = {
             "api_key": self.api_key,
             "to": recipients,
@@ -41,9 +52,8 @@ class Mailer(object):
             "html_body": text if html else None,
         }
 
-        response = requests.post(self.api_url, headers=headers, json=payload)
+        response = self._http().post(self.api_url, json=payload, timeout=10)
         response.raise_for_status()  # Raise an exception for HTTP errors
-        print(response.json())
         return response.json()
 
 
@@ -0,0 +1,69 @@
+"""
+Background delivery of registration notifications
+
+The email and SMS providers are plain HTTP APIs that can take seconds to answer,
+so public registration hands the confirmation to a small thread pool and returns
+as soon as the registration is committed. Worker threads reload the rows in
+their own app context and log delivery failures instead of failing the request.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import current_app
+
+from .mailer import mailer
+from .sms import sms
+
+
+SUPPORT_EMAIL = "support@campmanager.com"
+
+# Provider calls are I/O bound; two workers per process keep SMTP backpressure off request threads
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='notifications')
+
+
+def _send_registration_confirmation(app, registration_id: str, camp_id: str) -> None:
+    """Render and send the confirmation email and SMS for a registration"""
+    # Import here to avoid circular imports
+    from app.camp.models import Camp, Registration
+    from app.extensions import db
+
+    with app.app_context():
+        try:
+            registration = db.session.get(Registration, registration_id)
+            camp = db.session.get(Camp, camp_id)
+            if not registration or not camp:
+                app.logger.warning("Skipping confirmation for missing registration %s", registration_id)
+                return
+
+            if registration.email:
+                message = mailer.generate_email_text('registration-successful.html', {
+                    "camp_name": camp.name,
+                    "participant_surname": registration.surname,
+                    "participant_middle_name": registration.middle_name,
+                    "participant_last_name": registration.last_name,
+                    "camper_code": registration.camper_code,
+                    "total_amount": registration.total_amount,
+                    "camp_start_date": camp.start_date,
+                    "camp_end_date": camp.end_date,
+                    "camp_location": camp.location,
+                    "support_email": SUPPORT_EMAIL
+                })
+                mailer.send_email(
+                    recipients=[registration.email],
+                    subject='Registration Successful',
+                    text=message,
+                    html=True,
+                )
+
+            sms_message = f'''
+        Hi {registration.surname}! Your registration for {camp.name} is confirmed. Camper Code: {registration.camper_code}. Start: {camp.start_date}. For help, contact {SUPPORT_EMAIL}.
+        '''
+            sms.send_sms(registration.phone_number, sms_message)
+        except Exception as e:
+            app.logger.exception("Registration confirmation error for %s: %s", registration_id, e)
+
+
+def queue_registration_confirmation(registration_id: str, camp_id: str) -> None:
+    """Send the registration confirmation on a background thread"""
+    app = current_app._get_current_object()
+    _executor.submit(_send_registration_confirmation, app, registration_id, camp_id)
@@ -1,4 +1,3 @@
-import requests
 from globals import SMS_API_KEY
 
 class SMS(object):
@@ -8,6 +7,9 @@ class SMS(object):
 
 
     def send_sms(self, phone_number, message):
+        # Imported lazily so loading the public routes doesn't pull in requests
+        import requests
+
         headers = {
             "api-key": self.api_key,
             "Content-Type": "application/json"
@@ -10,6 +10,7 @@ from .schemas import (
     UserResponseWrapperSchema
 )
 from .services import UserService
+from app._shared.auth_cache import forget_token
 
 
 # Create APIBlueprint for automatic OpenAPI documentation
@@ -42,7 +43,7 @@ def register(json_data):
         
     except ValueError as e:
         # Handle validation errors from service
-        current_app.logger.warning(f"Registration validation error: {str(e)}")
+        current_app.logger.warning("Registration validation error: %s", e)
         if "already exists" in str(e):
             return jsonify({
                 'data': {
@@ -60,7 +61,7 @@ def register(json_data):
                 }
             }), 400
     except Exception as e:
-        current_app.logger.error(f"Registration error: {str(e)}")
+        current_app.logger.exception("Registration error: %s", e)
         return jsonify({
             'data': {
                 'code': 'REGISTRATION_ERROR',
@@ -99,14 +100,19 @@ def login(json_data):
                 }
             }), 401
         
-        # Create JWT tokens - don't use additional_claims here, let the callback handle it
+        # Create JWT tokens with the same claims as /refresh so role checks can read them
         access_token = create_access_token(
-            identity=str(user.id),
+            identity=user.id,
+            additional_claims={
+                'email': user.email,
+                'role': user.role,
+                'full_name': user.full_name
+            },
             expires_delta=timedelta(hours=24)
         )
         
         refresh_token = create_refresh_token(
-            identity=str(user.id),
+            identity=user.id,
             expires_delta=timedelta(days=30)
         )
         
@@ -120,7 +126,7 @@ def login(json_data):
         }), 200
         
     except Exception as e:
-        current_app.logger.error(f"Login error: {str(e)}")
+        current_app.logger.exception("Login error: %s", e)
         return jsonify({
             'data': {
                 'code': 'LOGIN_ERROR',
@@ -189,7 +195,7 @@ def refresh():
         }, 200
         
     except Exception as e:
-        current_app.logger.error(f"Token refresh error: {str(e)}")
+        current_app.logger.exception("Token refresh error: %s", e)
         return {
             'data': {
                 'code': 'REFRESH_ERROR',
@@ -211,6 +217,8 @@ def logout():
     try:
         # Note: In a production app, you might want to blacklist the token
         # For now, we'll just return success and let client handle token removal
+        # Stop honouring this token from the verified-token cache
+        forget_token(request.headers.get('Authorization', '').removeprefix('Bearer '))
         
         return {
             'data': {
@@ -219,7 +227,7 @@ def logout():
         }, 200
         
     except Exception as e:
-        current_app.logger.error(f"Logout error: {str(e)}")
+        current_app.logger.exception("Logout error: %s", e)
         return {
             'data': {
                 'code': 'LOGOUT_ERROR',
@@ -257,7 +265,7 @@ def get_current_user():
         }, 200
         
     except Exception as e:
-        current_app.logger.error(f"Get current user error: {str(e)}")
+        current_app.logger.exception("Get current user error: %s", e)
         return {
             'data': {
                 'code': 'GET_USER_ERROR',
@@ -296,7 +304,7 @@ def update_current_user(json_data):
         # Check if email is being changed and already exists
         if 'email' in update_data:
             existing_user = user_service.get_user_by_email(update_data['email'])
-            if existing_user and str(existing_user.id) != current_user_id:
+            if existing_user and existing_user.id != current_user_id:
                 return {
                     'data': {
                         'code': 'EMAIL_EXISTS',
@@ -321,7 +329,7 @@ def update_current_user(json_data):
         }, 200
         
     except Exception as e:
-        current_app.logger.error(f"Update user error: {str(e)}")
+        current_app.logger.exception("Update user error: %s", e)
         return {
             'data': {
                 'code': 'UPDATE_USER_ERROR',
@@ -381,7 +389,7 @@ def change_password(json_data):
         }, 200
         
     except Exception as e:
-        current_app.logger.error(f"Change password error: {str(e)}")
+        current_app.logger.exception("Change password error: %s", e)
         return {
             'data': {
                 'code': 'CHANGE_PASSWORD_ERROR',
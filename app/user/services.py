@@ -10,6 +10,9 @@ from app.camp.models import CampWorker
 class UserService:
     """Service class for user-related business logic"""
 
+    # Stateless: one shared instance serves every request; db.session is already scoped per request
+    __slots__ = ()
+
     def get_all_users(self) -> list[User]:
         """
         Get all users
@@ -20,7 +23,7 @@ class UserService:
         try:
             return User.query.all()
         except SQLAlchemyError as e:
-            current_app.logger.error(f"Database error in get_all_users: {str(e)}")
+            current_app.logger.exception("Database error in get_all_users: %s", e)
             return [User.query.first()]
     
     def get_user_by_id(self, user_id: str) -> Optional[User]:
@@ -36,7 +39,7 @@ class UserService:
         try:
             return User.query.filter_by(id=user_id).first()
         except SQLAlchemyError as e:
-            current_app.logger.error(f"Database error in get_user_by_id: {str(e)}")
+            current_app.logger.exception("Database error in get_user_by_id: %s", e)
             return None
     
     def get_user_by_email(self, email: str) -> Optional[User]:
@@ -52,7 +55,7 @@ class UserService:
         try:
             return User.query.filter_by(email=email.lower()).first()
         except SQLAlchemyError as e:
-            print(f"Database error in get_user_by_email: {str(e)}")
+            current_app.logger.exception("Database error in get_user_by_email: %s", e)
             return None
     
     def create_user(self, user_data: Dict[str, Any]) -> Optional[User]:
@@ -123,7 +126,7 @@ class UserService:
                 db.session.add(new_camp_worker)
                 db.session.commit()
             
-            current_app.logger.info(f"New user created: {email}")
+            current_app.logger.info("New user created: %s", email)
             return new_user
             
         except ValueError:
@@ -131,11 +134,11 @@ class UserService:
             raise
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(f"Database error in create_user: {str(e)}")
+            current_app.logger.exception("Database error in create_user: %s", e)
             raise Exception("Failed to create user due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(f"Unexpected error in create_user: {str(e)}")
+            current_app.logger.exception("Unexpected error in create_user: %s", e)
             raise Exception("Failed to create user")
     
     def authenticate_user(self, email: str, password: str) -> Optional[User]:
@@ -156,19 +159,19 @@ class UserService:
             # Get user by email
             user = self.get_user_by_email(email.lower().strip())
             if not user:
-                current_app.logger.warning(f"Authentication failed: User not found for email {email}")
+                current_app.logger.warning("Authentication failed: User not found for email %s", email)
                 return None
             
             # Check password
             if not user.check_password(password):
-                current_app.logger.warning(f"Authentication failed: Invalid password for email {email}")
+                current_app.logger.warning("Authentication failed: Invalid password for email %s", email)
                 return None
             
-            current_app.logger.info(f"User authenticated successfully: {email}")
+            current_app.logger.info("User authenticated successfully: %s", email)
             return user
             
         except Exception as e:
-            current_app.logger.error(f"Error in authenticate_user: {str(e)}")
+            current_app.logger.exception("Error in authenticate_user: %s", e)
             return None
     
     def update_user(self, user_id: str, update_data: Dict[str, Any]) -> Optional[User]:
@@ -204,7 +207,7 @@ class UserService:
                 
                 # Check if email is already taken by another user
                 existing_user = self.get_user_by_email(new_email)
-                if existing_user and str(existing_user.id) != user_id:
+                if existing_user and existing_user.id != user_id:
                     raise ValueError("Email already exists")
                 
                 user.email = new_email
@@ -226,7 +229,7 @@ class UserService:
             # Save changes
             db.session.commit()
             
-            current_app.logger.info(f"User updated successfully: {user.email}")
+            current_app.logger.info("User updated successfully: %s", user.email)
             return user
             
         except ValueError:
@@ -234,11 +237,11 @@ class UserService:
             raise
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(f"Database error in update_user: {str(e)}")
+            current_app.logger.exception("Database error in update_user: %s", e)
             raise Exception("Failed to update user due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(f"Unexpected error in update_user: {str(e)}")
+            current_app.logger.exception("Unexpected error in update_user: %s", e)
             raise Exception("Failed to update user")
     
     def change_password(self, user_id: str, current_password: str, new_password: str) -> bool:
@@ -264,7 +267,7 @@ class UserService:
             
             # Verify current password
             if not user.check_password(current_password):
-                current_app.logger.warning(f"Password change failed: Invalid current password for user {user.email}")
+                current_app.logger.warning("Password change failed: Invalid current password for user %s", user.email)
                 return False
             
             # Validate new password
@@ -281,7 +284,7 @@ class UserService:
             # Save changes
             db.session.commit()
             
-            current_app.logger.info(f"Password changed successfully for user: {user.email}")
+            current_app.logger.info("Password changed successfully for user: %s", user.email)
             return True
             
         except ValueError:
@@ -289,11 +292,11 @@ class UserService:
             raise
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(f"Database error in change_password: {str(e)}")
+            current_app.logger.exception("Database error in change_password: %s", e)
             raise Exception("Failed to change password due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(f"Unexpected error in change_password: {str(e)}")
+            current_app.logger.exception("Unexpected error in change_password: %s", e)
             raise Exception("Failed to change password")
     
     def delete_user(self, user_id: str) -> bool:
@@ -318,16 +321,16 @@ class UserService:
             db.session.delete(user)
             db.session.commit()
             
-            current_app.logger.info(f"User deleted successfully: {user.email}")
+            current_app.logger.info("User deleted successfully: %s", user.email)
             return True
             
         except SQLAlchemyError as e:
             db.session.rollback()
-            current_app.logger.error(f"Database error in delete_user: {str(e)}")
+            current_app.logger.exception("Database error in delete_user: %s", e)
             raise Exception("Failed to delete user due to database error")
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(f"Unexpected error in delete_user: {str(e)}")
+            current_app.logger.exception("Unexpected error in delete_user: %s", e)
             raise Exception("Failed to delete user")
     
     def get_users_by_role(self, role: str) -> list[User]:
@@ -347,10 +350,10 @@ class UserService:
             return User.query.filter_by(role=role).all()
             
         except SQLAlchemyError as e:
-            current_app.logger.error(f"Database error in get_users_by_role: {str(e)}")
+            current_app.logger.exception("Database error in get_users_by_role: %s", e)
             return []
         except Exception as e:
-            current_app.logger.error(f"Unexpected error in get_users_by_role: {str(e)}")
+            current_app.logger.exception("Unexpected error in get_users_by_role: %s", e)
             return []
     
     def get_user_stats(self, user_id: str) -> Optional[Dict[str, Any]]:
@@ -400,7 +403,7 @@ class UserService:
             #         member_since_str = str(user.created_at)
             
             return {
-                'user_id': str(user.id),
+                'user_id': user.id,
                 'role': user.role,
                 'camps_managed': camps_count,
                 'active_camps': active_camps,
@@ -410,7 +413,7 @@ class UserService:
             }
             
         except Exception as e:
-            current_app.logger.error(f"Error in get_user_stats: {str(e)}")
+            current_app.logger.exception("Error in get_user_stats: %s", e)
             return None
     
     def validate_user_permissions(self, user_id: str, required_role: str = None) -> bool:
@@ -440,5 +443,5 @@ class UserService:
             return True
             
         except Exception as e:
-            current_app.logger.error(f"Error in validate_user_permissions: {str(e)}")
+            current_app.logger.exception("Error in validate_user_permissions: %s", e)
             return False
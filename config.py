@@ -43,6 +43,7 @@
 
 import os
 from datetime import timedelta
+from functools import lru_cache
 from typing import Type
 
 
@@ -60,12 +61,36 @@ class Config:
         'pool_recycle': 300,
     }
     
+    # Run Alembic upgrade inside create_app (enable for a dedicated migrate entrypoint)
+    RUN_MIGRATIONS_ON_STARTUP = os.environ.get('RUN_MIGRATIONS_ON_STARTUP', 'false').lower() == 'true'
+    # sync: block create_app, async: migrate on a background thread, skip: don't migrate
+    MIGRATION_MODE = os.environ.get('MIGRATION_MODE', 'sync' if RUN_MIGRATIONS_ON_STARTUP else 'skip')
+    
+    # Blueprints registered by create_app (comma separated, empty means all)
+    ENABLED_BLUEPRINTS = [name for name in os.environ.get('ENABLED_BLUEPRINTS', '').split(',') if name]
+    
     # JWT config
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or SECRET_KEY
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=24)
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=30)
     JWT_ALGORITHM = 'HS256'
     JWT_ERROR_MESSAGE_KEY = 'message'
+    
+    # Seconds an authenticated user is cached per process (0 disables the cache)
+    TOKEN_CACHE_TTL = int(os.environ.get('TOKEN_CACHE_TTL', 30))
+    TOKEN_CACHE_MAXSIZE = 10_000
+    # Max seconds a verified bearer token skips signature checks (capped by exp, 0 disables)
+    JWT_VERIFY_CACHE_TTL = int(os.environ.get('JWT_VERIFY_CACHE_TTL', 60))
+    JWT_VERIFY_CACHE_MAXSIZE = 20_000
+    # Seconds a camp's public registration form is cached per process (0 disables the cache)
+    REGISTRATION_FORM_CACHE_TTL = int(os.environ.get('REGISTRATION_FORM_CACHE_TTL', 30))
+    REGISTRATION_FORM_CACHE_MAXSIZE = 1_000
+    # Seconds a camp access check (resource owner, worker membership) is cached per process (0 disables)
+    CAMP_ACCESS_CACHE_TTL = int(os.environ.get('CAMP_ACCESS_CACHE_TTL', 60))
+    CAMP_ACCESS_CACHE_MAXSIZE = 20_000
+    # Seconds a camp's dashboard stats are cached per process (0 disables the cache)
+    CAMP_STATS_CACHE_TTL = int(os.environ.get('CAMP_STATS_CACHE_TTL', 30))
+    CAMP_STATS_CACHE_MAXSIZE = 1_000
     PROPAGATE_EXCEPTIONS = True
     
     # APIFlask config
@@ -89,6 +114,8 @@ class Config:
         {'url': 'http://localhost:5000', 'description': 'Development server'},
         {'url': 'https://api.campmanager.com', 'description': 'Production server'}
     ]
+    # Serve LOCAL_SPEC_PATH verbatim when it exists instead of generating the spec
+    USE_PREBUILT_SPEC = os.environ.get('USE_PREBUILT_SPEC', 'false').lower() == 'true'
     
     # Security config
     WTF_CSRF_ENABLED = False  # Disabled for API
@@ -104,6 +131,14 @@ class Config:
     # CORS config
     CORS_ORIGINS = ['*']
     
+    # Response compression (Flask-Compress): brotli first, gzip fallback
+    COMPRESS_ALGORITHM = ['br', 'gzip']
+    COMPRESS_LEVEL = 4
+    COMPRESS_BR_LEVEL = 4
+    COMPRESS_MIN_SIZE = 500
+    # Never buffer streamed responses to compress them (SSE / streamed exports)
+    COMPRESS_STREAMS = False
+    
     @staticmethod
     def init_app(app):
         """Initialize app with configuration"""
@@ -173,13 +208,22 @@ class ProductionConfig(Config):
     SQLALCHEMY_DATABASE_URI = os.environ.get('SQLALCHEMY_DATABASE_URI', '')
     
     # Enhanced security in production
+    # Pool limits apply per gunicorn worker; keep workers * (pool_size + max_overflow) under max_connections
     SQLALCHEMY_ENGINE_OPTIONS = {
         'pool_pre_ping': True,
-        'pool_recycle': 300,
-        'pool_size': 20,
-        'max_overflow': 30
+        # pre_ping already catches dead connections; recycle only to outlive server/proxy idle limits
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 1800)),
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 20)),
+        # Reuse the most recently returned connection so surplus ones sit idle and get recycled
+        'pool_use_lifo': True,
+        # Fail fast instead of queueing requests for 30s when the pool is exhausted
+        'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', 10)),
     }
     
+    # Production serves the spec generated during the build
+    USE_PREBUILT_SPEC = os.environ.get('USE_PREBUILT_SPEC', 'true').lower() == 'true'
+    
     # Production CORS (specific origins)
     CORS_ORIGINS = os.environ.get('CORS_ORIGINS', '').split(',')
     
@@ -235,4 +279,10 @@ def get_config(config_name: str = None) -> Type[Config]:
     if config_name is None:
         config_name = os.environ.get('FLASK_ENV', 'production')
     
+    return _lookup_config(config_name)
+
+
+@lru_cache(maxsize=None)
+def _lookup_config(config_name: str) -> Type[Config]:
+    """Resolve a configuration name to its class (cached per process)"""
     return config.get(config_name, DevelopmentConfig)
@@ -0,0 +1,23 @@
+"""
+Gunicorn settings for production
+
+    gunicorn run:app
+
+Handlers are thin wrappers around one or two database round trips, so a
+worker that serves one request at a time spends most of its life waiting on
+Postgres. gthread workers run WEB_THREADS requests concurrently and overlap
+those waits. Keep WEB_THREADS at or below DB_POOL_SIZE so threads don't queue
+for connections, and WEB_CONCURRENCY * (DB_POOL_SIZE + DB_MAX_OVERFLOW) under
+the server's max_connections.
+"""
+
+import multiprocessing
+import os
+
+
+bind = f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', 5000)}"
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+worker_class = 'gthread'
+threads = int(os.environ.get('WEB_THREADS', 8))
+# Idle keep-alive connections hold a thread slot, not a whole worker
+keepalive = 5
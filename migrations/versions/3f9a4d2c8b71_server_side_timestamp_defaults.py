@@ -0,0 +1,54 @@
+"""server side timestamp defaults
+
+Revision ID: 3f9a4d2c8b71
+Revises: c6e7b1230cef
+Create Date: 2026-10-16 03:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9a4d2c8b71'
+down_revision = 'c6e7b1230cef'
+branch_labels = None
+depends_on = None
+
+
+TABLES = (
+    'camps',
+    'users',
+    'camp_workers',
+    'categories',
+    'churches',
+    'custom_fields',
+    'registration_links',
+    'registrations',
+)
+
+
+def _utcnow():
+    if op.get_context().dialect.name == 'postgresql':
+        return sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)")
+    return sa.text('CURRENT_TIMESTAMP')
+
+
+def upgrade():
+    for table in TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column('created_at', existing_type=sa.DateTime(), server_default=_utcnow())
+            batch_op.alter_column('updated_at', existing_type=sa.DateTime(), server_default=_utcnow())
+
+    with op.batch_alter_table('registrations', schema=None) as batch_op:
+        batch_op.alter_column('registration_date', existing_type=sa.DateTime(), server_default=_utcnow())
+
+
+def downgrade():
+    with op.batch_alter_table('registrations', schema=None) as batch_op:
+        batch_op.alter_column('registration_date', existing_type=sa.DateTime(), server_default=None)
+
+    for table in TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column('created_at', existing_type=sa.DateTime(), server_default=None)
+            batch_op.alter_column('updated_at', existing_type=sa.DateTime(), server_default=None)
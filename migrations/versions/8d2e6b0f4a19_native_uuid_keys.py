@@ -0,0 +1,102 @@
+"""native uuid keys
+
+Revision ID: 8d2e6b0f4a19
+Revises: 3f9a4d2c8b71
+Create Date: 2026-10-16 03:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d2e6b0f4a19'
+down_revision = '3f9a4d2c8b71'
+branch_labels = None
+depends_on = None
+
+
+TABLES = (
+    'camps',
+    'users',
+    'camp_workers',
+    'categories',
+    'churches',
+    'custom_fields',
+    'registration_links',
+    'registrations',
+)
+
+# (table, column, referenced table)
+FOREIGN_KEYS = (
+    ('camp_workers', 'camp_id', 'camps'),
+    ('camp_workers', 'user_id', 'users'),
+    ('categories', 'camp_id', 'camps'),
+    ('churches', 'camp_id', 'camps'),
+    ('custom_fields', 'camp_id', 'camps'),
+    ('registration_links', 'camp_id', 'camps'),
+    ('registration_links', 'created_by', 'users'),
+    ('registrations', 'camp_id', 'camps'),
+    ('registrations', 'category_id', 'categories'),
+    ('registrations', 'church_id', 'churches'),
+    ('registrations', 'registration_link_id', 'registration_links'),
+)
+
+
+def _columns():
+    for table in TABLES:
+        yield table, 'id'
+    for table, column, _ in FOREIGN_KEYS:
+        yield table, column
+
+
+def upgrade():
+    if op.get_context().dialect.name != 'postgresql':
+        # Non-native backends store uuids as 32 hex characters; parents are rewritten
+        # before their children, so foreign key checks wait for the commit
+        op.execute('PRAGMA defer_foreign_keys=ON')
+        for table, column in _columns():
+            op.execute(f"UPDATE {table} SET {column} = REPLACE({column}, '-', '')")
+        return
+
+    # Postgres names unnamed foreign keys <table>_<column>_fkey
+    for table, column, _ in FOREIGN_KEYS:
+        op.drop_constraint(f'{table}_{column}_fkey', table, type_='foreignkey')
+
+    for table, column in _columns():
+        op.alter_column(
+            table, column,
+            existing_type=sa.String(length=36),
+            type_=sa.Uuid(),
+            postgresql_using=f'{column}::uuid',
+        )
+
+    for table, column, referenced in FOREIGN_KEYS:
+        op.create_foreign_key(f'{table}_{column}_fkey', table, referenced, [column], ['id'])
+
+
+def downgrade():
+    if op.get_context().dialect.name != 'postgresql':
+        op.execute('PRAGMA defer_foreign_keys=ON')
+        for table, column in _columns():
+            op.execute(
+                f"UPDATE {table} SET {column} = LOWER("
+                f"SUBSTR({column}, 1, 8) || '-' || SUBSTR({column}, 9, 4) || '-' || "
+                f"SUBSTR({column}, 13, 4) || '-' || SUBSTR({column}, 17, 4) || '-' || "
+                f"SUBSTR({column}, 21, 12)) WHERE LENGTH({column}) = 32"
+            )
+        return
+
+    for table, column, _ in FOREIGN_KEYS:
+        op.drop_constraint(f'{table}_{column}_fkey', table, type_='foreignkey')
+
+    for table, column in _columns():
+        op.alter_column(
+            table, column,
+            existing_type=sa.Uuid(),
+            type_=sa.String(length=36),
+            postgresql_using=f'{column}::text',
+        )
+
+    for table, column, referenced in FOREIGN_KEYS:
+        op.create_foreign_key(f'{table}_{column}_fkey', table, referenced, [column], ['id'])
@@ -0,0 +1,68 @@
+"""camp delete cascade
+
+Revision ID: d41a6f2b9e58
+Revises: b8f3d5a1c027
+Create Date: 2026-10-16 05:50:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd41a6f2b9e58'
+down_revision = 'b8f3d5a1c027'
+branch_labels = None
+depends_on = None
+
+
+# Tables whose camp_id follows the camp on delete
+TABLES = (
+    'camp_workers',
+    'categories',
+    'churches',
+    'custom_fields',
+    'registration_links',
+    'registrations',
+)
+
+
+# SQLite leaves these foreign keys unnamed; batch mode needs a name to drop them by
+SQLITE_NAMING_CONVENTION = {
+    'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s',
+}
+
+
+def _recreate_camp_fks(ondelete):
+    # Postgres names unnamed foreign keys <table>_<column>_fkey
+    for table in TABLES:
+        op.drop_constraint(f'{table}_camp_id_fkey', table, type_='foreignkey')
+        op.create_foreign_key(
+            f'{table}_camp_id_fkey', table, 'camps', ['camp_id'], ['id'], ondelete=ondelete
+        )
+
+
+def _rebuild_camp_fks(ondelete):
+    # SQLite can't alter constraints in place, so each table is copied into a new one
+    for table in TABLES:
+        with op.batch_alter_table(
+            table, recreate='always', naming_convention=SQLITE_NAMING_CONVENTION
+        ) as batch_op:
+            batch_op.drop_constraint(f'fk_{table}_camp_id_camps', type_='foreignkey')
+            batch_op.create_foreign_key(
+                f'fk_{table}_camp_id_camps', 'camps', ['camp_id'], ['id'], ondelete=ondelete
+            )
+
+
+def upgrade():
+    if op.get_context().dialect.name != 'postgresql':
+        _rebuild_camp_fks('CASCADE')
+        return
+    _recreate_camp_fks('CASCADE')
+
+
+def downgrade():
+    if op.get_context().dialect.name != 'postgresql':
+        _rebuild_camp_fks(None)
+        return
+    _recreate_camp_fks(None)
@@ -14,7 +14,7 @@ import uuid
 from app import create_app
 from app.extensions import db
 from app.user.models import User
-from app.camp.models import Camp, Church, Category, CustomField, RegistrationLink, Registration
+from app.camp.models import Camp, CampWorker, Church, Category, CustomField, RegistrationLink, Registration
 
 
 @pytest.fixture(scope='session')
@@ -53,6 +53,21 @@ def app():
     os.unlink(db_path)
 
 
+@pytest.fixture
+def migrated_app(tmp_path, monkeypatch):
+    """Create an application whose schema is built by the Alembic migrations"""
+    from flask_migrate import upgrade
+    from config import TestingConfig
+
+    monkeypatch.setattr(TestingConfig, 'SQLALCHEMY_DATABASE_URI', f"sqlite:///{tmp_path / 'migrated.db'}")
+    app = create_app('testing')
+
+    with app.app_context():
+        upgrade()
+        yield app
+        db.session.remove()
+
+
 @pytest.fixture
 def client(app):
     """Create test client"""
@@ -158,7 +173,7 @@ def sample_camp_data():
 
 @pytest.fixture
 def sample_camp(db_session, sample_user, sample_camp_data):
-    """Create a sample camp for testing"""
+    """Create a sample camp managed by sample_user for testing"""
     camp = Camp(
         name=sample_camp_data['name'],
         start_date=sample_camp_data['start_date'],
@@ -167,11 +182,12 @@ def sample_camp(db_session, sample_user, sample_camp_data):
         base_fee=sample_camp_data['base_fee'],
         capacity=sample_camp_data['capacity'],
         description=sample_camp_data['description'],
-        registration_deadline=sample_camp_data['registration_deadline'],
-        camp_manager_id=sample_user.id
+        registration_deadline=sample_camp_data['registration_deadline']
     )
     db.session.add(camp)
     db.session.commit()
+    db.session.add(CampWorker(user_id=sample_user.id, camp_id=camp.id, role='camp_manager'))
+    db.session.commit()
     return camp
 
 
@@ -445,8 +461,8 @@ def create_test_user(db_session, email="test@example.com", role="camp_manager"):
     return user
 
 
-def create_test_camp(db_session, user, name="Test Camp"):
-    """Helper function to create a test camp"""
+def create_test_camp(db_session, user=None, name="Test Camp"):
+    """Helper function to create a test camp, managed by user when one is given"""
     camp = Camp(
         name=name,
         start_date=datetime.now(timezone.utc).date() + timedelta(days=30),
@@ -455,14 +471,35 @@ def create_test_camp(db_session, user, name="Test Camp"):
         base_fee=Decimal('100.00'),
         capacity=100,
         description="Test camp description",
-        registration_deadline=datetime.now(timezone.utc) + timedelta(days=20),
-        camp_manager_id=user.id
+        registration_deadline=datetime.now(timezone.utc) + timedelta(days=20)
     )
     db.session.add(camp)
     db.session.commit()
+    if user is not None:
+        db.session.add(CampWorker(user_id=user.id, camp_id=camp.id, role='camp_manager'))
+        db.session.commit()
     return camp
 
 
+def create_test_registration(db_session, camp, church, category, surname="Doe"):
+    """Helper function to create a test registration"""
+    registration = Registration(
+        surname=surname,
+        last_name="Jane",
+        age=20,
+        phone_number="+1234567890",
+        emergency_contact_name="John Doe",
+        emergency_contact_phone="+1234567891",
+        total_amount=Decimal('100.00'),
+        camp_id=camp.id,
+        church_id=church.id,
+        category_id=category.id
+    )
+    db.session.add(registration)
+    db.session.commit()
+    return registration
+
+
 def get_auth_token(client, email="test@example.com", password="testpassword123"):
     """Helper function to get authentication token"""
     response = client.post('/auth/login', json={
@@ -98,6 +98,7 @@ class TestBasicRoutes:
         assert data['data']['status'] == 'healthy'
         assert 'timestamp' in data['data']
         assert 'version' in data['data']
+        assert 'migration' in data['data']
         
         # Verify timestamp format
         timestamp = data['data']['timestamp']
@@ -105,6 +106,33 @@ class TestBasicRoutes:
         # Should be valid ISO format
         datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
     
+    def test_health_check_reports_failed_migration(self, client, monkeypatch):
+        """Test health check returns 503 when startup migrations failed"""
+        from app import MIGRATION_STATUS
+        monkeypatch.setitem(MIGRATION_STATUS, 'state', 'failed')
+        
+        response = client.get('/health')
+        
+        assert response.status_code == 503
+        data = response.get_json()
+        assert data['data']['status'] == 'unhealthy'
+        assert data['data']['migration'] == 'failed'
+    
+    def test_sync_migration_failure_is_raised(self, app, monkeypatch):
+        """Test that a failed blocking startup migration stops startup"""
+        import app as app_module
+
+        def failing_upgrade(app):
+            raise RuntimeError('boom')
+
+        monkeypatch.setattr(app_module, '_maybe_upgrade', failing_upgrade)
+        monkeypatch.setitem(app_module.MIGRATION_STATUS, 'state', 'pending')
+        monkeypatch.setitem(app_module.MIGRATION_STATUS, 'error', None)
+        
+        with pytest.raises(RuntimeError):
+            app_module._run_migrations(app, blocking=True)
+        assert app_module.MIGRATION_STATUS['state'] == 'failed'
+    
     def test_api_info_endpoint(self, client):
         """Test API info endpoint"""
         response = client.get('/')
@@ -175,6 +203,30 @@ class TestApplicationMiddleware:
         # Check API version header
         assert 'X-API-Version' in response.headers
     
+    def test_security_headers_not_duplicated(self):
+        """Test that headers already on the response are not added a second time"""
+        from types import SimpleNamespace
+        from app._shared.auth import SecurityHeadersMiddleware
+        
+        def wsgi_app(environ, start_response):
+            start_response('200 OK', [
+                ('access-control-allow-origin', 'https://example.com'),
+                ('X-Frame-Options', 'SAMEORIGIN'),
+            ])
+            return [b'']
+        
+        sent = {}
+        def start_response(status, headers, exc_info=None):
+            sent['headers'] = headers
+        
+        middleware = SecurityHeadersMiddleware(wsgi_app, SimpleNamespace(debug=True))
+        middleware({}, start_response)
+        
+        names = [name.lower() for name, _ in sent['headers']]
+        assert len(names) == len(set(names))
+        assert ('X-Frame-Options', 'SAMEORIGIN') in sent['headers']
+        assert ('X-Content-Type-Options', 'nosniff') in sent['headers']
+    
     def test_cors_headers(self, client):
         """Test CORS headers are present"""
         response = client.options('/health')
@@ -350,6 +402,15 @@ class TestApplicationExtensions:
         assert 'migrate' in app.extensions
         # The migrate extension stores a config object, not the migrate instance itself
         assert hasattr(app.extensions['migrate'], 'db')
+    
+    def test_orjson_provider(self, app):
+        """Test orjson provider keeps Flask's JSON output format"""
+        from decimal import Decimal
+        from app._shared.json_provider import OrjsonProvider
+        
+        assert isinstance(app.json, OrjsonProvider)
+        body = app.json.dumps({'b': Decimal('1.50'), 'a': datetime(2024, 1, 2, 3, 4, 5)})
+        assert body == '{"a":"Tue, 02 Jan 2024 03:04:05 GMT","b":"1.50"}'
 
 
 @pytest.mark.integration
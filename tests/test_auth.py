@@ -515,6 +515,17 @@ class TestRoleBasedAccess:
         data = response.get_json()
         assert data['data']['role'] == 'volunteer'
 
+    def test_role_change_evicts_cached_user(self, client, db_session, auth_headers, sample_user):
+        """Test that a role change takes effect despite the user cache"""
+        response = client.get('/camps', headers=auth_headers)
+        assert response.status_code == 200
+
+        sample_user.role = 'volunteer'
+        db_session.commit()
+
+        response = client.get('/camps', headers=auth_headers)
+        assert response.status_code == 403
+
 
 @pytest.mark.auth
 class TestAuthenticationEdgeCases:
@@ -12,7 +12,9 @@ from datetime import datetime, timezone, timedelta
 from decimal import Decimal
 
 from app.user.models import User
-from app.camp.models import Camp, Church, Category, Registration
+from app.camp.models import Camp, CampWorker, Church, Category, Registration
+
+from .conftest import create_test_camp, create_test_registration, create_test_user
 
 
 @pytest.mark.integration
@@ -127,6 +129,71 @@ class TestCampManagementWorkflow:
         # Should not return 404 (route exists) but may return other status
         assert response.status_code != 404
     
+    def test_camp_list_conditional_get(self, client, auth_headers, db_session):
+        """Test that an unchanged camp list revalidates to 304"""
+        response = client.get('/camps', headers=auth_headers)
+        assert response.status_code == 200
+        etag = response.headers['ETag']
+        
+        response = client.get('/camps', headers={**auth_headers, 'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.get_data() == b''
+    
+    def test_camp_delete_cascades(self, sample_registration, db_session):
+        """Test that deleting a camp removes its workers, churches and registrations"""
+        from app.camp.services import CampService
+
+        camp_id = sample_registration.camp_id
+        db_session.expunge_all()
+
+        assert CampService().delete_camp(camp_id) is True
+
+        for model in (CampWorker, Church, Category, Registration):
+            assert db_session.query(model).filter_by(camp_id=camp_id).count() == 0
+
+    def test_camp_delete_cascades_on_migrated_schema(self, migrated_app):
+        """Test that deleting a camp cascades on a database built by the migrations"""
+        from app.extensions import db
+        from app.camp.services import CampService
+
+        user = create_test_user(db.session, email='migrated@example.com')
+        camp = create_test_camp(db.session, user)
+        church = Church(name='Migrated Church', camp_id=camp.id)
+        category = Category(name='Migrated Category', camp_id=camp.id)
+        db.session.add_all([church, category])
+        db.session.commit()
+        create_test_registration(db.session, camp, church, category)
+        camp_id = camp.id
+        db.session.expunge_all()
+
+        assert CampService().delete_camp(camp_id) is True
+
+        for model in (CampWorker, Church, Category, Registration):
+            assert db.session.query(model).filter_by(camp_id=camp_id).count() == 0
+
+    def test_camp_conditional_get_by_date(self, client, auth_headers, sample_camp):
+        """Test that a camp revalidated with If-Modified-Since returns 304"""
+        response = client.get(f'/camps/{sample_camp.id}', headers=auth_headers)
+        assert response.status_code == 200
+        last_modified = response.headers['Last-Modified']
+
+        response = client.get(f'/camps/{sample_camp.id}', headers={**auth_headers, 'If-Modified-Since': last_modified})
+        assert response.status_code == 304
+        assert response.get_data() == b''
+    
+    def test_camp_access_follows_worker_changes(self, client, auth_headers, sample_user, sample_camp, db_session):
+        """Test that the cached camp membership is dropped when a worker is removed"""
+        response = client.get(f'/camps/{sample_camp.id}/churches', headers=auth_headers)
+        assert response.status_code == 200
+
+        worker = db_session.query(CampWorker).filter_by(camp_id=sample_camp.id, user_id=sample_user.id).one()
+        db_session.delete(worker)
+        db_session.commit()
+
+        response = client.get(f'/camps/{sample_camp.id}/churches', headers=auth_headers)
+        assert response.status_code == 403
+        assert response.get_json()['data']['code'] == 'AUTHORIZATION_ERROR'
+
     def test_unauthorized_camp_access(self, client):
         """Test that camp routes require authentication"""
         response = client.get('/camps')
@@ -134,6 +201,78 @@ class TestCampManagementWorkflow:
         # Should require authentication
         assert response.status_code == 401
 
+    def test_church_access_requires_camp_worker(self, client, auth_headers, db_session):
+        """Test that only the camp's workers can change its churches"""
+        camp = create_test_camp(db_session, name='Other Camp')
+        church = Church(name='Other Church', camp_id=camp.id)
+        db_session.add(church)
+        db_session.commit()
+
+        response = client.put(f'/camps/churches/{church.id}', json={'data': {'name': 'Renamed'}}, headers=auth_headers)
+        assert response.status_code == 403
+        assert response.get_json()['data']['code'] == 'AUTHORIZATION_ERROR'
+
+        response = client.delete('/camps/churches/00000000-0000-0000-0000-000000000000', headers=auth_headers)
+        assert response.status_code == 404
+
+    def test_resource_deleted_elsewhere_returns_not_found(self, client, auth_headers, sample_registration, db_session):
+        """Test that a cached access check doesn't hide a row deleted by another worker"""
+        response = client.get(f'/camps/registrations/{sample_registration.id}', headers=auth_headers)
+        assert response.status_code == 200
+
+        # A bulk delete fires no ORM events, like a delete in another process
+        db_session.query(Registration).filter_by(id=sample_registration.id).delete()
+        db_session.commit()
+
+        response = client.get(f'/camps/registrations/{sample_registration.id}', headers=auth_headers)
+        assert response.status_code == 404
+        assert response.get_json()['data']['code'] == 'REGISTRATION_NOT_FOUND'
+
+    def test_delete_category_returns_no_content(self, client, auth_headers, sample_camp, db_session):
+        """Test that deleting a category returns 204 with an empty body"""
+        category = Category(name='Unused', camp_id=sample_camp.id)
+        db_session.add(category)
+        db_session.commit()
+
+        response = client.delete(f'/camps/categories/{category.id}', headers=auth_headers)
+        assert response.status_code == 204
+        assert response.get_data() == b''
+        assert db_session.get(Category, category.id) is None
+
+    def test_camp_stats_follow_registration_changes(self, sample_registration, db_session):
+        """Test that cached camp stats are refreshed when a registration changes"""
+        from app.camp.services import CampService
+
+        camp_service = CampService()
+        camp_id = sample_registration.camp_id
+
+        assert camp_service.get_camp_stats(camp_id)['paid_registrations'] == 0
+
+        sample_registration.has_paid = True
+        db_session.commit()
+
+        stats = camp_service.get_camp_stats(camp_id)
+        assert stats['paid_registrations'] == 1
+        assert stats['total_revenue'] == 100.0
+
+    def test_registrations_stream_as_ndjson(self, client, auth_headers, sample_camp, sample_church, sample_category, db_session):
+        """Test that registrations are streamed one per line when NDJSON is requested"""
+        camp = sample_camp
+        for surname in ('Doe', 'Roe'):
+            create_test_registration(db_session, camp, sample_church, sample_category, surname=surname)
+
+        response = client.get(f'/camps/{camp.id}/registrations', headers=auth_headers)
+        expected = response.get_json()['data']
+
+        response = client.get(
+            f'/camps/{camp.id}/registrations', headers={**auth_headers, 'Accept': 'application/x-ndjson'}
+        )
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        lines = response.get_data().splitlines()
+        assert [json.loads(line) for line in lines] == expected
+        assert len(lines) == 2
+
 
 @pytest.mark.integration
 class TestRegistrationWorkflow:
@@ -148,6 +287,59 @@ class TestRegistrationWorkflow:
         # Should not return 404 (route exists)
         assert response.status_code != 404
 
+    def test_general_registration_form_follows_category_changes(self, client, db_session):
+        """Test that the cached general form picks up a new category"""
+        camp = create_test_camp(db_session, name='Form Camp')
+
+        response = client.get(f'/camps/{camp.id}/register')
+        assert response.status_code == 200
+        assert response.get_json()['data']['categories'] == []
+
+        db_session.add(Category(name='Youth', camp_id=camp.id))
+        db_session.commit()
+
+        response = client.get(f'/camps/{camp.id}/register')
+        data = response.get_json()['data']
+        assert data['link_type'] == 'general'
+        assert [category['name'] for category in data['categories']] == ['Youth']
+
+        etag = response.headers['ETag']
+        response = client.get(f'/camps/{camp.id}/register', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.headers['ETag'] == etag
+
+    def test_categories_conditional_get(self, client, auth_headers, sample_camp, db_session):
+        """Test that the categories list revalidates with If-None-Match until a category changes"""
+        camp = sample_camp
+        category = Category(name='Youth', camp_id=camp.id)
+        db_session.add(category)
+        db_session.commit()
+
+        response = client.get(f'/camps/{camp.id}/categories', headers=auth_headers)
+        assert response.status_code == 200
+        assert [c['name'] for c in response.get_json()['data']] == ['Youth']
+        etag = response.headers['ETag']
+
+        response = client.get(f'/camps/{camp.id}/categories', headers={**auth_headers, 'If-None-Match': etag})
+        assert response.status_code == 304
+
+        category.name = 'Adults'
+        db_session.commit()
+
+        response = client.get(f'/camps/{camp.id}/categories', headers={**auth_headers, 'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+        assert [c['name'] for c in response.get_json()['data']] == ['Adults']
+
+    def test_unknown_registration_link_error_body(self, client, db_session):
+        """Test that an unknown link token returns the error payload"""
+        for url in ('/register/unknown_token', '/register/check/unknown_token'):
+            response = client.get(url)
+
+            assert response.status_code == 404
+            data = response.get_json()
+            assert data['data']['code'] == 'INVALID_LINK'
+
 
 @pytest.mark.integration
 class TestDatabaseTransactions: